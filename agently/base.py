@@ -14,7 +14,7 @@
 
 from typing import Any, Literal, Type, TYPE_CHECKING, TypeVar, Generic, cast
 
-from agently.utils import Settings, create_logger, FunctionShifter
+from agently.utils import Settings, create_logger, FunctionShifter, HTTPClientPool
 from agently.core import PluginManager, EventCenter, Tool, Prompt, ModelRequest, BaseAgent
 from agently._default_init import _load_default_settings, _load_default_plugins, _hook_default_event_handlers
 
@@ -38,6 +38,7 @@ async_system_message = event_center.async_system_message
 system_message = event_center.system_message
 logger = create_logger()
 tool = Tool(plugin_manager, settings)
+http_client_pool = HTTPClientPool()
 _agently_messenger = event_center.create_messenger("Agently")
 
 
@@ -115,7 +116,21 @@ class AgentlyMain(Generic[A]):
         self.async_print = async_print
         self.set_debug_console("OFF")
         self.tool = tool
+        self.http_client_pool = http_client_pool
         self.AgentType = AgentType
+        self.close = FunctionShifter.syncify(self.async_close)
+
+    async def async_close(self):
+        """
+        Close the shared keep-alive HTTP clients of the running event loop.
+        """
+        await self.http_client_pool.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.async_close()
 
     def set_debug_console(self, debug_console_status: Literal["ON", "OFF"]):
         match debug_console_status:
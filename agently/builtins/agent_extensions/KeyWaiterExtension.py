@@ -46,9 +46,9 @@ class KeyWaiterExtension(BaseAgent):
                     f"Error: Cannot wait key/keys { no_found_keys } because they were not in 'output' prompt\nPrompt: { self.request.prompt }"
                 )
 
-    def __get_consumer(self):
+    def __get_consumer(self, keys: list[str]):
         response = self.get_response()
-        return GeneratorConsumer(response.get_async_generator(content="instant"))
+        return GeneratorConsumer(response.get_async_generator(content="instant", paths=keys))
 
     async def async_get_key_result(
         self,
@@ -60,7 +60,7 @@ class KeyWaiterExtension(BaseAgent):
             [key],
             must_in_prompt=must_in_prompt,
         )
-        consumer = self.__get_consumer()
+        consumer = self.__get_consumer([key])
 
         async for data in consumer.get_async_generator():
             if key == data.path and data.is_complete:
@@ -76,7 +76,7 @@ class KeyWaiterExtension(BaseAgent):
             keys,
             must_in_prompt=must_in_prompt,
         )
-        consumer = self.__get_consumer()
+        consumer = self.__get_consumer(keys)
 
         async for data in consumer.get_async_generator():
             if data.path in keys and data.is_complete:
@@ -92,7 +92,7 @@ class KeyWaiterExtension(BaseAgent):
             keys,
             must_in_prompt=must_in_prompt,
         )
-        consumer = self.__get_consumer()
+        consumer = self.__get_consumer(keys)
 
         for data in consumer.get_generator():
             if data.path in keys and data.is_complete:
@@ -114,7 +114,7 @@ class KeyWaiterExtension(BaseAgent):
             handler_keys,
             must_in_prompt=must_in_prompt,
         )
-        consumer = self.__get_consumer()
+        consumer = self.__get_consumer(handler_keys)
         tasks = []
 
         async def handler_wrapper(path: str, value: Any, handler: Callable[[Any], Any]) -> Any:
@@ -139,7 +139,7 @@ class KeyWaiterExtension(BaseAgent):
             handler_keys,
             must_in_prompt=must_in_prompt,
         )
-        consumer = self.__get_consumer()
+        consumer = self.__get_consumer(handler_keys)
         results = []
 
         for data in consumer.get_generator():
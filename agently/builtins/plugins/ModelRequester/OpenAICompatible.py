@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import time
 import yaml
 import json
+import asyncio
+import contextlib
 from typing import (
     Any,
     Literal,
@@ -24,9 +27,8 @@ from typing import (
 )
 from typing_extensions import TypedDict
 
-from httpx import AsyncClient, ReadError, HTTPStatusError, RequestError, Timeout
-from httpx_sse import aconnect_sse, SSEError
-from stamina import retry
+from httpx import AsyncClient, Limits, HTTPStatusError, RequestError, Response, Timeout, TransportError
+from httpx_sse import ServerSentEvent, SSEError
 
 from agently.types.plugins import ModelRequester
 from agently.types.data import AgentlyRequestData, SerializableValue
@@ -34,7 +36,15 @@ from agently.utils import (
     SettingsNamespace,
     DataFormatter,
     DataLocator,
+    JSONLoader,
+    LazyImport,
+    RetryPolicy,
+    RateLimiter,
+    Bulkhead,
+    HedgePolicy,
+    SSEByteDecoder,
 )
+from agently.utils.DataLocator import CompiledPath
 
 if TYPE_CHECKING:
     from agently.core.Prompt import Prompt
@@ -53,12 +63,67 @@ class ContentMapping(TypedDict):
     extra_done: dict[str, str] | None
 
 
+class CompiledContentMapping(TypedDict):
+    id: CompiledPath | None
+    role: CompiledPath | None
+    chunk_prefix: CompiledPath
+    delta: CompiledPath | None
+    extra_delta: dict[str, CompiledPath]
+    done: CompiledPath | None
+    usage: CompiledPath | None
+    finish_reason: CompiledPath | None
+    extra_done: dict[str, CompiledPath]
+
+
 class ModelSettingsMapping(TypedDict):
     chat: str
     completions: str
     embeddings: str
 
 
+class ConnectionPoolSettings(TypedDict, total=False):
+    enabled: bool
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    keepalive_expiry: float | None
+
+
+class RetrySettings(TypedDict, total=False):
+    max_attempts: int
+    initial_delay: float
+    max_delay: float
+    multiplier: float
+    jitter: bool
+    deadline: float | None
+    status_codes: list[int]
+    on_connect_error: bool
+    on_read_error: bool
+
+
+class RateLimitSettings(TypedDict, total=False):
+    requests_per_minute: float | None
+    tokens_per_minute: float | None
+    chars_per_token: float
+
+
+class ConcurrencySettings(TypedDict, total=False):
+    max_in_flight: int | None
+    queue_timeout: float | None
+    reserved_slots: int
+
+
+class HedgingSettings(TypedDict, total=False):
+    enabled: bool
+    delay: float | None
+    percentile: float
+    initial_delay: float
+    min_delay: float
+    max_delay: float
+    max_hedge_ratio: float
+    burst: float
+    base_url: str | None
+
+
 class ModelRequesterSettings(TypedDict, total=False):
     model: str
     model_type: Literal["chat", "completions", "embeddings"]
@@ -75,11 +140,22 @@ class ModelRequesterSettings(TypedDict, total=False):
     strict_role_orders: bool
     content_mapping: ContentMapping
     content_mapping_style: Literal["dot", "slash"]
+    connection_pool: ConnectionPoolSettings
+    connection_close: bool
+    http2: bool
+    retry: RetrySettings
+    rate_limit: RateLimitSettings
+    concurrency: ConcurrencySettings
+    priority: int
+    hedging: HedgingSettings
 
 
 class OpenAICompatible(ModelRequester):
     name = "OpenAICompatible"
 
+    # Compiled content mappings shared by requesters with the same mapping settings
+    _compiled_content_mappings: dict[str, CompiledContentMapping] = {}
+
     DEFAULT_SETTINGS = {
         "$mappings": {
             "path_mappings": {
@@ -130,6 +206,47 @@ class OpenAICompatible(ModelRequester):
             "write": 30.0,
             "pool": 30.0,
         },
+        "connection_pool": {
+            "enabled": True,
+            "max_connections": 100,
+            "max_keepalive_connections": 20,
+            "keepalive_expiry": 30.0,
+        },
+        "connection_close": False,
+        "http2": False,
+        "retry": {
+            "max_attempts": 3,
+            "initial_delay": 0.5,
+            "max_delay": 8.0,
+            "multiplier": 2.0,
+            "jitter": True,
+            "deadline": 120.0,
+            "status_codes": [429, 500, 502, 503, 504],
+            "on_connect_error": True,
+            "on_read_error": True,
+        },
+        "rate_limit": {
+            "requests_per_minute": None,
+            "tokens_per_minute": None,
+            "chars_per_token": 4,
+        },
+        "concurrency": {
+            "max_in_flight": None,
+            "queue_timeout": None,
+            "reserved_slots": 1,
+        },
+        "priority": 0,
+        "hedging": {
+            "enabled": False,
+            "delay": None,
+            "percentile": 0.95,
+            "initial_delay": 2.0,
+            "min_delay": 0.05,
+            "max_delay": 30.0,
+            "max_hedge_ratio": 0.1,
+            "burst": 3,
+            "base_url": None,
+        },
     }
 
     def __init__(
@@ -144,6 +261,9 @@ class OpenAICompatible(ModelRequester):
         self.plugin_settings = SettingsNamespace(self.settings, f"plugins.ModelRequester.{ self.name }")
         self.model_type = cast(str, self.plugin_settings.get("model_type"))
         self._messenger = event_center.create_messenger(self.name)
+        self._rate_limiter: RateLimiter | None = None
+        self._rate_limit_estimate = 0
+        self._compiled_content_mapping: tuple[str, CompiledContentMapping] | None = None
 
     @staticmethod
     def _on_register():
@@ -220,7 +340,8 @@ class OpenAICompatible(ModelRequester):
             value_format="str",
             default_value={},
         )
-        headers.update({"Connection": "close"})
+        if self.plugin_settings.get("connection_close", False):
+            headers.update({"Connection": "close"})
         ## set
         agently_request_dict["headers"] = headers
 
@@ -245,6 +366,22 @@ class OpenAICompatible(ModelRequester):
         )
         timeout = Timeout(**timeout_configs)
         client_options.update({"timeout": timeout})
+        ## http2: concurrent streams to the same host are multiplexed over one pooled connection
+        if self.plugin_settings.get("http2", False):
+            LazyImport.import_package("h2", install_name="httpx[http2]")
+            client_options.update({"http2": True})
+        ## connection pool limits
+        if "limits" not in client_options:
+            pool_configs = DataFormatter.to_str_key_dict(self.plugin_settings.get("connection_pool"), default_value={})
+            client_options.update(
+                {
+                    "limits": Limits(
+                        max_connections=pool_configs.get("max_connections", 100),
+                        max_keepalive_connections=pool_configs.get("max_keepalive_connections", 20),
+                        keepalive_expiry=pool_configs.get("keepalive_expiry", 30.0),
+                    )
+                }
+            )
         ## set
         agently_request_dict["client_options"] = client_options
 
@@ -308,6 +445,34 @@ class OpenAICompatible(ModelRequester):
 
         return AgentlyRequestData(**agently_request_dict)
 
+    def _get_retry_policy(self) -> RetryPolicy:
+        return RetryPolicy.from_settings(
+            DataFormatter.to_str_key_dict(self.plugin_settings.get("retry"), default_value={}),
+        )
+
+    async def _emit_attempt_metric(
+        self,
+        url: str,
+        attempt: int,
+        outcome: Literal["success", "retry", "failed"],
+        started: float,
+        *,
+        reason: str | None = None,
+        delay: float | None = None,
+    ):
+        await self._messenger.async_to_data(
+            {
+                "url": url,
+                "attempt": attempt,
+                "outcome": outcome,
+                "reason": reason,
+                "delay": delay,
+                "elapsed": time.monotonic() - started,
+            },
+            status=outcome.upper(),
+            meta={"metric": "model_request_attempt"},
+        )
+
     async def _aiter_sse_with_retry(
         self,
         client: AsyncClient,
@@ -316,31 +481,361 @@ class OpenAICompatible(ModelRequester):
         *,
         headers: dict[str, Any],
         json: "SerializableValue",
-    ):
+        retry_policy: RetryPolicy,
+    ) -> AsyncGenerator[ServerSentEvent | Response, None]:
+        """
+        Yield server-sent events of the request, retrying it by the retry policy.
+
+        Retryable status codes are retried before any event is read. Connect / read errors are retried while
+        the stream can be resumed: no event has been yielded yet, or the server sent event ids and the request
+        is retried with `Last-Event-ID`.
+
+        Yields:
+            ServerSentEvent | Response: The events, or the read response if it is not an event stream.
+
+        Raises:
+            HTTPStatusError: If the last attempt failed with a status code >= 400.
+            TransportError: If the last attempt failed with a connect / read error.
+        """
         last_event_id = ""
         reconnection_delay = 0.0
-
-        @retry(on=ReadError)
-        async def _aiter_sse():
-            nonlocal last_event_id, reconnection_delay
-            time.sleep(reconnection_delay)
-            headers.update({"Accept": "text/event-stream"})
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            request_headers = {**headers, "Accept": "text/event-stream"}
             if last_event_id:
-                headers.update({"Last-Event-ID": last_event_id})
-
-            async with aconnect_sse(client, method, url, headers=headers, json=json) as event_source:
-                try:
-                    async for sse in event_source.aiter_sse():
-                        last_event_id = sse.id
-                        if sse.retry is not None:
-                            reconnection_delay = sse.retry / 1000
+                request_headers.update({"Last-Event-ID": last_event_id})
+            has_yielded = False
+            try:
+                async with client.stream(method, url, headers=request_headers, json=json) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        reason = f"HTTP { response.status_code }"
+                        delay = (
+                            retry_policy.get_delay(
+                                attempt,
+                                started,
+                                retry_after=response.headers.get("Retry-After"),
+                                min_delay=reconnection_delay,
+                            )
+                            if retry_policy.is_retryable_status(response.status_code)
+                            else None
+                        )
+                        if delay is None:
+                            await self._emit_attempt_metric(url, attempt, "failed", started, reason=reason)
+                            response.raise_for_status()
+                        await self._emit_attempt_metric(url, attempt, "retry", started, reason=reason, delay=delay)
+                        await asyncio.sleep(cast(float, delay))
+                        continue
+                    if "text/event-stream" not in response.headers.get("Content-Type", ""):
+                        await response.aread()
+                        await self._emit_attempt_metric(url, attempt, "success", started)
+                        yield response
+                        return
+                    decoder = SSEByteDecoder()
+                    async for chunk in response.aiter_bytes():
+                        for sse in decoder.feed(chunk):
+                            has_yielded = True
+                            if sse.id:
+                                last_event_id = sse.id
+                            if sse.retry is not None:
+                                reconnection_delay = sse.retry / 1000
+                            yield sse
+                    for sse in decoder.flush():
                         yield sse
-                except GeneratorExit:
-                    pass
+                await self._emit_attempt_metric(url, attempt, "success", started)
+                return
+            except TransportError as e:
+                reason = type(e).__name__
+                can_resume = not has_yielded or bool(last_event_id)
+                delay = (
+                    retry_policy.get_delay(attempt, started, min_delay=reconnection_delay)
+                    if can_resume and retry_policy.is_retryable_error(e)
+                    else None
+                )
+                if delay is None:
+                    await self._emit_attempt_metric(url, attempt, "failed", started, reason=reason)
+                    raise
+                await self._emit_attempt_metric(url, attempt, "retry", started, reason=reason, delay=delay)
+                await asyncio.sleep(delay)
+
+    def _get_hedging(self, request_url: str) -> tuple[HedgePolicy, str] | None:
+        hedging_configs = DataFormatter.to_str_key_dict(self.plugin_settings.get("hedging"), default_value={})
+        if not hedging_configs.pop("enabled", False):
+            return None
+        hedge_url = request_url
+        hedge_base_url = hedging_configs.pop("base_url", None)
+        base_url = str(self.plugin_settings.get("base_url")).rstrip("/")
+        if hedge_base_url and request_url.startswith(base_url):
+            hedge_url = f"{ str(hedge_base_url).rstrip('/') }{ request_url[len(base_url):] }"
+        hedge_policy = HedgePolicy.get_shared(
+            (request_url, str(self.plugin_settings.get("model"))),
+            **hedging_configs,
+        )
+        return hedge_policy, hedge_url
+
+    async def _aiter_sse_hedged(
+        self,
+        client: AsyncClient,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, Any],
+        json: "SerializableValue",
+        retry_policy: RetryPolicy,
+        hedge_policy: HedgePolicy,
+        hedge_url: str,
+    ) -> AsyncGenerator[ServerSentEvent | Response, None]:
+        """
+        Yield server-sent events of the request, hedged by a duplicate request if the first event is late.
+
+        If no event arrives within the hedge delay and the hedge budget allows it, the same request is sent to
+        `hedge_url`. Whichever stream yields its first event first is streamed, the other one is cancelled and
+        its HTTP stream closed. If one stream fails before its first event, the other one is awaited.
+
+        Yields:
+            ServerSentEvent | Response: The events of the winning stream, see _aiter_sse_with_retry().
+        """
+        hedge_policy.record_request()
+        started = time.monotonic()
+        delay = hedge_policy.get_delay()
+        streams = [
+            self._aiter_sse_with_retry(client, method, url, headers=headers, json=json, retry_policy=retry_policy)
+        ]
+        pending: dict[asyncio.Future, int] = {asyncio.ensure_future(streams[0].__anext__()): 0}
+        winner: int | None = None
+        first: ServerSentEvent | Response | None = None
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                if hedge_policy.try_hedge():
+                    streams.append(
+                        self._aiter_sse_with_retry(
+                            client, method, hedge_url, headers=headers, json=json, retry_policy=retry_policy
+                        )
+                    )
+                    pending[asyncio.ensure_future(streams[1].__anext__())] = 1
+                    await self._emit_hedge_metric(url, hedge_url, "hedged", started, delay)
+                else:
+                    await self._emit_hedge_metric(url, hedge_url, "suppressed", started, delay)
+            while winner is None:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    error = task.exception()
+                    if error is None or isinstance(error, StopAsyncIteration):
+                        winner = index
+                        first = task.result() if error is None else None
+                        break
+                    if not pending:
+                        raise error
+        finally:
+            # Cancel the loser, closing its generator closes its HTTP stream
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for index, stream in enumerate(streams):
+                if index != winner:
+                    with contextlib.suppress(Exception):
+                        await stream.aclose()
+        hedge_policy.record_latency(time.monotonic() - started)
+        if len(streams) > 1:
+            if winner == 1:
+                hedge_policy.record_hedge_win()
+            await self._emit_hedge_metric(url, hedge_url, "hedge_won" if winner == 1 else "primary_won", started, delay)
+        if first is None:
+            return
+        yield first
+        async for sse in streams[winner]:
+            yield sse
 
-        return _aiter_sse()
+    async def _emit_hedge_metric(
+        self,
+        url: str,
+        hedge_url: str,
+        outcome: Literal["hedged", "suppressed", "primary_won", "hedge_won"],
+        started: float,
+        delay: float,
+    ):
+        await self._messenger.async_to_data(
+            {
+                "url": url,
+                "hedge_url": hedge_url,
+                "delay": delay,
+                "elapsed": time.monotonic() - started,
+            },
+            status=outcome.upper(),
+            meta={"metric": "model_request_hedge"},
+        )
+
+    async def _post_with_retry(
+        self,
+        client: AsyncClient,
+        url: str,
+        *,
+        headers: dict[str, Any],
+        json: "SerializableValue",
+        retry_policy: RetryPolicy,
+    ) -> Response:
+        """
+        Send a non-streaming request, retrying it by the retry policy.
+
+        Returns:
+            Response: The response of the last attempt, its status code may be >= 400.
+
+        Raises:
+            TransportError: If the last attempt failed with a connect / read error.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await client.post(url, json=json, headers=headers)
+            except TransportError as e:
+                reason = type(e).__name__
+                delay = retry_policy.get_delay(attempt, started) if retry_policy.is_retryable_error(e) else None
+                if delay is None:
+                    await self._emit_attempt_metric(url, attempt, "failed", started, reason=reason)
+                    raise
+            else:
+                if response.status_code < 400:
+                    await self._emit_attempt_metric(url, attempt, "success", started)
+                    return response
+                reason = f"HTTP { response.status_code }"
+                delay = (
+                    retry_policy.get_delay(attempt, started, retry_after=response.headers.get("Retry-After"))
+                    if retry_policy.is_retryable_status(response.status_code)
+                    else None
+                )
+                if delay is None:
+                    await self._emit_attempt_metric(url, attempt, "failed", started, reason=reason)
+                    return response
+            await self._emit_attempt_metric(url, attempt, "retry", started, reason=reason, delay=delay)
+            await asyncio.sleep(delay)
+
+    async def _acquire_rate_limit(self, request_data: "AgentlyRequestData"):
+        rate_limit_configs = DataFormatter.to_str_key_dict(self.plugin_settings.get("rate_limit"), default_value={})
+        requests_per_minute = rate_limit_configs.get("requests_per_minute", None)
+        tokens_per_minute = rate_limit_configs.get("tokens_per_minute", None)
+        if not requests_per_minute and not tokens_per_minute:
+            return
+        # Shared by every request to the same endpoint and model in this process
+        self._rate_limiter = RateLimiter.get_shared(
+            (request_data.request_url, request_data.request_options.get("model")),
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
+        # Estimate prompt tokens from its size, corrected by the reported usage in broadcast_response()
+        prompt_chars = len(json.dumps(request_data.data, ensure_ascii=False, default=str))
+        max_tokens = (
+            request_data.request_options.get("max_completion_tokens")
+            or request_data.request_options.get("max_tokens")
+            or 0
+        )
+        chars_per_token = float(rate_limit_configs.get("chars_per_token", 4))
+        self._rate_limit_estimate = math.ceil(prompt_chars / chars_per_token) + int(max_tokens)
+        queue_depth = self._rate_limiter.queue_depth
+        wait_time = await self._rate_limiter.acquire(self._rate_limit_estimate)
+        await self._messenger.async_to_data(
+            {
+                "url": request_data.request_url,
+                "queue_depth": queue_depth,
+                "wait_time": wait_time,
+                "estimated_tokens": self._rate_limit_estimate,
+            },
+            status="DONE",
+            meta={"metric": "rate_limit_wait"},
+        )
+
+    def _correct_rate_limit(self, usage: Any):
+        if self._rate_limiter is None or not isinstance(usage, dict):
+            return
+        total_tokens = usage.get("total_tokens")
+        if total_tokens is None:
+            total_tokens = (usage.get("prompt_tokens") or 0) + (usage.get("completion_tokens") or 0)
+        if total_tokens:
+            self._rate_limiter.correct(self._rate_limit_estimate, total_tokens)
+
+    @contextlib.asynccontextmanager
+    async def _get_client(self, request_data: "AgentlyRequestData"):
+        pool_configs = DataFormatter.to_str_key_dict(self.plugin_settings.get("connection_pool"), default_value={})
+        if pool_configs.get("enabled", True):
+            from agently.base import http_client_pool
+
+            base_url = str(self.plugin_settings.get("full_url") or self.plugin_settings.get("base_url"))
+            # Shared keep-alive client, closed by Agently.close() / Agently.async_close()
+            yield http_client_pool.get_client(request_data.client_options, base_url=base_url)
+        else:
+            async with AsyncClient(**request_data.client_options) as client:
+                yield client
+
+    async def _handle_non_sse_response(self, response: Response, full_request_data: dict[str, Any]):
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith("application/json"):
+            error_json = json.loads(response.content.decode())
+            error = error_json["error"]
+            error_title = f"{ error['code'] if 'code' in error else 'unknown_code' } - { error['type'] if 'type' in error else 'unknown_type' }"
+            error_detail = error["message"] if "message" in error else ""
+            self._messenger.error(
+                f"Error: { error_title }\n" f"Detail: {error_detail }\n" f"Request Data: {full_request_data}",
+                status="FAILED",
+            )
+            yield "error", error_detail
+        else:
+            e = SSEError(
+                "Expected response header Content-Type to contain 'text/event-stream', " f"got { repr(content_type) }"
+            )
+            self._messenger.error(
+                "Error: SSE Error\n" f"Detail: {e}\n" f"Request Data: {full_request_data}",
+                status="FAILED",
+            )
+            yield "error", e
 
     async def request_model(self, request_data: "AgentlyRequestData") -> AsyncGenerator[tuple[str, Any], None]:
+        concurrency_configs = DataFormatter.to_str_key_dict(self.plugin_settings.get("concurrency"), default_value={})
+        max_in_flight = concurrency_configs.get("max_in_flight", None)
+        if not max_in_flight:
+            async for event, data in self._request_model(request_data):
+                yield event, data
+            return
+
+        # Bulkhead: cap concurrent requests to the endpoint and admit queued requests by priority
+        bulkhead = Bulkhead.get_shared(
+            request_data.request_url,
+            max_in_flight=int(max_in_flight),
+            reserved_slots=int(concurrency_configs.get("reserved_slots", 0)),
+        )
+        priority = int(request_data.request_options.get("priority", self.plugin_settings.get("priority", 0)))
+        queue_depth = bulkhead.queue_depth
+        try:
+            wait_time = await bulkhead.acquire(priority, timeout=concurrency_configs.get("queue_timeout", None))
+        except TimeoutError as e:
+            self._messenger.error(
+                "Error: Queue Timeout\n" f"Detail: { e }\n" f"Request URL: { request_data.request_url }",
+                status="FAILED",
+            )
+            yield "error", e
+            return
+        try:
+            await self._messenger.async_to_data(
+                {
+                    "url": request_data.request_url,
+                    "priority": priority,
+                    "queue_depth": queue_depth,
+                    "in_flight": bulkhead.in_flight,
+                    "wait_time": wait_time,
+                },
+                status="DONE",
+                meta={"metric": "bulkhead_wait"},
+            )
+            async for event, data in self._request_model(request_data):
+                yield event, data
+        finally:
+            bulkhead.release()
+
+    async def _request_model(self, request_data: "AgentlyRequestData") -> AsyncGenerator[tuple[str, Any], None]:
         # auth
         auth = DataFormatter.to_str_key_dict(
             self.plugin_settings.get("auth", "None"),
@@ -360,11 +855,13 @@ class OpenAICompatible(ModelRequester):
         else:
             headers_with_auth = request_data.headers.copy()
 
+        # rate limit
+        await self._acquire_rate_limit(request_data)
+
         # request
         # stream request
         if self.model_type in ("chat", "completions") and request_data.stream:
-            async with AsyncClient(**request_data.client_options) as client:
-                client.headers.update(headers_with_auth)
+            async with self._get_client(request_data) as client:
                 full_request_data = DataFormatter.to_str_key_dict(
                     request_data.data,
                     value_format="serializable",
@@ -373,54 +870,38 @@ class OpenAICompatible(ModelRequester):
                 full_request_data.update(request_data.request_options)
                 try:
                     has_done = False
-                    async for sse in await self._aiter_sse_with_retry(
-                        client, "POST", request_data.request_url, json=full_request_data, headers=headers_with_auth
-                    ):
+                    hedging = self._get_hedging(request_data.request_url)
+                    if hedging is None:
+                        sse_stream = self._aiter_sse_with_retry(
+                            client,
+                            "POST",
+                            request_data.request_url,
+                            json=full_request_data,
+                            headers=headers_with_auth,
+                            retry_policy=self._get_retry_policy(),
+                        )
+                    else:
+                        sse_stream = self._aiter_sse_hedged(
+                            client,
+                            "POST",
+                            request_data.request_url,
+                            json=full_request_data,
+                            headers=headers_with_auth,
+                            retry_policy=self._get_retry_policy(),
+                            hedge_policy=hedging[0],
+                            hedge_url=hedging[1],
+                        )
+                    async for sse in sse_stream:
+                        if isinstance(sse, Response):
+                            # Not an event stream, usually an error body
+                            async for error_event in self._handle_non_sse_response(sse, full_request_data):
+                                yield error_event
+                            return
                         yield sse.event, sse.data
                         if sse.data.strip() == "[DONE]":
-                            has_done = False
+                            has_done = True
                     if not has_done:
                         yield "message", "[DONE]"
-                except SSEError as e:
-                    response = await client.post(
-                        request_data.request_url,
-                        json=full_request_data,
-                        headers=headers_with_auth,
-                    )
-                    # Raise status code >= 400
-                    if response.status_code >= 400:
-                        e = RequestError(
-                            f"Status Code: { response.status_code }\n" f"Request Data: {full_request_data}"
-                        )
-                        self._messenger.error(
-                            e,
-                            status="FAILED",
-                        )
-                        yield "error", e
-                    else:
-                        content_type = response.headers.get("Content-Type", "")
-                        if content_type.startswith("application/json"):
-                            try:
-                                error_json = response.json()
-                            except Exception:
-                                error_json = await response.aread()
-                                error_json = json.loads(error_json.decode())
-                            error = error_json["error"]
-                            error_title = f"{ error['code'] if 'code' in error else 'unknown_code' } - { error['type'] if 'type' in error else 'unknown_type' }"
-                            error_detail = error["message"] if "message" in error else ""
-                            self._messenger.error(
-                                f"Error: { error_title }\n"
-                                f"Detail: {error_detail }\n"
-                                f"Request Data: {full_request_data}",
-                                status="FAILED",
-                            )
-                            yield "error", error_detail
-                        else:
-                            self._messenger.error(
-                                "Error: SSE Error\n" f"Detail: {e}\n" f"Request Data: {full_request_data}",
-                                status="FAILED",
-                            )
-                            yield "error", e
                 except HTTPStatusError as e:
                     self._messenger.error(
                         "Error: HTTP Status Error\n"
@@ -441,12 +922,9 @@ class OpenAICompatible(ModelRequester):
                         status="FAILED",
                     )
                     yield "error", e
-                finally:
-                    await client.aclose()
         # normal request
         else:
-            async with AsyncClient(**request_data.client_options) as client:
-                client.headers.update(headers_with_auth)
+            async with self._get_client(request_data) as client:
                 full_request_data = DataFormatter.to_str_key_dict(
                     request_data.data,
                     value_format="serializable",
@@ -454,9 +932,12 @@ class OpenAICompatible(ModelRequester):
                 )
                 full_request_data.update(request_data.request_options)
                 try:
-                    response = await client.post(
+                    response = await self._post_with_retry(
+                        client,
                         request_data.request_url,
                         json=full_request_data,
+                        headers=headers_with_auth,
+                        retry_policy=self._get_retry_policy(),
                     )
                     if response.status_code >= 400:
                         e = RequestError(
@@ -490,87 +971,111 @@ class OpenAICompatible(ModelRequester):
                         status="FAILED",
                     )
                     yield "error", e
-                finally:
-                    await client.aclose()
+
+    def _get_compiled_content_mapping(self) -> CompiledContentMapping:
+        content_mapping = DataFormatter.to_str_key_dict(
+            self.plugin_settings.get("content_mapping"),
+            value_format="serializable",
+        )
+        content_mapping_style = str(self.plugin_settings.get("content_mapping_style"))
+        if content_mapping_style not in ("dot", "slash"):
+            content_mapping_style = "dot"
+        fingerprint = repr((content_mapping, content_mapping_style, self.model_type))
+        if self._compiled_content_mapping is not None and self._compiled_content_mapping[0] == fingerprint:
+            return self._compiled_content_mapping[1]
+        compiled = OpenAICompatible._compiled_content_mappings.get(fingerprint)
+        if compiled is None:
+            compiled = self._compile_content_mapping(
+                cast(ContentMapping, content_mapping),
+                cast(Literal["dot", "slash"], content_mapping_style),
+            )
+            if len(OpenAICompatible._compiled_content_mappings) >= 128:
+                OpenAICompatible._compiled_content_mappings.clear()
+            OpenAICompatible._compiled_content_mappings[fingerprint] = compiled
+        self._compiled_content_mapping = (fingerprint, compiled)
+        return compiled
+
+    def _compile_content_mapping(
+        self,
+        content_mapping: ContentMapping,
+        style: Literal["dot", "slash"],
+    ) -> CompiledContentMapping:
+        def compile_path(path: str | None, path_style: Literal["dot", "slash"] = style):
+            return DataLocator.compile_path(path, path_style) if path else None
+
+        done_path = compile_path(content_mapping["done"])
+        if self.model_type == "embeddings" and content_mapping["done"] is None:
+            done_path = compile_path("data", "dot")
+        delta_path = compile_path(content_mapping["delta"])
+        extra_delta_paths = {
+            extra_key: DataLocator.compile_path(extra_path, style)
+            for extra_key, extra_path in (content_mapping["extra_delta"] or {}).items()
+        }
+        # Locate the prefix shared by the per-chunk paths (e.g. "choices[0].delta") once per chunk
+        chunk_paths = [path for path in (delta_path, *extra_delta_paths.values()) if path is not None]
+        prefix_length = 0
+        if len(chunk_paths) > 1:
+            for steps in zip(*(path[:-1] for path in chunk_paths)):
+                if any(step != steps[0] for step in steps):
+                    break
+                prefix_length += 1
+        return {
+            "id": compile_path(content_mapping["id"]),
+            "role": compile_path(content_mapping["role"]),
+            "chunk_prefix": chunk_paths[0][:prefix_length] if prefix_length else (),
+            "delta": delta_path[prefix_length:] if delta_path is not None else None,
+            "extra_delta": {extra_key: path[prefix_length:] for extra_key, path in extra_delta_paths.items()},
+            "done": done_path,
+            "usage": compile_path(content_mapping["usage"]),
+            "finish_reason": compile_path(content_mapping["finish_reason"]),
+            "extra_done": {
+                extra_key: DataLocator.compile_path(extra_path, style)
+                for extra_key, extra_path in (content_mapping["extra_done"] or {}).items()
+            },
+        }
 
     async def broadcast_response(self, response_generator: AsyncGenerator) -> "AgentlyResponseGenerator":
         meta = {}
         message_record = {}
         content_buffer = ""
 
-        content_mapping = cast(
-            ContentMapping,
-            DataFormatter.to_str_key_dict(
-                self.plugin_settings.get("content_mapping"),
-                value_format="serializable",
-            ),
-        )
-        id_mapping = content_mapping["id"]
-        role_mapping = content_mapping["role"]
-        delta_mapping = content_mapping["delta"]
-        done_mapping = content_mapping["done"]
-        usage_mapping = content_mapping["usage"]
-        finish_reason_mapping = content_mapping["finish_reason"]
-        extra_delta_mapping = content_mapping["extra_delta"]
-        extra_done_mapping = content_mapping["extra_done"]
-
-        content_mapping_style = str(self.plugin_settings.get("content_mapping_style"))
-        if content_mapping_style not in ("dot", "slash"):
-            content_mapping_style = "dot"
+        content_mapping = self._get_compiled_content_mapping()
+        id_path = content_mapping["id"]
+        role_path = content_mapping["role"]
+        chunk_prefix = content_mapping["chunk_prefix"]
+        delta_path = content_mapping["delta"]
+        extra_delta_paths = content_mapping["extra_delta"]
+        locate = DataLocator.locate_compiled_path
 
         async for event, message in response_generator:
             if event == "error":
                 yield "error", message
             elif message != "[DONE]":
                 yield "original_delta", message
-                loaded_message = json.loads(message)
-                message_record = loaded_message.copy()
-                if "id" not in meta and id_mapping:
-                    _id = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        id_mapping,
-                        style=content_mapping_style,
-                    )
+                # Only the last record is kept for "original_done", no per-chunk copy
+                message_record = loaded_message = JSONLoader.loads(message)
+                if id_path is not None and "id" not in meta:
+                    _id = locate(loaded_message, id_path)
                     if _id:
-                        meta.update({"id": _id})
-                if "role" not in meta and role_mapping:
-                    role = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        role_mapping,
-                        style=content_mapping_style,
-                        default="assistant",
-                    )
+                        meta["id"] = _id
+                if role_path is not None and "role" not in meta:
+                    role = locate(loaded_message, role_path, default="assistant")
                     if role:
-                        meta.update({"role": role})
-                if delta_mapping:
-                    delta = DataLocator.locate_path_in_dict(
-                        loaded_message,
-                        delta_mapping,
-                        style=content_mapping_style,
-                    )
+                        meta["role"] = role
+                chunk_data = locate(loaded_message, chunk_prefix) if chunk_prefix else loaded_message
+                if delta_path is not None:
+                    delta = locate(chunk_data, delta_path)
                     if delta:
                         content_buffer += str(delta)
                         yield "delta", delta
-                if extra_delta_mapping:
-                    for extra_key, extra_path in extra_delta_mapping.items():
-                        extra_value = DataLocator.locate_path_in_dict(
-                            loaded_message,
-                            extra_path,
-                            style=content_mapping_style,
-                        )
-                        if extra_value:
-                            yield "extra", {extra_key: extra_value}
+                for extra_key, extra_path in extra_delta_paths.items():
+                    extra_value = locate(chunk_data, extra_path)
+                    if extra_value:
+                        yield "extra", {extra_key: extra_value}
             else:
                 done_content = None
-                if self.model_type == "embeddings" and done_mapping is None:
-                    done_mapping = "data"
-                    content_mapping_style = "dot"
-                if done_mapping:
-                    done_content = DataLocator.locate_path_in_dict(
-                        message_record,
-                        done_mapping,
-                        style=content_mapping_style,
-                    )
+                if content_mapping["done"] is not None:
+                    done_content = locate(message_record, content_mapping["done"])
                 if done_content:
                     yield "done", done_content
                 else:
@@ -589,33 +1094,13 @@ class OpenAICompatible(ModelRequester):
                             }
                         )
                         yield "original_done", done_message
-                if finish_reason_mapping:
-                    meta.update(
-                        {
-                            "finish_reason": DataLocator.locate_path_in_dict(
-                                message_record,
-                                finish_reason_mapping,
-                                style=content_mapping_style,
-                            )
-                        }
-                    )
-                if usage_mapping:
-                    meta.update(
-                        {
-                            "usage": DataLocator.locate_path_in_dict(
-                                message_record,
-                                usage_mapping,
-                                style=content_mapping_style,
-                            )
-                        }
-                    )
+                if content_mapping["finish_reason"] is not None:
+                    meta.update({"finish_reason": locate(message_record, content_mapping["finish_reason"])})
+                if content_mapping["usage"] is not None:
+                    meta.update({"usage": locate(message_record, content_mapping["usage"])})
+                self._correct_rate_limit(meta.get("usage"))
                 yield "meta", meta
-                if extra_done_mapping:
-                    for extra_key, extra_path in extra_done_mapping.items():
-                        extra_value = DataLocator.locate_path_in_dict(
-                            message_record,
-                            extra_path,
-                            style=content_mapping_style,
-                        )
-                        if extra_value:
-                            yield "extra", {extra_key: extra_value}
+                for extra_key, extra_path in content_mapping["extra_done"].items():
+                    extra_value = locate(message_record, extra_path)
+                    if extra_value:
+                        yield "extra", {extra_key: extra_value}
@@ -207,6 +207,16 @@ class AgentlyPromptGenerator(PromptGenerator):
                             "",
                         ]
                     )
+                case "jsonl":
+                    prompt_text_list.extend(
+                        [
+                            "[OUTPUT REQUIREMENT]:",
+                            "Data Format: JSON Lines (one compact JSON object per line, no other text)",
+                            "Line Structure:",
+                            self._generate_json_output_prompt(DataFormatter.sanitize(prompt_object.output)),
+                            "",
+                        ]
+                    )
                 case "markdown":
                     prompt_text_list.extend(
                         [
@@ -16,25 +16,33 @@ import asyncio
 import contextlib
 import warnings
 
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Literal, Mapping, cast
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Iterable, Literal, Mapping, cast
 from pydantic import BaseModel
 
-import json5
-
 from agently.types.plugins import ResponseParser
 from agently.utils import (
     DataPathBuilder,
     RuntimeDataNamespace,
+    ChunkRetention,
     GeneratorConsumer,
     DataLocator,
     FunctionShifter,
+    JSONLoader,
     StreamingJSONCompleter,
     StreamingJSONParser,
+    StreamingJSONLinesParser,
+    StreamingChunkCoalescer,
 )
 
 if TYPE_CHECKING:
     from agently.core import Prompt
-    from agently.types.data import AgentlyModelResult, AgentlyResponseGenerator, AgentlyModelResult, SerializableData
+    from agently.types.data import (
+        AgentlyModelResult,
+        AgentlyResponseGenerator,
+        AgentlyModelResult,
+        SerializableData,
+        StreamingData,
+    )
     from agently.utils import Settings
 
 
@@ -45,6 +53,12 @@ class AgentlyResponseParser(ResponseParser):
             "response": {
                 "streaming_parse": False,
                 "streaming_parse_path_style": "dot",
+                "streaming_parse_coalesce": None,
+                "streaming_parse_release_completed_items": False,
+                "json_decoder": "auto",
+                "original_delta_retention": True,
+                "original_delta_max_count": None,
+                "original_delta_max_bytes": None,
             },
         },
     }
@@ -77,9 +91,10 @@ class AgentlyResponseParser(ResponseParser):
         self._prompt_object = prompt.to_prompt_object()
         self._OutputModel = prompt.to_output_model() if self._prompt_object.output_format == "json" else None
         self._response_consumer: GeneratorConsumer | None = None
+        self._original_delta_retention = self._new_original_delta_retention()
         self._consumer_lock = asyncio.Lock()
         self._streaming_json_parser = (
-            StreamingJSONParser(self._prompt_object.output) if self._prompt_object.output_format == "json" else None
+            self._new_streaming_json_parser() if self._prompt_object.output_format in ("json", "jsonl") else None
         )
 
         self._streaming_canceled = False
@@ -101,7 +116,19 @@ class AgentlyResponseParser(ResponseParser):
         if self._response_consumer is None:
             async with self._consumer_lock:
                 if self._response_consumer is None:
-                    self._response_consumer = GeneratorConsumer(self._extract())
+                    # The history keeps the same "original_delta" chunks as full_result_data
+                    history_retention = self._new_original_delta_retention()
+                    self._response_consumer = GeneratorConsumer(
+                        self._extract(),
+                        history_filter=lambda item: item[0] != "original_delta" or history_retention.keep(item[1]),
+                    )
+
+    def _new_original_delta_retention(self) -> ChunkRetention:
+        return ChunkRetention(
+            bool(self.settings.get("response.original_delta_retention", True)),
+            max_count=self.settings.get("response.original_delta_max_count", None),  # type: ignore
+            max_bytes=self.settings.get("response.original_delta_max_bytes", None),  # type: ignore
+        )
 
     async def _extract(self):
         from agently.base import async_system_message
@@ -117,7 +144,8 @@ class AgentlyResponseParser(ResponseParser):
                 yield event, data
                 match event:
                     case "original_delta":
-                        self.full_result_data["original_delta"].append(data)
+                        if self._original_delta_retention.keep(data):
+                            self.full_result_data["original_delta"].append(data)
                     case "delta":
                         buffer += str(data)
                         if self.settings.get("$log.cancel_logs") is not True:
@@ -165,7 +193,10 @@ class AgentlyResponseParser(ResponseParser):
                                 completer = StreamingJSONCompleter()
                                 completer.reset(cleaned_json)
                                 completed = completer.complete()
-                                parsed = json5.loads(completed)
+                                parsed = JSONLoader.loads(
+                                    completed,
+                                    decoder=self.settings.get("response.json_decoder", "auto"),  # type: ignore
+                                )
                                 try:
                                     if self._OutputModel:
                                         result_object = self._OutputModel.model_validate(parsed)
@@ -203,6 +234,25 @@ class AgentlyResponseParser(ResponseParser):
                                     },
                                     self.settings,
                                 )
+                        elif self._prompt_object.output_format == "jsonl":
+                            # One record per line, the result is the list of records
+                            self.full_result_data["parsed_result"] = StreamingJSONLinesParser.loads(
+                                str(data),
+                                decoder=self.settings.get("response.json_decoder", "auto"),  # type: ignore
+                            )
+                            if self.settings.get("$log.cancel_logs") is not True:
+                                await async_system_message(
+                                    "MODEL_REQUEST",
+                                    {
+                                        "agent_name": self.agent_name,
+                                        "response_id": self.response_id,
+                                        "content": {
+                                            "stage": "Done",
+                                            "detail": str(data),
+                                        },
+                                    },
+                                    self.settings,
+                                )
                         else:
                             if (
                                 isinstance(data, list)
@@ -273,13 +323,51 @@ class AgentlyResponseParser(ResponseParser):
         await cast(GeneratorConsumer, self._response_consumer).get_result()
         return self.full_result_data["text_result"]
 
+    def _get_streaming_json_parser(
+        self,
+        paths: Iterable[str] | None,
+    ) -> StreamingJSONParser | StreamingJSONLinesParser | None:
+        if paths is None or self._prompt_object.output_format not in ("json", "jsonl"):
+            return self._streaming_json_parser
+        if self.settings.get("response.streaming_parse_path_style", "dot") == "slash":
+            paths = [DataPathBuilder.convert_slash_to_dot(path) for path in paths]
+        return self._new_streaming_json_parser(paths)
+
+    def _new_streaming_json_parser(
+        self,
+        paths: Iterable[str] | None = None,
+    ) -> StreamingJSONParser | StreamingJSONLinesParser:
+        if self._prompt_object.output_format == "jsonl":
+            return StreamingJSONLinesParser(
+                paths=paths,
+                decoder=self.settings.get("response.json_decoder", "auto"),  # type: ignore
+            )
+        return StreamingJSONParser(
+            self._prompt_object.output,
+            paths=paths,
+            release_completed_items=bool(self.settings.get("response.streaming_parse_release_completed_items", False)),
+        )
+
+    @staticmethod
+    def _finalize_streaming_parse(
+        streaming_json_parser: StreamingJSONParser | StreamingJSONLinesParser,
+        rest: str,
+    ) -> list["StreamingData"]:
+        streaming_parsed = streaming_json_parser.parse_chunk_sync(rest) if rest else []
+        streaming_parsed.extend(streaming_json_parser.finalize_sync())
+        return streaming_parsed
+
     async def get_async_generator(
         self,
         content: Literal['all', 'delta', 'original', 'instant', 'streaming_parse'] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> AsyncGenerator:
         await self._ensure_consumer()
         parsed_generator = cast(GeneratorConsumer, self._response_consumer).get_async_generator()
         _streaming_parse_path_style = self.settings.get("response.streaming_parse_path_style", "dot")
+        _streaming_json_parser = self._get_streaming_json_parser(paths)
+        _coalescer = StreamingChunkCoalescer(self.settings.get("response.streaming_parse_coalesce", None))
         async for event, data in parsed_generator:
             match content:
                 case "all":
@@ -288,14 +376,19 @@ class AgentlyResponseParser(ResponseParser):
                     if event == "delta":
                         yield data
                 case "instant" | "streaming_parse":
-                    if self._streaming_json_parser is not None:
+                    if _streaming_json_parser is not None:
                         streaming_parsed = None
                         if event == "delta":
-                            streaming_parsed = self._streaming_json_parser.parse_chunk(data)
+                            chunk = _coalescer.push(data)
+                            if chunk:
+                                streaming_parsed = _streaming_json_parser.parse_chunk_sync(chunk)
                         elif event == "done":
-                            streaming_parsed = self._streaming_json_parser.finalize()
+                            streaming_parsed = self._finalize_streaming_parse(
+                                _streaming_json_parser,
+                                _coalescer.flush(),
+                            )
                         if streaming_parsed:
-                            async for streaming_data in streaming_parsed:
+                            for streaming_data in streaming_parsed:
                                 if _streaming_parse_path_style == "slash":
                                     streaming_data.path = DataPathBuilder.convert_dot_to_slash(streaming_data.path)
                                 yield streaming_data
@@ -306,10 +399,14 @@ class AgentlyResponseParser(ResponseParser):
     def get_generator(
         self,
         content: Literal['all', 'delta', 'original', 'instant', 'streaming_parse'] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> Generator:
         asyncio.run(self._ensure_consumer())
         parsed_generator = cast(GeneratorConsumer, self._response_consumer).get_generator()
         _streaming_parse_path_style = self.settings.get("response.streaming_parse_path_style", "dot")
+        _streaming_json_parser = self._get_streaming_json_parser(paths)
+        _coalescer = StreamingChunkCoalescer(self.settings.get("response.streaming_parse_coalesce", None))
         for event, data in parsed_generator:
             match content:
                 case "all":
@@ -318,14 +415,19 @@ class AgentlyResponseParser(ResponseParser):
                     if event == "delta":
                         yield data
                 case "instant" | "streaming_parse":
-                    if self._streaming_json_parser is not None:
+                    if _streaming_json_parser is not None:
                         streaming_parsed = None
                         if event == "delta":
-                            streaming_parsed = self._streaming_json_parser.parse_chunk(data)
+                            chunk = _coalescer.push(data)
+                            if chunk:
+                                streaming_parsed = _streaming_json_parser.parse_chunk_sync(chunk)
                         elif event == "done":
-                            streaming_parsed = self._streaming_json_parser.finalize()
+                            streaming_parsed = self._finalize_streaming_parse(
+                                _streaming_json_parser,
+                                _coalescer.flush(),
+                            )
                         if streaming_parsed:
-                            for streaming_data in FunctionShifter.syncify_async_generator(streaming_parsed):
+                            for streaming_data in streaming_parsed:
                                 if _streaming_parse_path_style == "slash":
                                     streaming_data.path = DataPathBuilder.convert_dot_to_slash(streaming_data.path)
                                 yield streaming_data
@@ -343,7 +343,7 @@ class EventCenterMessenger:
         status: "EventStatus" = "",
         meta: dict[str, Any],
     ):
-        final_meta = self._base_meta
+        final_meta = self._base_meta.copy()
         final_meta.update(meta)
         await self._event_center.async_emit(
             "data",
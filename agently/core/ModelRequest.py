@@ -16,7 +16,7 @@ import json
 import uuid
 
 import inspect
-from typing import Any, AsyncGenerator, Literal, TYPE_CHECKING, cast, TypeAlias, overload, Generator
+from typing import Any, AsyncGenerator, Iterable, Literal, TYPE_CHECKING, cast, TypeAlias, overload, Generator
 
 ContentKindTuple: TypeAlias = Literal["all", "delta", "original"]
 ContentKindStreaming: TypeAlias = Literal["instant", "streaming_parse"]
@@ -421,6 +421,8 @@ class ModelRequest:
     def get_generator(
         self,
         content: Literal["instant", "streaming_parse"],
+        *,
+        paths: Iterable[str] | None = None,
     ) -> Generator["StreamingData", None, None]: ...
 
     @overload
@@ -439,18 +441,24 @@ class ModelRequest:
     def get_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> Generator: ...
 
     def get_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> Generator:
-        return self.get_response().get_generator(content=content)
+        return self.get_response().get_generator(content=content, paths=paths)
 
     @overload
     def get_async_generator(
         self,
         content: Literal["instant", "streaming_parse"],
+        *,
+        paths: Iterable[str] | None = None,
     ) -> AsyncGenerator["StreamingData", None]: ...
 
     @overload
@@ -469,10 +477,14 @@ class ModelRequest:
     def get_async_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> AsyncGenerator: ...
 
     def get_async_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> AsyncGenerator:
-        return self.get_response().get_async_generator(content=content)
+        return self.get_response().get_async_generator(content=content, paths=paths)
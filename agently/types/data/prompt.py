@@ -109,7 +109,7 @@ def validate_attachment(attachment) -> list[ChatMessageContent]:
     ]
 
 
-OutputFormat = Literal["markdown", "text", "json"]
+OutputFormat = Literal["markdown", "text", "json", "jsonl"]
 PromptStandardSlot = Literal[
     "system",
     "developer",
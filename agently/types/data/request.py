@@ -34,12 +34,6 @@ class AgentlyRequestData(BaseModel):
     request_url: str
     stream: bool | None = None
 
-    @field_validator("headers")
-    @classmethod
-    def fix_headers(cls, value: dict[str, str]):
-        value.update({"Connection": "close"})
-        return value
-
     @model_validator(mode="after")
     def fix_request_options(self):
         if "stream" not in self.request_options or self.request_options["stream"] is None:
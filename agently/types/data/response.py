@@ -17,7 +17,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Literal, TypeAlias
 from typing_extensions import TypedDict
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from agently.utils import GeneratorConsumer
@@ -42,26 +42,60 @@ class AgentlyModelResult(TypedDict):
     extra: dict[str, Any] | None
 
 
-class StreamingData(BaseModel):
+class StreamingData:
     """
     Represents a streaming event for a specific path in a JSON structure.
 
+    It is a lightweight __slots__ class built without validation since thousands of events are created
+    for every streamed response. `wildcard_path` and `indexes` are computed on first access.
+
     Attributes:
         path (str): The dot-style path to the field in the JSON object.
         value (Any): The current value at this path.
         delta (Optional[str]): The incremental content (for delta events, typically used for string updates).
         is_complete (bool): Whether this path/field is considered complete and will not change further.
+        wildcard_path (str): The path with all array indexes replaced by '[*]' (e.g. 'items[*].title').
+        indexes (tuple[int, ...]): The array indexes in the path.
         event_type (Literal["delta", "done"]): The type of event ("delta" for incremental update, "done" for completion).
+        full_data (Any): The snapshot of the whole parsed data when this event was created.
     """
 
-    path: str
-    value: Any
-    delta: str | None = None
-    is_complete: bool = False
-    wildcard_path: str | None = None
-    indexes: tuple | None = None
-    event_type: Literal["delta", "done"] = "done"
-    full_data: Any = None
+    __slots__ = (
+        "path",
+        "value",
+        "delta",
+        "is_complete",
+        "event_type",
+        "full_data",
+        "_origin_path",
+        "_wildcard_path",
+        "_indexes",
+    )
+
+    _FIELDS = ("path", "value", "delta", "is_complete", "wildcard_path", "indexes", "event_type", "full_data")
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        value: Any,
+        delta: str | None = None,
+        is_complete: bool = False,
+        wildcard_path: str | None = None,
+        indexes: tuple | None = None,
+        event_type: Literal["delta", "done"] = "done",
+        full_data: Any = None,
+    ):
+        self.path = path
+        self.value = value
+        self.delta = delta
+        self.is_complete = is_complete
+        self.event_type = event_type
+        self.full_data = full_data
+        # Keep the path given on creation so wildcard_path stays dot-style even if path is converted later
+        self._origin_path = path
+        self._wildcard_path = wildcard_path
+        self._indexes = indexes
 
     @staticmethod
     @lru_cache(maxsize=1024)
@@ -95,8 +129,50 @@ class StreamingData(BaseModel):
         wildcard = ''.join(wildcard_chars)
         return wildcard, tuple(indexes)
 
-    @model_validator(mode="before")
-    @classmethod
-    def set_wildcard_path(cls, data: dict[str, Any]):
-        data["wildcard_path"], data["indexes"] = StreamingData._process_path(data["path"])
-        return data
+    @property
+    def wildcard_path(self) -> str:
+        if self._wildcard_path is None:
+            self._wildcard_path, self._indexes = StreamingData._process_path(self._origin_path)
+        return self._wildcard_path
+
+    @wildcard_path.setter
+    def wildcard_path(self, wildcard_path: str):
+        self._wildcard_path = wildcard_path
+
+    @property
+    def indexes(self) -> tuple[int, ...]:
+        if self._indexes is None:
+            self._wildcard_path, self._indexes = StreamingData._process_path(self._origin_path)
+        return self._indexes
+
+    @indexes.setter
+    def indexes(self, indexes: tuple[int, ...]):
+        self._indexes = indexes
+
+    def model_dump(self, *, include: set[str] | None = None, exclude: set[str] | None = None) -> dict[str, Any]:
+        """
+        Dump the event as a dict, compatible with the pydantic model this class used to be.
+
+        Args:
+            include (set[str] | None): Field names to include, all fields if None.
+            exclude (set[str] | None): Field names to exclude.
+
+        Returns:
+            dict[str, Any]: Field names and values.
+        """
+        return {
+            field: getattr(self, field)
+            for field in self._FIELDS
+            if (include is None or field in include) and (exclude is None or field not in exclude)
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StreamingData):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{ field }={ repr(getattr(self, field)) }" for field in self._FIELDS)
+        return f"StreamingData({ fields })"
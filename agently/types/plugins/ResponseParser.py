@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Protocol, AsyncGenerator, Generator, Literal, TYPE_CHECKING, overload
+from typing import Any, Protocol, AsyncGenerator, Generator, Iterable, Literal, TYPE_CHECKING, overload
 
 from agently.types.plugins import AgentlyPlugin
 
@@ -77,6 +77,8 @@ class ResponseParser(AgentlyPlugin, Protocol):
     def get_async_generator(
         self,
         content: Literal["instant", "streaming_parse"],
+        *,
+        paths: Iterable[str] | None = None,
     ) -> AsyncGenerator["StreamingData", None]: ...
 
     @overload
@@ -95,14 +97,19 @@ class ResponseParser(AgentlyPlugin, Protocol):
     def get_async_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> AsyncGenerator: ...
 
     def get_async_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> AsyncGenerator:
         """
         'instant' is Agently v3 compatible for 'streaming_parse'
+        'paths' subscribes paths or wildcard paths (e.g. 'items[*].title') for 'instant' / 'streaming_parse'
         """
         ...
 
@@ -110,6 +117,8 @@ class ResponseParser(AgentlyPlugin, Protocol):
     def get_generator(
         self,
         content: Literal["instant", "streaming_parse"],
+        *,
+        paths: Iterable[str] | None = None,
     ) -> Generator["StreamingData", None, None]: ...
 
     @overload
@@ -128,13 +137,18 @@ class ResponseParser(AgentlyPlugin, Protocol):
     def get_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> Generator: ...
 
     def get_generator(
         self,
         content: Literal["all", "original", "delta", "instant", "streaming_parse"] | None = "delta",
+        *,
+        paths: Iterable[str] | None = None,
     ) -> Generator:
         """
         'instant' is Agently v3 compatible for 'streaming_parse'
+        'paths' subscribes paths or wildcard paths (e.g. 'items[*].title') for 'instant' / 'streaming_parse'
         """
         ...
@@ -0,0 +1,159 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+from typing import Any, Hashable
+
+
+class _SlotWaiter:
+    __slots__ = ("loop", "turn", "priority", "granted", "cancelled")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, priority: int):
+        self.loop = loop
+        self.turn = loop.create_future()
+        self.priority = priority
+        self.granted = False
+        self.cancelled = False
+
+
+class Bulkhead:
+    """
+    Semaphore-like admission layer that caps concurrent requests and admits waiting requests by priority.
+
+    A lower priority value is admitted first (0 for interactive traffic, e.g. 10 for batch jobs), equal
+    priorities are admitted in FIFO order. `reserved_slots` slots are only used by requests with priority <= 0,
+    so low-priority requests can never hold every slot and starve interactive ones.
+
+    Like RateLimiter, the bulkhead can be used from any event loop and thread, use get_shared() to get the
+    process-wide bulkhead of an endpoint.
+
+    Example:
+        >>> bulkhead = Bulkhead.get_shared("https://api.openai.com/v1/chat/completions", max_in_flight=8)
+        >>> async def request():
+        ...     await bulkhead.acquire(priority=10, timeout=30)
+        ...     try:
+        ...         ...
+        ...     finally:
+        ...         bulkhead.release()
+    """
+
+    _shared: dict[Hashable, "Bulkhead"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_in_flight: int, *, reserved_slots: int = 0):
+        self._lock = threading.Lock()
+        self._waiters: list[tuple[int, int, _SlotWaiter]] = []
+        self._sequence = itertools.count()
+        self.in_flight = 0
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.reserved_slots = max(0, int(reserved_slots))
+
+    @classmethod
+    def get_shared(cls, key: Hashable, *, max_in_flight: int, reserved_slots: int = 0) -> "Bulkhead":
+        """
+        Get the process-wide bulkhead of a key (e.g. endpoint), create it or update its limits.
+
+        Args:
+            key (Hashable): The bulkhead key.
+            max_in_flight (int): Maximum concurrent requests.
+            reserved_slots (int): Slots only used by requests with priority <= 0.
+
+        Returns:
+            Bulkhead: The shared bulkhead.
+        """
+        with cls._shared_lock:
+            bulkhead = cls._shared.get(key)
+            if bulkhead is None:
+                bulkhead = cls._shared[key] = cls(max_in_flight, reserved_slots=reserved_slots)
+            elif (bulkhead.max_in_flight, bulkhead.reserved_slots) != (max_in_flight, reserved_slots):
+                with bulkhead._lock:
+                    bulkhead.max_in_flight = max(1, int(max_in_flight))
+                    bulkhead.reserved_slots = max(0, int(reserved_slots))
+                    bulkhead._dispatch()
+            return bulkhead
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.cancelled)
+
+    def _get_limit(self, priority: int) -> int:
+        if priority <= 0:
+            return self.max_in_flight
+        return max(1, self.max_in_flight - self.reserved_slots)
+
+    def _dispatch(self):
+        # Must be called with the lock held
+        while self._waiters:
+            priority, _, waiter = self._waiters[0]
+            if waiter.cancelled:
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= self._get_limit(priority):
+                return
+            heapq.heappop(self._waiters)
+            try:
+                waiter.loop.call_soon_threadsafe(_set_turn, waiter.turn)
+            except RuntimeError:
+                # The event loop of the waiter is closed
+                continue
+            waiter.granted = True
+            self.in_flight += 1
+
+    async def acquire(self, priority: int = 0, *, timeout: float | None = None) -> float:
+        """
+        Wait for a slot.
+
+        Args:
+            priority (int): Lower values are admitted first.
+            timeout (float | None): Maximum seconds to wait in the queue, None to wait forever.
+
+        Returns:
+            float: Seconds waited.
+
+        Raises:
+            TimeoutError: If no slot was admitted within the timeout.
+        """
+        started = time.monotonic()
+        waiter = _SlotWaiter(asyncio.get_running_loop(), priority)
+        with self._lock:
+            heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+            self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.turn), timeout)
+        except BaseException as e:
+            with self._lock:
+                waiter.cancelled = True
+                if waiter.granted:
+                    # Admitted while being cancelled, give the slot back
+                    self.in_flight -= 1
+                    self._dispatch()
+            if isinstance(e, asyncio.TimeoutError):
+                raise TimeoutError(f"No slot admitted in { timeout } seconds (max in flight: { self.max_in_flight })")
+            raise
+        return time.monotonic() - started
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+            self._dispatch()
+
+
+def _set_turn(turn: "asyncio.Future[Any]"):
+    if not turn.done():
+        turn.set_result(None)
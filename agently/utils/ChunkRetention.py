@@ -0,0 +1,71 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+
+class ChunkRetention:
+    """
+    Decide which chunks of a stream are kept in memory: all of them, none of them, or the first ones up to a
+    count and / or bytes cap. Chunks after the cap are still streamed, they are just not kept.
+
+    The decision only depends on the chunks seen so far, so two retentions with the same limits fed with the
+    same chunks always keep the same ones.
+
+    Example:
+        >>> retention = ChunkRetention(max_count=2)
+        >>> [retention.keep(chunk) for chunk in ["a", "b", "c"]]
+        [True, True, False]
+        >>> retention.dropped
+        1
+    """
+
+    def __init__(self, enabled: bool = True, *, max_count: int | None = None, max_bytes: int | None = None):
+        """
+        Args:
+            enabled (bool): Keep chunks at all, False keeps none.
+            max_count (int | None): Maximum chunks to keep, None for no limit.
+            max_bytes (int | None): Maximum UTF-8 bytes of kept chunks, None for no limit.
+        """
+        self.enabled = enabled
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.count = 0
+        self.bytes = 0
+        self.dropped = 0
+        self._full = False
+
+    def keep(self, chunk: Any) -> bool:
+        """
+        Check whether a new chunk is kept and count it if so.
+
+        Args:
+            chunk (Any): The chunk, bytes are measured by `str(chunk)` unless it is bytes.
+
+        Returns:
+            bool: Whether the chunk is kept.
+        """
+        if not self.enabled or self._full or (self.max_count is not None and self.count >= self.max_count):
+            self.dropped += 1
+            return False
+        if self.max_bytes is not None:
+            size = len(chunk) if isinstance(chunk, bytes) else len(str(chunk).encode())
+            if self.bytes + size > self.max_bytes:
+                # Keep a prefix of the stream, no smaller chunks after the first one over the cap
+                self._full = True
+                self.dropped += 1
+                return False
+            self.bytes += size
+        self.count += 1
+        return True
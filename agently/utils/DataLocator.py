@@ -14,13 +14,110 @@
 
 import re
 import json5
+from functools import lru_cache
 from typing import Literal, Any, Mapping, Sequence, TYPE_CHECKING
 
+from .JSONLoader import JSONLoader
+
 if TYPE_CHECKING:
     from agently.types.data import SerializableData
 
 
+CompiledPath = tuple[str | int | tuple[str, int], ...]
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _compile_path(path: str, style: str) -> CompiledPath:
+    steps: list[str | int | tuple[str, int]] = []
+    match style:
+        case "dot":
+            for path_part in path.split("."):
+                key, *indexes = path_part.split("[")
+                if key or not indexes:
+                    steps.append(key)
+                steps.extend(int(index.rstrip("]")) for index in indexes)
+        case "slash":
+            for path_part in path.split("/"):
+                if path_part:
+                    try:
+                        steps.append((path_part, int(path_part)))
+                    except ValueError:
+                        steps.append(path_part)
+        case _:
+            raise ValueError(f"Unknown path style: { style }")
+    return tuple(steps)
+
+
 class DataLocator:
+    @staticmethod
+    def compile_path(path: str, style: Literal["dot", "slash"] = "dot") -> CompiledPath:
+        """
+        Compile a path into a tuple of steps for locate_compiled_path(), so hot paths do not split the path
+        string on every lookup. Compiled paths are cached, compiling the same path again is a cache hit.
+
+        Steps are str (mapping key), int (sequence index, "[n]" in dot style) or a (str, int) pair (a numeric
+        slash-style part: mapping key or sequence index, depending on the data).
+
+        Args:
+            path (str): The path, e.g. "choices[0].delta.content" or "/choices/0/delta/content".
+            style (Literal["dot", "slash"]): The path style.
+
+        Returns:
+            CompiledPath: The compiled path, empty for the root.
+
+        Raises:
+            ValueError: If a dot-style index is not an integer or the style is unknown.
+        """
+        if not isinstance(path, str) or path == "":
+            return ()
+        return _compile_path(path, style)
+
+    @staticmethod
+    def locate_compiled_path(original_dict: Any, compiled_path: CompiledPath, *, default: Any = None):
+        """
+        Locate a value by a path compiled with compile_path(), locate_path_in_dict() with the path compiled
+        once. Consecutive indexes like "items[0][1]" are supported.
+
+        Args:
+            original_dict (Any): The data.
+            compiled_path (CompiledPath): The compiled path.
+            default (Any): The value to return if the path can not be located.
+
+        Returns:
+            Any: The located value or the default value.
+        """
+        result = original_dict
+        try:
+            for step in compiled_path:
+                # Exact type checks first, isinstance() against the typing ABCs is slow in hot paths
+                result_type = type(result)
+                step_type = type(step)
+                if result_type is dict:
+                    if step_type is int:
+                        return default
+                    result = result.get(step if step_type is str else step[0], _MISSING)  # type: ignore
+                    if result is _MISSING:
+                        return default
+                elif result_type is list:
+                    if step_type is str:
+                        return default
+                    result = result[step if step_type is int else step[1]]  # type: ignore
+                elif isinstance(result, Mapping):
+                    if step_type is int:
+                        return default
+                    result = result[step if step_type is str else step[0]]  # type: ignore
+                elif not isinstance(result, str) and isinstance(result, Sequence):
+                    if step_type is str:
+                        return default
+                    result = result[step if step_type is int else step[1]]  # type: ignore
+                else:
+                    return default
+            return result
+        except Exception:
+            return default
+
     @staticmethod
     def locate_path_in_dict(
         original_dict: dict,
@@ -31,47 +128,11 @@ class DataLocator:
     ):
         if path == "" or not isinstance(path, str):
             return original_dict
-        match style:
-            case "dot":
-                try:
-                    result = original_dict
-                    path_parts = path.split(".")
-                    for path_part in path_parts:
-                        if "[" in path_part:
-                            path_key_and_index = path_part.split("[")
-                            path_key = path_key_and_index[0]
-                            path_index = int(path_key_and_index[1][:-1])
-                            if isinstance(result, Mapping):
-                                result = result[path_key]
-                            else:
-                                return default
-                            if not isinstance(result, str) and isinstance(result, Sequence):
-                                result = result[path_index]
-                            else:
-                                return default
-                        else:
-                            if isinstance(result, Mapping):
-                                result = result[path_part]
-                            else:
-                                return default
-                    return result
-                except Exception:
-                    return default
-            case "slash":
-                result = original_dict
-                path_parts = path.split("/")
-                try:
-                    for path_part in path_parts:
-                        if path_part:
-                            if isinstance(result, Mapping):
-                                result = result[path_part]
-                            elif not isinstance(result, str) and isinstance(result, Sequence):
-                                result = result[int(path_part)]
-                            else:
-                                return default
-                    return result
-                except Exception:
-                    return default
+        try:
+            compiled_path = _compile_path(path, style)
+        except ValueError:
+            return default
+        return DataLocator.locate_compiled_path(original_dict, compiled_path, default=default)
 
     @staticmethod
     def locate_all_json(original_text: str) -> list[str]:
@@ -143,7 +204,7 @@ class DataLocator:
                 if index + 1 == len(all_json):
                     break
                 try:
-                    temp = json5.loads(json_string)
+                    temp = JSONLoader.loads(json_string)
                     if isinstance(temp, dict):
                         for key in temp.keys():
                             if key in output_prompt_dict:
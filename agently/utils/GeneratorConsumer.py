@@ -16,7 +16,7 @@ import asyncio
 import threading
 import queue as sync_queue
 from types import AsyncGeneratorType, GeneratorType
-from typing import AsyncGenerator, Generator, cast, Any
+from typing import AsyncGenerator, Callable, Generator, cast, Any
 
 
 class GeneratorConsumer:
@@ -26,12 +26,19 @@ class GeneratorConsumer:
     with history replay, error propagation, and graceful shutdown.
     """
 
-    def __init__(self, original_generator: AsyncGenerator | Generator):
+    def __init__(
+        self,
+        original_generator: AsyncGenerator | Generator,
+        *,
+        history_filter: Callable[[Any], bool] | None = None,
+    ):
         """
         Initialize the consumer with a generator or async generator.
 
         Args:
             original_generator: The original generator to consume.
+            history_filter: Called once per message, return False to keep the message out of the history.
+                Current listeners still receive it, but it is not replayed to later ones or in get_result().
 
         Raises:
             TypeError: If input is neither Generator nor AsyncGenerator.
@@ -45,6 +52,7 @@ class GeneratorConsumer:
 
         self.original_generator = original_generator
         self._history: list = []
+        self._history_filter = history_filter
         self._listeners: list[asyncio.Queue] = []
         self._consume_task: asyncio.Task | None = None
         self._done = asyncio.Event()
@@ -81,7 +89,11 @@ class GeneratorConsumer:
         Args:
             msg: The message, exception, or sentinel object to broadcast.
         """
-        if msg is not self._sentinel and not isinstance(msg, Exception):
+        if (
+            msg is not self._sentinel
+            and not isinstance(msg, Exception)
+            and (self._history_filter is None or self._history_filter(msg))
+        ):
             self._history.append(msg)
 
         for queue in self._listeners:
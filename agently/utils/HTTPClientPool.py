@@ -0,0 +1,78 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from typing import Any
+
+from httpx import AsyncClient
+
+
+class HTTPClientPool:
+    """
+    Share keep-alive httpx.AsyncClient instances between model requests, so requests to the same endpoint
+    reuse open connections instead of paying DNS, TCP and TLS setup every time.
+
+    Clients are keyed by base url and client options (proxy, timeout, limits, ...) and by the running event
+    loop, because connections can not be used across event loops. Clients of closed event loops (e.g. from
+    sync calls that run their own loop) are dropped the next time the pool is used.
+
+    Example:
+        >>> pool = HTTPClientPool()
+        >>> async def main():
+        ...     client = pool.get_client({"timeout": 30}, base_url="https://api.openai.com/v1")
+        ...     assert client is pool.get_client({"timeout": 30}, base_url="https://api.openai.com/v1")
+        ...     await pool.aclose()
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple[int, str, str], tuple[asyncio.AbstractEventLoop, AsyncClient]] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def _drop_closed_loops(self):
+        for key in [key for key, (loop, _) in self._clients.items() if loop.is_closed()]:
+            del self._clients[key]
+
+    def get_client(self, client_options: dict[str, Any], *, base_url: str = "") -> AsyncClient:
+        """
+        Get the shared client for the client options in the running event loop, create it if needed.
+
+        Args:
+            client_options (dict[str, Any]): Keyword arguments of httpx.AsyncClient.
+            base_url (str): The endpoint base url, clients are not shared between endpoints.
+
+        Returns:
+            AsyncClient: The shared client. Do not close it, use aclose() of the pool instead.
+        """
+        loop = asyncio.get_running_loop()
+        self._drop_closed_loops()
+        key = (id(loop), base_url, repr(sorted(client_options.items())))
+        entry = self._clients.get(key)
+        if entry is None or entry[1].is_closed:
+            entry = (loop, AsyncClient(**client_options))
+            self._clients[key] = entry
+        return entry[1]
+
+    async def aclose(self):
+        """
+        Close the clients of the running event loop and forget the clients of other event loops.
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._clients
+        self._clients = {}
+        for client_loop, client in clients.values():
+            if client_loop is loop:
+                await client.aclose()
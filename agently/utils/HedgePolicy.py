@@ -0,0 +1,179 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import threading
+
+from collections import deque
+from typing import Any, Hashable
+
+
+class HedgePolicy:
+    """
+    Decide when a duplicate ("hedged") request is sent for a request whose first event is late.
+
+    The hedge delay is either fixed or adaptive: a percentile of the recent time-to-first-event samples. A
+    budget caps hedging so it can not amplify load during incidents: every request earns `max_hedge_ratio`
+    of a hedge, at most `burst` hedges can be saved up, a hedge is only sent if a whole one is available.
+
+    Like RateLimiter, the policy can be used from any event loop and thread, use get_shared() to get the
+    process-wide policy of an endpoint.
+
+    Example:
+        >>> policy = HedgePolicy(delay=None, initial_delay=2.0, max_hedge_ratio=0.1, burst=1)
+        >>> policy.record_request()
+        >>> policy.get_delay()
+        2.0
+        >>> policy.try_hedge(), policy.try_hedge()
+        (True, False)
+    """
+
+    _shared: dict[Hashable, "HedgePolicy"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        delay: float | None = None,
+        percentile: float = 0.95,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.05,
+        max_delay: float = 30.0,
+        max_hedge_ratio: float = 0.1,
+        burst: float = 3.0,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        """
+        Args:
+            delay (float | None): Fixed seconds to wait for the first event, None for the adaptive delay.
+            percentile (float): Percentile of recent time-to-first-event samples used as the adaptive delay.
+            initial_delay (float): Adaptive delay until `min_samples` samples are recorded.
+            min_delay (float): Lower bound of the adaptive delay.
+            max_delay (float): Upper bound of the adaptive delay.
+            max_hedge_ratio (float): Hedges earned per request, e.g. 0.1 for at most one hedge per 10 requests.
+            burst (float): Maximum hedges that can be saved up.
+            window (int): Number of recent samples kept.
+            min_samples (int): Samples required before the adaptive delay is used.
+        """
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=max(1, int(window)))
+        self._budget = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.suppressed = 0
+        self.configure(
+            delay=delay,
+            percentile=percentile,
+            initial_delay=initial_delay,
+            min_delay=min_delay,
+            max_delay=max_delay,
+            max_hedge_ratio=max_hedge_ratio,
+            burst=burst,
+            window=window,
+            min_samples=min_samples,
+        )
+        self._budget = self.burst
+
+    @classmethod
+    def get_shared(cls, key: Hashable, **options: Any) -> "HedgePolicy":
+        """
+        Get the process-wide policy of a key (e.g. endpoint and model), create it or update its options.
+
+        Args:
+            key (Hashable): The policy key.
+            **options: The keyword arguments of HedgePolicy.
+
+        Returns:
+            HedgePolicy: The shared policy.
+        """
+        with cls._shared_lock:
+            policy = cls._shared.get(key)
+            if policy is None:
+                policy = cls._shared[key] = cls(**options)
+            else:
+                policy.configure(**options)
+            return policy
+
+    def configure(self, **options: Any):
+        """
+        Update options without resetting the samples, counters and budget.
+
+        Args:
+            **options: The keyword arguments of HedgePolicy, unknown keys are ignored.
+        """
+        with self._lock:
+            if "delay" in options:
+                self.delay = float(options["delay"]) if options["delay"] is not None else None
+            for key in ("percentile", "initial_delay", "min_delay", "max_delay", "max_hedge_ratio", "burst"):
+                if key in options:
+                    setattr(self, key, float(options[key]))
+            if "min_samples" in options:
+                self.min_samples = max(1, int(options["min_samples"]))
+            if "window" in options and int(options["window"]) != self._samples.maxlen:
+                self._samples = deque(self._samples, maxlen=max(1, int(options["window"])))
+
+    def get_delay(self) -> float:
+        """
+        Get the seconds to wait for the first event before hedging.
+
+        Returns:
+            float: The fixed delay, or the adaptive delay from recent samples.
+        """
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.initial_delay
+            samples = sorted(self._samples)
+        index = min(len(samples) - 1, max(0, math.ceil(self.percentile * len(samples)) - 1))
+        return min(self.max_delay, max(self.min_delay, samples[index]))
+
+    def record_latency(self, seconds: float):
+        """
+        Record the time to the first event of a request.
+
+        Args:
+            seconds (float): Seconds from the request start to its first event.
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def record_request(self):
+        """
+        Count a new request and earn its share of the hedge budget.
+        """
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self.burst, self._budget + self.max_hedge_ratio)
+
+    def try_hedge(self) -> bool:
+        """
+        Take a hedge from the budget.
+
+        Returns:
+            bool: Whether a hedge may be sent, False if the budget is used up.
+        """
+        with self._lock:
+            if self._budget >= 1:
+                self._budget -= 1
+                self.hedged += 1
+                return True
+            self.suppressed += 1
+            return False
+
+    def record_hedge_win(self):
+        with self._lock:
+            self.hedge_wins += 1
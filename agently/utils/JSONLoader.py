@@ -0,0 +1,75 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import json5
+
+from typing import Any, Literal
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+JSONDecoderName = Literal["auto", "orjson", "json", "json5"]
+
+
+class JSONLoader:
+    """
+    Load JSON text with the fastest decoder available.
+
+    Most model outputs are strict JSON, so strict decoders are tried first ("orjson" if it is installed,
+    otherwise the standard library "json") and the much slower "json5" is only used when they fail.
+    """
+
+    @staticmethod
+    def get_strict_decoder_name() -> Literal["orjson", "json"]:
+        return "orjson" if orjson is not None else "json"
+
+    @staticmethod
+    def loads(text: str | bytes, *, decoder: JSONDecoderName = "auto") -> Any:
+        """
+        Load JSON text.
+
+        Args:
+            text (str | bytes): The JSON text.
+            decoder (Literal["auto", "orjson", "json", "json5"]): The decoder to try first.
+                "auto" tries "orjson" if installed, otherwise "json". "json5" skips the strict decoders.
+                Strict decoders always fall back to "json5" when the text is not strict JSON.
+
+        Returns:
+            Any: The loaded data.
+
+        Raises:
+            ValueError: If the text can not be loaded by json5 either.
+        """
+        if decoder == "auto":
+            decoder = JSONLoader.get_strict_decoder_name()
+        try:
+            match decoder:
+                case "orjson":
+                    if orjson is None:
+                        raise ImportError(
+                            "Required module not found: orjson\n"
+                            "Please install module manually using command: 'pip install orjson'"
+                        )
+                    return orjson.loads(text)
+                case "json":
+                    return json.loads(text)
+        except ValueError:
+            # orjson.JSONDecodeError and json.JSONDecodeError are both ValueError
+            pass
+        if isinstance(text, bytes):
+            text = text.decode()
+        return json5.loads(text)
@@ -0,0 +1,199 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+
+from collections import deque
+from typing import Any, Hashable
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def get_wait(self, cost: float) -> float:
+        return max(0.0, (min(cost, self.capacity) - self.tokens) / self.rate)
+
+
+class _Waiter:
+    __slots__ = ("loop", "turn", "tokens")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, tokens: float):
+        self.loop = loop
+        self.turn = loop.create_future()
+        self.tokens = tokens
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute, shared by every request that uses it.
+
+    Requests queue in FIFO order instead of failing: only the head of the queue takes from the buckets, the
+    others wait for their turn. Token costs are estimated up front and corrected with correct() once the real
+    usage is known, a negative balance delays the next requests.
+
+    The limiter can be used from any event loop and thread, use get_shared() to get the process-wide limiter
+    of an endpoint.
+
+    Example:
+        >>> limiter = RateLimiter.get_shared(("https://api.openai.com/v1", "gpt-4.1"), requests_per_minute=60)
+        >>> async def request():
+        ...     waited = await limiter.acquire(tokens=1200)
+        ...     ...
+        ...     limiter.correct(1200, 950)
+    """
+
+    _shared: dict[Hashable, "RateLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, *, requests_per_minute: float | None = None, tokens_per_minute: float | None = None):
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+        self._request_bucket: _TokenBucket | None = None
+        self._token_bucket: _TokenBucket | None = None
+        self.set_limits(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+
+    @classmethod
+    def get_shared(
+        cls,
+        key: Hashable,
+        *,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ) -> "RateLimiter":
+        """
+        Get the process-wide limiter of a key (e.g. endpoint and model), create it or update its limits.
+
+        Args:
+            key (Hashable): The limiter key.
+            requests_per_minute (float | None): Requests per minute, None for no limit.
+            tokens_per_minute (float | None): Estimated tokens per minute, None for no limit.
+
+        Returns:
+            RateLimiter: The shared limiter.
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls._shared[key] = cls(
+                    requests_per_minute=requests_per_minute,
+                    tokens_per_minute=tokens_per_minute,
+                )
+            else:
+                limiter.set_limits(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+            return limiter
+
+    def set_limits(self, *, requests_per_minute: float | None = None, tokens_per_minute: float | None = None):
+        with self._lock:
+            if self._request_bucket is None or self._request_bucket.capacity != requests_per_minute:
+                self._request_bucket = _TokenBucket(requests_per_minute) if requests_per_minute else None
+            if self._token_bucket is None or self._token_bucket.capacity != tokens_per_minute:
+                self._token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _try_take(self, tokens: float) -> float:
+        # Take from the buckets if possible, otherwise return the seconds to wait
+        now = time.monotonic()
+        wait = 0.0
+        for bucket, cost in ((self._request_bucket, 1.0), (self._token_bucket, tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                wait = max(wait, bucket.get_wait(cost))
+        if wait > 0:
+            return wait
+        if self._request_bucket is not None:
+            self._request_bucket.tokens -= 1
+        if self._token_bucket is not None:
+            self._token_bucket.tokens -= min(tokens, self._token_bucket.capacity)
+        return 0.0
+
+    def _remove(self, waiter: _Waiter):
+        # Must be called with the lock held
+        was_head = bool(self._waiters) and self._waiters[0] is waiter
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        if was_head:
+            self._wake_head()
+
+    def _wake_head(self):
+        # Must be called with the lock held
+        while self._waiters:
+            waiter = self._waiters[0]
+            try:
+                waiter.loop.call_soon_threadsafe(_set_turn, waiter.turn)
+                return
+            except RuntimeError:
+                # The event loop of the waiter is closed
+                self._waiters.popleft()
+
+    async def acquire(self, tokens: float = 0) -> float:
+        """
+        Wait in the queue until one request and the estimated tokens can be taken.
+
+        Args:
+            tokens (float): The estimated tokens of the request, capped at the tokens per minute.
+
+        Returns:
+            float: Seconds waited.
+        """
+        started = time.monotonic()
+        waiter = _Waiter(asyncio.get_running_loop(), tokens)
+        with self._lock:
+            self._waiters.append(waiter)
+            if self._waiters[0] is waiter:
+                waiter.turn.set_result(None)
+        try:
+            await waiter.turn
+            while True:
+                with self._lock:
+                    wait = self._try_take(tokens)
+                    if wait == 0:
+                        self._remove(waiter)
+                        return time.monotonic() - started
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._lock:
+                self._remove(waiter)
+            raise
+
+    def correct(self, estimated_tokens: float, actual_tokens: float):
+        """
+        Correct the token balance with the real usage after a request is done.
+
+        Args:
+            estimated_tokens (float): The tokens passed to acquire().
+            actual_tokens (float): The tokens reported by the model usage.
+        """
+        with self._lock:
+            if self._token_bucket is not None:
+                self._token_bucket.tokens -= actual_tokens - min(estimated_tokens, self._token_bucket.capacity)
+
+
+def _set_turn(turn: "asyncio.Future[Any]"):
+    if not turn.done():
+        turn.set_result(None)
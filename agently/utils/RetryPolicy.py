@@ -0,0 +1,173 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, Mapping
+
+from httpx import ConnectError, ConnectTimeout, PoolTimeout, ReadError, ReadTimeout, RemoteProtocolError
+
+_CONNECT_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+_READ_ERRORS = (ReadError, ReadTimeout, RemoteProtocolError)
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed HTTP request is retried: exponential backoff with jitter, `Retry-After`
+    headers, retryable status codes, connect / read errors and a deadline for all attempts together.
+
+    The policy only computes delays, the caller awaits them with asyncio.sleep() so the event loop is never
+    blocked.
+
+    Example:
+        >>> policy = RetryPolicy(max_attempts=3, initial_delay=1.0, jitter=False)
+        >>> started = time.monotonic()
+        >>> policy.get_delay(1, started)
+        1.0
+        >>> policy.get_delay(2, started, retry_after="5")
+        5.0
+        >>> policy.get_delay(3, started) is None
+        True
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        deadline: float | None = None,
+        status_codes: Iterable[int] = (429, 500, 502, 503, 504),
+        on_connect_error: bool = True,
+        on_read_error: bool = True,
+    ):
+        """
+        Args:
+            max_attempts (int): Maximum attempts including the first one, 1 disables retries.
+            initial_delay (float): Backoff delay in seconds before the second attempt.
+            max_delay (float): Upper bound of the backoff delay in seconds, `Retry-After` is not capped by it.
+            multiplier (float): Backoff growth factor between attempts.
+            jitter (bool): Pick a random delay between 0 and the backoff delay ("full jitter") so clients that
+                failed together do not retry together.
+            deadline (float | None): Maximum seconds from the first attempt, no retry is started if its delay
+                would end after the deadline. None for no deadline.
+            status_codes (Iterable[int]): Response status codes to retry.
+            on_connect_error (bool): Retry connect errors and timeouts.
+            on_read_error (bool): Retry read errors, read timeouts and broken connections.
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.initial_delay = float(initial_delay)
+        self.max_delay = float(max_delay)
+        self.multiplier = float(multiplier)
+        self.jitter = jitter
+        self.deadline = float(deadline) if deadline is not None else None
+        self.status_codes = frozenset(int(status_code) for status_code in status_codes)
+        self.on_connect_error = on_connect_error
+        self.on_read_error = on_read_error
+
+    @classmethod
+    def from_settings(cls, retry_settings: Mapping[str, Any] | None) -> "RetryPolicy":
+        """
+        Build a policy from a settings dict, unknown keys are ignored.
+
+        Args:
+            retry_settings (Mapping[str, Any] | None): Keys are the keyword arguments of RetryPolicy.
+
+        Returns:
+            RetryPolicy: The retry policy.
+        """
+        retry_settings = retry_settings or {}
+        kwargs = {
+            key: retry_settings[key]
+            for key in (
+                "max_attempts",
+                "initial_delay",
+                "max_delay",
+                "multiplier",
+                "jitter",
+                "deadline",
+                "status_codes",
+                "on_connect_error",
+                "on_read_error",
+            )
+            if key in retry_settings
+        }
+        return cls(**kwargs)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.status_codes
+
+    def is_retryable_error(self, error: BaseException) -> bool:
+        return (self.on_connect_error and isinstance(error, _CONNECT_ERRORS)) or (
+            self.on_read_error and isinstance(error, _READ_ERRORS)
+        )
+
+    @staticmethod
+    def parse_retry_after(retry_after: str | None) -> float | None:
+        """
+        Parse a `Retry-After` header value: delay seconds or an HTTP date.
+
+        Args:
+            retry_after (str | None): The header value.
+
+        Returns:
+            float | None: Seconds to wait, None if the value is missing or invalid.
+        """
+        if not retry_after:
+            return None
+        retry_after = retry_after.strip()
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def get_delay(
+        self,
+        attempt: int,
+        started: float,
+        *,
+        retry_after: str | None = None,
+        min_delay: float = 0.0,
+    ) -> float | None:
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            attempt (int): The number of the attempt that just failed, starting from 1.
+            started (float): time.monotonic() of the first attempt.
+            retry_after (str | None): The `Retry-After` header of the failed response, it replaces the backoff delay.
+            min_delay (float): Lower bound of the delay, e.g. the reconnection time sent by an SSE server.
+
+        Returns:
+            float | None: Seconds to wait before retrying, None if no more attempts are allowed.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+        delay = max(delay, min_delay)
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return None
+        return delay
@@ -0,0 +1,131 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from httpx_sse import ServerSentEvent
+
+
+class SSEByteDecoder:
+    """
+    Decode server-sent events directly from the response byte stream.
+
+    Lines are split on bytes and only the data of complete events is decoded to text, instead of decoding
+    and line-splitting the whole stream as text first. Supports the "event", "data", "id" and "retry"
+    fields, comments, multi-line data and "\\r\\n" line endings.
+
+    Example:
+        >>> decoder = SSEByteDecoder()
+        >>> [event.data for event in decoder.feed(b'data: {"a": 1}\\n\\ndata: [DO')]
+        ['{"a": 1}']
+        >>> decoder.feed(b"NE]\\n\\n")[0].data
+        '[DONE]'
+    """
+
+    def __init__(self):
+        self._buffer = b""
+        self._event = ""
+        self._data: list[bytes] = []
+        self._id = ""
+        self._retry: int | None = None
+
+    def _dispatch(self, events: list[ServerSentEvent]):
+        if self._data:
+            data = self._data[0] if len(self._data) == 1 else b"\n".join(self._data)
+            events.append(
+                ServerSentEvent(
+                    event=self._event or "message",
+                    data=data.decode(),
+                    id=self._id,
+                    retry=self._retry,
+                )
+            )
+        self._event = ""
+        self._data = []
+        self._retry = None
+
+    def _decode_lines(self, lines: list[bytes], has_cr: bool = True) -> list[ServerSentEvent]:
+        events: list[ServerSentEvent] = []
+        for line in lines:
+            if has_cr and line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                self._dispatch(events)
+                continue
+            if line.startswith(b"data:"):
+                # Fast path for the most common field
+                value = line[5:]
+                self._data.append(value[1:] if value.startswith(b" ") else value)
+                continue
+            if line.startswith(b":"):
+                continue
+            field, _, value = line.partition(b":")
+            if value.startswith(b" "):
+                value = value[1:]
+            match field:
+                case b"event":
+                    self._event = value.decode()
+                case b"id":
+                    if b"\0" not in value:
+                        self._id = value.decode()
+                case b"retry":
+                    try:
+                        self._retry = int(value)
+                    except ValueError:
+                        pass
+        return events
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        """
+        Decode a new chunk of the response body.
+
+        Args:
+            chunk (bytes): The new bytes.
+
+        Returns:
+            list[ServerSentEvent]: The events completed by this chunk.
+        """
+        if (
+            not self._buffer
+            and not self._data
+            and not self._event
+            and chunk.startswith(b"data:")
+            and chunk.endswith(b"\n\n")
+            and chunk.count(b"\n") == 2
+            and b"\r" not in chunk
+        ):
+            # Fast path for the most common chunk: exactly one event with a single data line
+            data = chunk[5:-2]
+            if data.startswith(b" "):
+                data = data[1:]
+            event = ServerSentEvent(event="message", data=data.decode(), id=self._id, retry=self._retry)
+            self._retry = None
+            return [event]
+        if b"\n" not in chunk:
+            self._buffer += chunk
+            return []
+        if self._buffer:
+            chunk = self._buffer + chunk
+        lines = chunk.split(b"\n")
+        self._buffer = lines.pop()
+        return self._decode_lines(lines, b"\r" in chunk)
+
+    def flush(self) -> list[ServerSentEvent]:
+        """
+        Decode the rest at the end of the response body, an unterminated last event is dispatched too.
+
+        Returns:
+            list[ServerSentEvent]: The remaining events.
+        """
+        lines = [self._buffer, b""] if self._buffer else [b""]
+        self._buffer = b""
+        return self._decode_lines(lines)
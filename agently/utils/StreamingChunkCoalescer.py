@@ -0,0 +1,90 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from typing import Any
+
+_BOUNDARY_CHARS = frozenset("\"',[]{}")
+
+
+class StreamingChunkCoalescer:
+    """
+    Buffer small streamed chunks and release them together, so a streaming parser runs once per
+    meaningful piece of text instead of once per one-or-two-character delta.
+
+    Modes:
+        None / False: no buffering, every chunk is released immediately.
+        "boundary" / True: release when a chunk contains a structural boundary (quote, comma, bracket or brace).
+        {"min_chars": N, "max_latency_ms": M, "boundary": bool}: release when at least N characters are
+            buffered, or M milliseconds have passed since the first buffered chunk, or (if "boundary" is True)
+            at a structural boundary. The latency is checked when the next chunk arrives.
+    """
+
+    def __init__(self, mode: Any = None):
+        self.buffer = ""
+        self._first_buffered_at = 0.0
+        self.min_chars: int | None = None
+        self.max_latency: float | None = None
+        self.boundary = False
+        self.enabled = True
+        match mode:
+            case None | False:
+                self.enabled = False
+            case True | "boundary":
+                self.boundary = True
+            case dict():
+                self.min_chars = mode.get("min_chars", None)
+                max_latency_ms = mode.get("max_latency_ms", None)
+                self.max_latency = max_latency_ms / 1000 if max_latency_ms is not None else None
+                self.boundary = bool(mode.get("boundary", False))
+            case _:
+                raise ValueError(
+                    "Streaming parse coalesce mode must be None, 'boundary' or a dict with 'min_chars' / "
+                    f"'max_latency_ms', got: { mode }"
+                )
+
+    def push(self, chunk: str) -> str | None:
+        """
+        Add a chunk to the buffer.
+
+        Args:
+            chunk (str): The streamed chunk.
+
+        Returns:
+            str | None: The buffered text if it should be released now, otherwise None.
+        """
+        if not self.enabled:
+            return chunk
+        if not self.buffer:
+            self._first_buffered_at = time.monotonic()
+        self.buffer += chunk
+        if (
+            (self.boundary and not _BOUNDARY_CHARS.isdisjoint(chunk))
+            or (self.min_chars is not None and len(self.buffer) >= self.min_chars)
+            or (self.max_latency is not None and time.monotonic() - self._first_buffered_at >= self.max_latency)
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> str:
+        """
+        Release everything buffered.
+
+        Returns:
+            str: The buffered text, empty if nothing is buffered.
+        """
+        buffer = self.buffer
+        self.buffer = ""
+        return buffer
@@ -16,36 +16,48 @@ class StreamingJSONCompleter:
     """
     StreamingJSONCompleter: A utility for streaming JSON strings that may arrive in fragments.
     It detects incomplete JSON objects/arrays/strings/comments and attempts to intelligently complete them.
+
+    Scanner state (bracket stack, string/escape/comment state and scan offset) is kept between
+    `append()` calls, so every character is visited only once no matter how many times `complete()`
+    is called during a stream.
     """
 
+    _CLOSING = {"{": "}", "[": "]"}
+
     def __init__(self) -> None:
         """Initialize an empty buffer."""
-        self._buffer = ""
+        self.reset()
 
     def reset(self, data: str = "") -> None:
         """Replace the internal buffer with new data."""
         self._buffer = data
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._comment: str | None = None  # None, "//", or "/*"
+        self._string_char: str | None = None  # Quote character to track string termination
+        self._scan_pos = 0
+        self._closed_at: int | None = None  # End offset of the first complete root structure
 
     def append(self, data: str) -> None:
         """Append data to the internal buffer."""
         self._buffer += data
 
-    def complete(self) -> str:
-        """
-        Attempt to complete a partial JSON string by closing unclosed brackets, strings, or comments.
-        Returns a completed JSON string.
-        """
+    def _scan(self) -> None:
+        """Scan the characters appended since the last call and update scanner state."""
+        if self._closed_at is not None:
+            return
         buf = self._buffer
-        stack = []
-        i = 0
-        in_string = False
-        escape = False
-        comment = None  # None, "//", or "/*"
-        string_char = None  # Quote character to track string termination
+        length = len(buf)
+        i = self._scan_pos
+        stack = self._stack
+        in_string = self._in_string
+        escape = self._escape
+        comment = self._comment
+        string_char = self._string_char
 
-        while i < len(buf):
+        while i < length:
             ch = buf[i]
-            next_ch = buf[i + 1] if i + 1 < len(buf) else ""
 
             if comment is None:
                 if in_string:
@@ -59,64 +71,78 @@ class StreamingJSONCompleter:
                 elif ch in "\"'":
                     in_string = True
                     string_char = ch
-                elif ch == "/" and next_ch == "/":
-                    comment = "//"
-                    i += 1
-                elif ch == "/" and next_ch == "*":
-                    comment = "/*"
-                    i += 1
+                elif ch == "/":
+                    if i + 1 >= length:
+                        # Wait for the next character to decide whether a comment starts here
+                        break
+                    next_ch = buf[i + 1]
+                    if next_ch == "/":
+                        comment = "//"
+                        i += 1
+                    elif next_ch == "*":
+                        comment = "/*"
+                        i += 1
                 elif ch in "{[":
                     stack.append(ch)
                 elif ch in "}]":
-                    if not stack:
-                        # Ignore unmatched closing bracket
-                        i += 1
-                        continue
-                    opener = stack[-1]
-                    if (opener == "{" and ch == "}") or (opener == "[" and ch == "]"):
+                    if stack and self._CLOSING[stack[-1]] == ch:
                         stack.pop()
-                        if not stack and not in_string and comment is None:
+                        if not stack:
                             # Complete JSON structure found
-                            result = buf[: i + 1]
-                            return result
-                    else:
-                        # Ignore mismatched closing bracket
-                        i += 1
-                        continue
-            else:
-                if comment == "//":
-                    if ch in "\n\r":
-                        comment = None
-                elif comment == "/*":
-                    if ch == "*" and next_ch == "/":
-                        comment = None
-                        i += 1
+                            self._closed_at = i + 1
+                            i += 1
+                            break
+                    # Ignore unmatched or mismatched closing bracket
+            elif comment == "//":
+                if ch in "\n\r":
+                    comment = None
+            elif ch == "*":
+                if i + 1 >= length:
+                    # Wait for the next character to decide whether the comment ends here
+                    break
+                if buf[i + 1] == "/":
+                    comment = None
+                    i += 1
 
             i += 1
 
-        # Attempt to complete unterminated structures
+        self._scan_pos = i
+        self._in_string = in_string
+        self._escape = escape
+        self._comment = comment
+        self._string_char = string_char
 
+    def complete_suffix(self) -> str:
+        """
+        Return only the text that must be appended to the current buffer to close unterminated
+        strings, comments and brackets. Returns an empty string if the buffer already contains a
+        complete root structure (see `complete()` for the truncated result in that case).
+        """
+        self._scan()
+        if self._closed_at is not None:
+            return ""
+        suffix = ""
         # Close unterminated string
-        if in_string and string_char is not None:
-            buf += string_char
-            in_string = False
-            string_char = None
-
+        if self._in_string and self._string_char is not None:
+            suffix += self._string_char
         # Close unterminated comment
-        if comment == "//":
+        if self._comment == "//":
             # Assume end of line for single-line comment
-            buf += "\n"
-            comment = None
-        elif comment == "/*":
+            suffix += "\n"
+        elif self._comment == "/*":
             # Close multi-line comment
-            buf += "*/"
-            comment = None
-
+            suffix += "*/"
         # Close unbalanced brackets
-        if stack:
-            closing = {"{": "}", "[": "]"}
-            completion = "".join(closing[ch] for ch in reversed(stack))
-            buf += completion
-            stack.clear()
+        if self._stack:
+            suffix += "".join(self._CLOSING[ch] for ch in reversed(self._stack))
+        return suffix
 
-        return buf
+    def complete(self) -> str:
+        """
+        Attempt to complete a partial JSON string by closing unclosed brackets, strings, or comments.
+        Returns a completed JSON string.
+        """
+        suffix = self.complete_suffix()
+        if self._closed_at is not None:
+            return self._buffer[: self._closed_at]
+        return self._buffer + suffix
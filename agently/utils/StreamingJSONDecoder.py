@@ -0,0 +1,466 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import math
+from typing import Any
+
+_WHITESPACE = frozenset(" \t\n\r\v\f\ufeff\u00a0\u2028\u2029")
+_SCALAR_RUN = re.compile(r"[0-9A-Za-z_$+\-.]+")
+_IDENTIFIER_RUN = re.compile(r"[^\s:{}\[\],\"'/]+")
+_STRING_RUNS = {
+    '"': re.compile(r'[^"\\]+'),
+    "'": re.compile(r"[^'\\]+"),
+}
+_DECIMAL = re.compile(r"[+-]?(?:\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)")
+_HEXADECIMAL = re.compile(r"[+-]?0[xX][0-9a-fA-F]+")
+_LITERALS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "Infinity": math.inf,
+    "+Infinity": math.inf,
+    "-Infinity": -math.inf,
+    "NaN": math.nan,
+    "+NaN": math.nan,
+    "-NaN": math.nan,
+}
+_ESCAPES = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "b": "\b",
+    "f": "\f",
+    "v": "\v",
+    "0": "\0",
+}
+
+
+class StreamingJSONDecodeError(ValueError):
+    pass
+
+
+class StreamingJSONDecoder:
+    """
+    StreamingJSONDecoder: A push-style JSON5 decoder for text that arrives in fragments.
+
+    Every character is consumed exactly once. The partially decoded value is updated in place in
+    `value` and every `feed()` returns the token-level changes it produced, so callers never need to
+    re-parse or diff the accumulated text.
+
+    Leading text before the first '{' or '[' is skipped, and if the block turns out not to be valid
+    JSON5 it is dropped and the decoder starts looking for the next block again. Everything after the
+    root value has been closed is ignored.
+
+    Changes are lists whose first item is the change kind:
+        - ["string", path, delta, value]: text was appended to the string at `path` (the delta is empty
+          when the string has just been opened)
+        - ["scalar", path, value, token]: a number / boolean / null token at `path` is complete
+        - ["open", path, container]: a dict or list was opened at `path`
+        - ["close", path]: the value at `path` will not change any more
+        - ["reset"]: the current block was invalid and has been dropped
+
+    Paths are dot-style paths such as 'items[0].title'. The root path is ''.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all decoded data and wait for a new root value."""
+        self.value: Any = None
+        self.is_complete = False
+        self._state = "seek"
+        self._return_state = "seek"
+        self._containers: list[dict | list] = []
+        self._keys: list[str | int] = []
+        self._paths: list[str] = []
+        self._value_path = ""
+        self._changes: list[list] = []
+        self._token = ""
+        self._string = ""
+        self._string_is_key = False
+        self._quote = '"'
+        self._triple = False
+        self._pending_quotes = 0
+        self._escape = ""
+        self._escape_digits = ""
+        self._high_surrogate = ""
+        self._comment = ""
+        self._skip_next = False
+
+    # Tree helpers
+    def _child_path(self, key: str | int) -> str:
+        parent_path = self._paths[-1]
+        if isinstance(key, int):
+            return f"{ parent_path }[{ key }]"
+        return f"{ parent_path }.{ key }" if parent_path else key
+
+    def _attach(self, value: Any) -> str:
+        if not self._containers:
+            self.value = value
+            self._value_path = ""
+            return ""
+        container = self._containers[-1]
+        if isinstance(container, dict):
+            container[self._keys[-1]] = value
+        else:
+            container.append(value)
+            self._keys[-1] = len(container) - 1
+        self._value_path = self._child_path(self._keys[-1])
+        return self._value_path
+
+    def _open_container(self, container: dict | list):
+        path = self._attach(container)
+        self._containers.append(container)
+        self._keys.append("" if isinstance(container, dict) else -1)
+        self._paths.append(path)
+        self._changes.append(["open", path, container])
+        self._state = "key" if isinstance(container, dict) else "value"
+
+    def _close_container(self):
+        self._containers.pop()
+        self._keys.pop()
+        path = self._paths.pop()
+        self._changes.append(["close", path])
+        if self._containers:
+            self._state = "after_value"
+        else:
+            self.is_complete = True
+            self._state = "done"
+
+    def _set_string(self, text: str):
+        if not text:
+            return
+        self._string += text
+        if self._string_is_key:
+            return
+        self._containers[-1][self._keys[-1]] = self._string  # type: ignore
+        last_change = self._changes[-1] if self._changes else None
+        if last_change is not None and last_change[0] == "string" and last_change[1] == self._value_path:
+            last_change[2] += text
+            last_change[3] = self._string
+        else:
+            self._changes.append(["string", self._value_path, text, self._string])
+
+    def _end_string(self):
+        if self._high_surrogate:
+            high_surrogate, self._high_surrogate = self._high_surrogate, ""
+            self._set_string(high_surrogate)
+        if self._string_is_key:
+            self._keys[-1] = self._string
+            self._state = "colon"
+        else:
+            self._changes.append(["close", self._value_path])
+            self._state = "after_value"
+        self._string = ""
+        self._triple = False
+        self._pending_quotes = 0
+
+    def _end_scalar(self):
+        token, self._token = self._token, ""
+        if token in _LITERALS:
+            value = _LITERALS[token]
+        elif _HEXADECIMAL.fullmatch(token):
+            value = int(token, 16)
+        elif _DECIMAL.fullmatch(token):
+            value = float(token) if any(c in token for c in ".eE") else int(token)
+        else:
+            raise StreamingJSONDecodeError(f"Unexpected token: '{ token }'")
+        path = self._attach(value)
+        self._changes.append(["scalar", path, value, token])
+        self._changes.append(["close", path])
+        self._state = "after_value"
+
+    def _begin_value(self, ch: str):
+        if ch == "{":
+            self._open_container({})
+        elif ch == "[":
+            self._open_container([])
+        elif ch == '"' or ch == "'":
+            path = self._attach("")
+            self._changes.append(["string", path, "", ""])
+            self._string = ""
+            self._string_is_key = False
+            self._quote = ch
+            self._state = "string"
+        elif _SCALAR_RUN.match(ch):
+            self._token = ch
+            self._state = "scalar"
+        else:
+            raise StreamingJSONDecodeError(f"Unexpected character: '{ ch }'")
+
+    def _decode_escape(self, ch: str) -> str:
+        escape = self._escape
+        if escape == "\\":
+            if ch == "u" or ch == "x":
+                self._escape = ch
+                self._escape_digits = ""
+                return ""
+            self._escape = ""
+            if ch in "\n\r\u2028\u2029":
+                # Line continuation
+                return ""
+            return _ESCAPES.get(ch, ch)
+        self._escape_digits += ch
+        if len(self._escape_digits) < (4 if escape == "u" else 2):
+            return ""
+        digits, self._escape_digits = self._escape_digits, ""
+        self._escape = ""
+        try:
+            code_point = int(digits, 16)
+        except ValueError:
+            return f"\\{ escape }{ digits }"
+        if 0xD800 <= code_point <= 0xDBFF:
+            self._high_surrogate = chr(code_point)
+            return ""
+        if 0xDC00 <= code_point <= 0xDFFF and self._high_surrogate:
+            high_surrogate, self._high_surrogate = ord(self._high_surrogate), ""
+            return chr(0x10000 + ((high_surrogate - 0xD800) << 10) + (code_point - 0xDC00))
+        return chr(code_point)
+
+    def copy_open_containers(self) -> list[dict | list]:
+        """
+        Copy the chain of containers that are still open, outermost first, so that the copied root
+        will not be changed by later feeds. Closed values are shared with `value` instead of copied
+        because the decoder never changes them again.
+
+        Returns:
+            list[dict | list]: The copies of the open containers, empty if the root is complete.
+        """
+        copies: list[dict | list] = []
+        child_copy = None
+        for container, key in zip(reversed(self._containers), reversed(self._keys)):
+            container_copy = container.copy()
+            if child_copy is not None:
+                container_copy[key] = child_copy  # type: ignore
+            copies.append(container_copy)
+            child_copy = container_copy
+        copies.reverse()
+        return copies
+
+    def _fail(self):
+        self.value = None
+        self._containers.clear()
+        self._keys.clear()
+        self._paths.clear()
+        self._token = ""
+        self._string = ""
+        self._triple = False
+        self._pending_quotes = 0
+        self._escape = ""
+        self._high_surrogate = ""
+        self._comment = ""
+        self._changes.append(["reset"])
+        self._state = "seek"
+
+    # Main loop
+    def feed(self, text: str) -> list[list]:
+        """
+        Consume a new fragment of text.
+
+        Returns:
+            list[list]: The changes produced by this fragment, in document order.
+        """
+        i = 0
+        length = len(text)
+        while i < length:
+            state = self._state
+            ch = text[i]
+            try:
+                if state == "string":
+                    if self._escape:
+                        self._set_string(self._decode_escape(ch))
+                        i += 1
+                        continue
+                    if self._pending_quotes and ch != '"':
+                        pending_quotes, self._pending_quotes = self._pending_quotes, 0
+                        self._set_string('"' * pending_quotes)
+                    if ch == "\\":
+                        self._escape = "\\"
+                        i += 1
+                        continue
+                    if ch == self._quote:
+                        i += 1
+                        if self._triple:
+                            self._pending_quotes += 1
+                            if self._pending_quotes == 3:
+                                self._end_string()
+                        elif ch == '"' and not self._string and not self._string_is_key:
+                            # Could be an empty string or the start of a """triple quoted""" string
+                            self._state = "quote_pair"
+                        else:
+                            self._end_string()
+                        continue
+                    run = _STRING_RUNS[self._quote].match(text, i)
+                    if self._high_surrogate:
+                        high_surrogate, self._high_surrogate = self._high_surrogate, ""
+                        self._set_string(high_surrogate)
+                    if run:
+                        self._set_string(run.group())
+                        i = run.end()
+                    continue
+
+                if state == "seek":
+                    i += 1
+                    if self._skip_next:
+                        self._skip_next = False
+                    elif ch == "\\":
+                        self._skip_next = True
+                    elif ch == "{" or ch == "[":
+                        self._begin_value(ch)
+                    continue
+
+                if state == "done":
+                    break
+
+                if state == "comment":
+                    i = self._feed_comment(text, i)
+                    continue
+
+                if state == "scalar":
+                    run = _SCALAR_RUN.match(text, i)
+                    if run:
+                        self._token += run.group()
+                        i = run.end()
+                        if i >= length:
+                            break
+                    self._end_scalar()
+                    continue
+
+                if state == "quote_pair":
+                    if ch == '"':
+                        self._triple = True
+                        self._state = "string"
+                        i += 1
+                    else:
+                        self._end_string()
+                    continue
+
+                if ch in _WHITESPACE:
+                    i += 1
+                    continue
+
+                if ch == "/":
+                    self._return_state = state
+                    self._comment = "/"
+                    self._state = "comment"
+                    i += 1
+                    continue
+
+                if state == "value":
+                    if ch == "]" and isinstance(self._containers[-1], list):
+                        self._close_container()
+                    else:
+                        self._begin_value(ch)
+                    i += 1
+                elif state == "after_value":
+                    if ch == ",":
+                        self._state = "key" if isinstance(self._containers[-1], dict) else "value"
+                    elif ch == ("}" if isinstance(self._containers[-1], dict) else "]"):
+                        self._close_container()
+                    else:
+                        raise StreamingJSONDecodeError(f"Unexpected character: '{ ch }'")
+                    i += 1
+                elif state == "key":
+                    if ch == "}":
+                        self._close_container()
+                        i += 1
+                    elif ch == '"' or ch == "'":
+                        self._string = ""
+                        self._string_is_key = True
+                        self._quote = ch
+                        self._state = "string"
+                        i += 1
+                    else:
+                        run = _IDENTIFIER_RUN.match(text, i)
+                        if not run:
+                            raise StreamingJSONDecodeError(f"Unexpected character: '{ ch }'")
+                        self._token = ""
+                        self._state = "identifier"
+                elif state == "identifier":
+                    run = _IDENTIFIER_RUN.match(text, i)
+                    if run:
+                        self._token += run.group()
+                        i = run.end()
+                        continue
+                    self._keys[-1], self._token = self._token, ""
+                    self._state = "colon"
+                elif state == "colon":
+                    if ch != ":":
+                        raise StreamingJSONDecodeError(f"Unexpected character: '{ ch }'")
+                    self._string_is_key = False
+                    self._state = "value"
+                    i += 1
+            except StreamingJSONDecodeError:
+                # Drop the broken block and look for the next one from the current character
+                self._fail()
+        changes, self._changes = self._changes, []
+        return changes
+
+    def _feed_comment(self, text: str, i: int) -> int:
+        comment = self._comment
+        if comment == "/":
+            ch = text[i]
+            if ch == "/":
+                self._comment = "//"
+            elif ch == "*":
+                self._comment = "/*"
+            else:
+                raise StreamingJSONDecodeError(f"Unexpected character: '/'")
+            return i + 1
+        if comment == "//":
+            for index in range(i, len(text)):
+                if text[index] in "\n\r":
+                    self._comment = ""
+                    self._state = self._return_state
+                    return index + 1
+            return len(text)
+        if comment == "/**":
+            if text[i] == "/":
+                self._comment = ""
+                self._state = self._return_state
+                return i + 1
+            self._comment = "/*"
+            if text[i] == "*":
+                self._comment = "/**"
+                return i + 1
+        end = text.find("*/", i)
+        if end >= 0:
+            self._comment = ""
+            self._state = self._return_state
+            return end + 2
+        if text.endswith("*"):
+            self._comment = "/**"
+        return len(text)
+
+    def finish(self) -> list[list]:
+        """
+        Flush tokens that can only be completed by the end of the input, such as a trailing number.
+
+        Returns:
+            list[list]: The changes produced by flushing.
+        """
+        try:
+            if self._state == "scalar" and self._token:
+                self._end_scalar()
+            elif self._state == "quote_pair":
+                self._end_string()
+            elif self._state == "identifier":
+                self._keys[-1], self._token = self._token, ""
+                self._state = "colon"
+        except StreamingJSONDecodeError:
+            pass
+        changes, self._changes = self._changes, []
+        return changes
@@ -0,0 +1,129 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Iterable
+
+from agently.types.data import StreamingData
+from .JSONLoader import JSONLoader, JSONDecoderName
+
+_INVALID = object()
+
+
+class StreamingJSONLinesParser:
+    """
+    Parse streamed JSON Lines output ("jsonl" output format) record by record.
+
+    Every line starting with "{" is a record. It is loaded and emitted as a complete "done" event as soon as
+    its newline arrives, so only the current unfinished line is buffered and no growing tree is kept. Other
+    lines (prose, code fences, "[OUTPUT]") are ignored, and record lines that can not be loaded are kept in
+    `invalid_lines`.
+
+    The interface matches StreamingJSONParser.parse_chunk_sync() / finalize_sync(). Events use the path
+    "[<record index>]" and carry no `full_data`.
+
+    Example:
+        >>> parser = StreamingJSONLinesParser()
+        >>> parser.parse_chunk_sync('{"id": 1}\\n{"id"')[0].value
+        {'id': 1}
+        >>> parser.finalize_sync()[0].path
+        '[1]'
+    """
+
+    def __init__(self, *, paths: Iterable[str] | None = None, decoder: JSONDecoderName = "auto"):
+        """
+        Args:
+            paths (Iterable[str] | None): Record paths to emit events for, like "[0]" or "[*]".
+                Subscribe all records if None.
+            decoder (Literal["auto", "orjson", "json", "json5"]): The decoder passed to JSONLoader.loads().
+        """
+        self.subscribed_paths = set(paths) if paths is not None else None
+        self.decoder: JSONDecoderName = decoder
+        self.buffer = ""
+        self.record_count = 0
+        self.invalid_lines: list[str] = []
+
+    @staticmethod
+    def loads(text: str, *, decoder: JSONDecoderName = "auto") -> list[Any]:
+        """
+        Load all records of a complete JSON Lines text.
+
+        Args:
+            text (str): The complete model output.
+            decoder (Literal["auto", "orjson", "json", "json5"]): The decoder passed to JSONLoader.loads().
+
+        Returns:
+            list[Any]: The loaded records, lines that are not valid records are skipped.
+        """
+        parser = StreamingJSONLinesParser(decoder=decoder)
+        records = [parser._load_line(line) for line in text.split("\n")]
+        return [record for record in records if record is not _INVALID]
+
+    def _load_line(self, line: str) -> Any:
+        line = line.strip()
+        if not line.startswith("{"):
+            return _INVALID
+        try:
+            return JSONLoader.loads(line, decoder=self.decoder)
+        except ValueError:
+            self.invalid_lines.append(line)
+            return _INVALID
+
+    def _emit(self, lines: list[str]) -> list[StreamingData]:
+        events = []
+        for line in lines:
+            record = self._load_line(line)
+            if record is _INVALID:
+                continue
+            path = f"[{ self.record_count }]"
+            self.record_count += 1
+            if self.subscribed_paths is not None and not ({path, "[*]"} & self.subscribed_paths):
+                continue
+            events.append(
+                StreamingData(
+                    path=path,
+                    value=record,
+                    delta=None,
+                    is_complete=True,
+                    event_type="done",
+                    full_data=None,
+                )
+            )
+        return events
+
+    def parse_chunk_sync(self, chunk: str) -> list[StreamingData]:
+        """
+        Parse a new chunk of the streamed output.
+
+        Args:
+            chunk (str): The new chunk.
+
+        Returns:
+            list[StreamingData]: "done" events of the records completed by this chunk.
+        """
+        self.buffer += chunk
+        if "\n" not in chunk:
+            return []
+        *lines, self.buffer = self.buffer.split("\n")
+        return self._emit(lines)
+
+    def finalize_sync(self) -> list[StreamingData]:
+        """
+        Parse the last line at the end of the stream.
+
+        Returns:
+            list[StreamingData]: The "done" event of the last record, if the output did not end with a newline.
+        """
+        lines = [self.buffer]
+        self.buffer = ""
+        return self._emit(lines)
@@ -0,0 +1,221 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+from typing import Any, Mapping
+
+_COMMENT_PATTERN = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+class StreamingJSONLocator:
+    """
+    Incremental counterpart of DataLocator.locate_output_json() for streamed model output.
+
+    The locator scans each new chunk only once, remembering where the current JSON block starts, its nesting
+    depth and its string / comment state. The block matching the output schema is chosen once, as soon as
+    its first key is read: an object whose first key is in the output schema. If the output schema is not a
+    dict, the first block is chosen. If no block matches, finish() falls back to the last block, as
+    DataLocator.locate_output_json() does.
+
+    feed() and finish() return slices of the chosen block that have not been returned yet, so they can be
+    fed to StreamingJSONDecoder directly.
+
+    Example:
+        >>> locator = StreamingJSONLocator({"name": (str,)})
+        >>> locator.feed('Example: {"id": 1}. Result: {"na')
+        ''
+        >>> locator.feed('me": "Alice"} Done.')
+        '{"name": "Alice"}'
+    """
+
+    def __init__(self, output_prompt_dict: Any = None):
+        self.output_prompt_dict = output_prompt_dict
+        self.reset()
+
+    def reset(self):
+        self.text = ""
+        self._pos = 0
+        self._in_block = False
+        self._block_start = -1
+        self._depth = 0
+        self._quote = None  # '"' or '"""' when inside a string
+        self._escape = False
+        self._comment = None  # "//" or "/*" when inside a comment
+        self._key_checked = False
+        self._last_block: list[int] | None = None  # [start, end] of the latest block, end is -1 while open
+        self._selected_start = -1
+        self._selected_end = -1
+        self._sent = 0
+
+    @property
+    def is_selected(self) -> bool:
+        return self._selected_start >= 0
+
+    def feed(self, chunk: str) -> str:
+        """
+        Extend the locator state with a new chunk.
+
+        Args:
+            chunk (str): The new chunk of the streamed text.
+
+        Returns:
+            str: The new text of the chosen JSON block, empty if no block is chosen yet.
+        """
+        self.text += chunk
+        self._scan(final=False)
+        return self._take()
+
+    def finish(self) -> str:
+        """
+        Scan the rest of the text at the end of the stream and fall back to the last block if no block
+        matched the output schema.
+
+        Returns:
+            str: The rest of the chosen JSON block.
+        """
+        self._scan(final=True)
+        if not self.is_selected and self._last_block is not None:
+            start, end = self._last_block
+            self._selected_start = self._sent = start
+            self._selected_end = end if end >= 0 else len(self.text)
+        return self._take()
+
+    def _take(self) -> str:
+        if not self.is_selected:
+            return ""
+        end = self._selected_end if self._selected_end >= 0 else self._pos
+        delta = self.text[self._sent : end]
+        self._discard(end)
+        return delta
+
+    def _discard(self, offset: int):
+        # Text before the returned slice is never needed again, drop it to keep memory bounded
+        self.text = self.text[offset:]
+        self._pos -= offset
+        self._sent = self._selected_start = 0
+        self._block_start -= offset
+        if self._selected_end >= 0:
+            self._selected_end -= offset
+        if self._last_block is not None:
+            start, end = self._last_block
+            self._last_block = [start - offset, end - offset if end >= 0 else -1]
+
+    def _needs_more(self, index: int, token: str, final: bool) -> bool:
+        # The text left is a proper prefix of the token, wait for the next chunk to decide
+        rest = self.text[index:]
+        return not final and len(rest) < len(token) and token.startswith(rest)
+
+    def _select(self):
+        self._selected_start = self._sent = self._block_start
+
+    def _check_first_key(self, index: int):
+        self._key_checked = True
+        if self.is_selected:
+            return
+        key = _COMMENT_PATTERN.sub("", self.text[self._block_start + 1 : index]).strip().strip("\"'")
+        if key in self.output_prompt_dict:
+            self._select()
+
+    def _scan(self, *, final: bool):
+        text = self.text
+        length = len(text)
+        i = self._pos
+        while i < length and self._selected_end < 0:
+            char = text[i]
+            if not self._in_block:
+                if char == "\\":
+                    if i + 1 >= length and not final:
+                        break
+                    i += 2
+                    continue
+                if char == "[":
+                    if self._needs_more(i, "[OUTPUT]", final):
+                        break
+                    if text.startswith("[OUTPUT]", i):
+                        i += 8
+                        continue
+                if char == "[" or char == "{":
+                    self._in_block = True
+                    self._block_start = i
+                    self._depth = 1
+                    self._last_block = [i, -1]
+                    if not isinstance(self.output_prompt_dict, Mapping):
+                        self._select()
+                    self._key_checked = char == "["
+                i += 1
+                continue
+
+            if self._comment == "//":
+                if char == "\n":
+                    self._comment = None
+                i += 1
+                continue
+            if self._comment == "/*":
+                if char == "*":
+                    if self._needs_more(i, "*/", final):
+                        break
+                    if text.startswith("*/", i):
+                        self._comment = None
+                        i += 2
+                        continue
+                i += 1
+                continue
+            if self._quote is not None:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif self._quote == '"""':
+                    if char == '"':
+                        if self._needs_more(i, '"""', final):
+                            break
+                        if text.startswith('"""', i):
+                            self._quote = None
+                            i += 3
+                            continue
+                elif char == self._quote:
+                    self._quote = None
+                i += 1
+                continue
+
+            if char == '"':
+                if self._needs_more(i, '"""', final):
+                    break
+                if text.startswith('"""', i):
+                    self._quote = '"""'
+                    i += 3
+                    continue
+                self._quote = '"'
+            elif char == "/":
+                if i + 1 >= length and not final:
+                    break
+                if i + 1 < length and text[i + 1] in "/*":
+                    self._comment = "/" + text[i + 1]
+                    i += 2
+                    continue
+            elif char == "[" or char == "{":
+                self._depth += 1
+            elif char == "]" or char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._in_block = False
+                    if self._last_block is not None:
+                        self._last_block[1] = i + 1
+                    if self.is_selected:
+                        self._selected_end = i + 1
+            elif char == ":" and self._depth == 1 and not self._key_checked:
+                self._check_first_key(i)
+            i += 1
+        self._pos = i
@@ -12,15 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import json5
-from typing import Any, Dict, AsyncGenerator, List
-import copy
+from typing import Any, Dict, AsyncGenerator, Generator, Iterable, List
 
-from agently.utils import DataLocator, DataPathBuilder, StreamingJSONCompleter
+from agently.utils import DataPathBuilder, StreamingJSONDecoder, StreamingJSONLocator
 from agently.types.data import StreamingData
 
 
+class ReleasedItem:
+    """
+    Placeholder of an array item released by StreamingJSONParser(release_completed_items=True).
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<released>"
+
+
 class StreamingJSONParser:
     """
     AsyncStreamingJSONParser parses streamed JSON data chunk by chunk asynchronously, maintaining parsing state and emitting
@@ -32,30 +40,61 @@ class StreamingJSONParser:
 
     Attributes:
         schema (Dict[str, Any]): The schema describing the expected JSON structure.
+        subscribed_paths (set[str] | None): The dot-style paths or wildcard paths to emit events for, None for all paths.
+        release_completed_items (bool): Whether completed array items are released after their "done" event.
     """
 
-    def __init__(self, schema: Dict[str, Any]):
+    RELEASED_ITEM = ReleasedItem()
+
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        *,
+        paths: Iterable[str] | None = None,
+        release_completed_items: bool = False,
+    ):
         """
         Initialize an AsyncStreamingJSONParser instance.
 
         Args:
             schema (Dict[str, Any]): The schema dict describing the expected JSON structure.
+            paths (Iterable[str] | None): Dot-style paths or wildcard paths (e.g. 'items[*].title') to subscribe.
+                Events are only built for subscribed paths while completion is still tracked for every path.
+                Subscribe all paths if None.
+            release_completed_items (bool): Bounded-memory mode for very large arrays. Once an array item
+                (outside of another array item) has been marked complete and its "done" event has been built,
+                it is replaced by StreamingJSONParser.RELEASED_ITEM in the retained data, so index counting
+                still works, and its tracked state is dropped. Later `full_data` and the "done" event of the
+                array itself only hold placeholders for released items.
         """
         self.schema = schema
-        self.completer = StreamingJSONCompleter()
+        self.subscribed_paths = set(paths) if paths is not None else None
+        self.release_completed_items = release_completed_items
+        self.locator = StreamingJSONLocator(schema)
+        self.decoder = StreamingJSONDecoder()
         self.previous_data = {}
         self.current_data = {}
         self.field_completion_status = set()  # Tracks completed field paths
         self.string_values = {}  # Tracks current string values for fields
         self.last_complete_structure = {}  # Last complete structure for completion checks
+        # Seen but not complete paths -> [depth, value, position key], in document order
+        self._pending_paths: dict[str, list] = {}
+        self._open_paths: list[str] = []  # Paths of the containers still open in the decoder
+        self._open_container_copies: dict[str, Any] = {}  # Snapshot copies of the open containers
+        self._snapshot_taken = False  # Whether current_data is up to date with the latest chunk
+        self._open_keys: list[tuple] = []  # Position keys of the containers still open in the decoder
 
         # Get the expected field parsing order and all possible paths
         self.expected_field_order = DataPathBuilder.extract_parsing_key_orders(schema, style="dot")
         self.all_possible_paths = DataPathBuilder.extract_possible_paths(schema, style="dot")
+        self._schema_index = self._build_schema_index()  # Wildcard path -> schema ordinal
+        self._unknown_path_count = 0
+        self._frontier: tuple = ()  # Furthest position key reached so far, never moves backwards
+        self._latest_key: tuple = ()  # Position key of the latest path reported by the decoder
 
         self.current_parsing_position = 0  # Current position in parsing order
 
-    async def _get_value_at_path(self, data: dict, path_keys: List[str | int]) -> Any:
+    def _get_value_at_path(self, data: dict, path_keys: List[str | int]) -> Any:
         """
         Retrieve the value at the specified path from a nested dictionary/list structure.
         Args:
@@ -77,7 +116,7 @@ class StreamingJSONParser:
                 return None
         return current
 
-    async def _set_value_at_path(self, data: dict, path_keys: List[str | int], value: Any):
+    def _set_value_at_path(self, data: dict, path_keys: List[str | int], value: Any):
         """
         Set the value at the specified path in a nested dictionary/list structure.
         Args:
@@ -113,7 +152,7 @@ class StreamingJSONParser:
             if isinstance(current, dict):
                 current[final_key] = value
 
-    async def _parse_path_keys(self, path: str) -> List[str | int]:
+    def _parse_path_keys(self, path: str) -> List[str | int]:
         """
         Parse a dot-style path string into a list of keys and indices.
         Args:
@@ -145,242 +184,250 @@ class StreamingJSONParser:
 
         return keys
 
-    async def _get_current_parsing_paths(self) -> set[str]:
+    def _build_schema_index(self) -> dict[str, int]:
         """
-        Get the set of all currently parsed paths in the current_data structure.
+        Compile the expected field order into a lookup table from wildcard dot path to ordinal.
         Returns:
-            set[str]: Set of dot-style paths currently present in current_data.
+            dict[str, int]: The ordinal of each wildcard path (e.g. 'items[*].name') in the schema.
         """
-        current_paths = set()
-
-        async def collect_paths(data: Any, path_keys: List[str | int] = []):
-            path = DataPathBuilder.build_dot_path(path_keys)
-            if path:
-                current_paths.add(path)
-
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    await collect_paths(value, path_keys + [key])
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    await collect_paths(item, path_keys + [i])
+        return {path: ordinal for ordinal, path in enumerate(self.expected_field_order)}
 
-        await collect_paths(self.current_data)
-        return current_paths
+    def _build_position_key(self, path: str, parent_key: tuple) -> tuple:
+        """
+        Build the position key of a path from the key of its parent. A position key holds one
+        (schema ordinal, array index) pair per path segment, so comparing two keys orders the paths
+        as the schema expects them to be streamed: siblings by schema ordinal, array items by index
+        and parents before their children. Fields unknown to the schema are ordered after the known
+        ones, in the order they appear.
+        Args:
+            path (str): The dot-style path (e.g. 'items[2].name').
+            parent_key (tuple): The position key of the parent path.
+        Returns:
+            tuple: The position key of the path.
+        """
+        wildcard_path, indexes = StreamingData._process_path(path)
+        ordinal = self._schema_index.get(wildcard_path)
+        if ordinal is None:
+            ordinal = len(self._schema_index) + self._unknown_path_count
+            self._unknown_path_count += 1
+        index = indexes[-1] if path.endswith("]") else 0
+        return parent_key + ((ordinal, index),)
+
+    @staticmethod
+    def _is_within(key: tuple, ancestor_key: tuple) -> bool:
+        return key[: len(ancestor_key)] == ancestor_key
+
+    def _is_path_before(self, key: tuple, other_key: tuple) -> bool:
+        """
+        Determine if a path comes before another one and is not one of its ancestors, i.e. the
+        path can not change anymore once the other one is being parsed.
+        Args:
+            key (tuple): The position key of the first path.
+            other_key (tuple): The position key of the second path.
+        Returns:
+            bool: True if the first path is before the second one, else False.
+        """
+        return key < other_key and not self._is_within(other_key, key)
 
-    async def _should_mark_field_complete(self, path: str, current_value: Any, previous_value: Any) -> bool:
+    def _should_mark_field_complete(self, path: str, value: Any, key: tuple) -> bool:
         """
         Determine whether a field/path should be marked as complete.
         Args:
             path (str): The field path.
-            current_value (Any): The current value at this path.
-            previous_value (Any): The previous value at this path.
+            value (Any): The current value at this path, unchanged in the latest chunk.
+            key (tuple): The position key of the path.
         Returns:
             bool: True if the field should be marked as complete, False otherwise.
         """
-        if path in self.field_completion_status:
+        if path in self.field_completion_status or value is None:
             return False
+        # The completion frontier has moved past this path, and the path is not the one being
+        # streamed right now (which may happen when fields are streamed out of schema order)
+        return self._is_path_before(key, self._frontier) and not self._is_within(self._latest_key, key)
 
-        # Get all paths currently present in parsing
-        current_parsing_paths = await self._get_current_parsing_paths()
-
-        # Core logic: check the furthest path currently being parsed
-        # If this path is before the furthest and value is stable, can mark as complete
-        furthest_parsing_path = await self._get_furthest_parsing_path(current_parsing_paths)
-
-        if furthest_parsing_path and await self._is_path_before(path, furthest_parsing_path):
-            # This path is before the furthest one and value is stable
-            if current_value == previous_value and current_value is not None:
-                return True
-
-        # Special case: leaf fields with stable value and newer paths
-        if not isinstance(current_value, (dict, list)) and current_value is not None:
-            for parsing_path in current_parsing_paths:
-                if await self._is_path_before(path, parsing_path):
-                    if current_value == previous_value:
-                        return True
-                    break
-
-        return False
-
-    async def _get_furthest_parsing_path(self, current_parsing_paths: set[str]) -> str | None:
+    def _track_changes(self, changes: List[list]) -> set[str]:
         """
-        Get the furthest (most advanced) path currently being parsed, according to expected order.
+        Replay the decoder changes of the latest chunk to register newly seen paths and collect the
+        dirty paths, i.e. every path whose value changed in this chunk together with its ancestors.
         Args:
-            current_parsing_paths (set[str]): Set of paths currently present in the data.
+            changes (List[list]): Changes returned by StreamingJSONDecoder.feed() or finish().
         Returns:
-            Optional[str]: The furthest path, or None if not found.
-        """
-        if not current_parsing_paths:
-            return None
-
-        # Find the last path being parsed according to expected order
-        furthest_path = None
-        furthest_index = -1
-
-        for path in current_parsing_paths:
-            try:
-                index = self.expected_field_order.index(path)
-                if index > furthest_index:
-                    furthest_index = index
-                    furthest_path = path
-            except ValueError:
-                # Path not in expected order (likely dynamic array)
+            set[str]: The dirty paths of the latest chunk.
+        """
+        dirty_paths = set()
+        for change in changes:
+            kind = change[0]
+            if kind == "reset":
+                self._pending_paths.clear()
+                self._open_paths.clear()
+                self._open_keys.clear()
+                self._frontier = self._latest_key = ()
+                dirty_paths.clear()
                 continue
-
-        return furthest_path
-
-    async def _is_path_before(self, path1: str, path2: str) -> bool:
+            path = change[1]
+            if kind == "close":
+                if self._open_paths and self._open_paths[-1] == path:
+                    self._open_paths.pop()
+                    self._open_keys.pop()
+                continue
+            # Ancestors are dirty too, stop at the first one already marked in this chunk
+            for open_path in reversed(self._open_paths):
+                if open_path in dirty_paths:
+                    break
+                dirty_paths.add(open_path)
+            dirty_paths.add(path)
+            pending = self._pending_paths.get(path)
+            if pending is not None:
+                pending[1] = change[3] if kind == "string" else change[2]
+                key = pending[2]
+            else:
+                key = self._build_position_key(path, self._open_keys[-1]) if path else ()
+                if path and path not in self.field_completion_status:
+                    value = change[3] if kind == "string" else change[2]
+                    self._pending_paths[path] = [len(self._open_paths), value, key]
+            # Advance the monotonic completion frontier
+            self._latest_key = key
+            if key > self._frontier:
+                self._frontier = key
+            if kind == "open":
+                self._open_paths.append(path)
+                self._open_keys.append(key)
+        return dirty_paths
+
+    def _take_snapshot(self):
+        """
+        Refresh current_data with a snapshot that later chunks will not change. Only the chain of
+        containers still open in the decoder is copied, everything else is shared with the previous
+        snapshot. The snapshot is taken at most once per chunk and only when an event needs it.
+        """
+        if self._snapshot_taken:
+            return
+        open_containers = self.decoder.copy_open_containers()
+        self.previous_data = self.current_data
+        self.current_data = open_containers[0] if open_containers else self.decoder.value
+        self._open_container_copies = dict(zip(self._open_paths, open_containers))
+        self._snapshot_taken = True
+
+    def _is_subscribed(self, path: str) -> bool:
         """
-        Determine if path1 comes before path2 in the expected field order.
+        Check if events should be built for a path.
         Args:
-            path1 (str): First path.
-            path2 (str): Second path.
+            path (str): The dot-style path.
         Returns:
-            bool: True if path1 is before path2, else False.
+            bool: True if the path or its wildcard path is subscribed.
         """
-        if not path2:
-            return False
-
-        try:
-            index1 = self.expected_field_order.index(path1)
-            index2 = self.expected_field_order.index(path2)
-            return index1 < index2
-        except ValueError:
-            # special case: array path
-            return await self._is_array_path_before(path1, path2)
+        if self.subscribed_paths is None or path in self.subscribed_paths:
+            return True
+        return StreamingData._process_path(path)[0] in self.subscribed_paths
 
-    async def _is_array_path_before(self, path1: str, path2: str) -> bool:
+    def _iter_pending_paths(self):
         """
-        Compare two array-type paths for order.
+        Iterate over the paths that are not complete yet, children before their parents in document order.
+        Yields:
+            tuple[str, Any, tuple]: The path, its current value and its position key.
+        """
+        stack = []
+        for path, (depth, value, key) in list(self._pending_paths.items()):
+            while stack and stack[-1][3] >= depth:
+                yield stack.pop()[:3]
+            stack.append((path, value, key, depth))
+        while stack:
+            yield stack.pop()[:3]
+
+    def _mark_complete(self, path: str, value: Any) -> StreamingData | None:
+        self.field_completion_status.add(path)
+        self._pending_paths.pop(path, None)
+        event = None
+        if self._is_subscribed(path):
+            self._take_snapshot()
+            event = StreamingData(
+                path=path,
+                value=self._open_container_copies.get(path, value),
+                delta=None,
+                is_complete=True,
+                event_type="done",
+                full_data=self.current_data,  # Pass the full current_data here
+            )
+        if self.release_completed_items and path.endswith("]"):
+            self._release_item(path)
+        return event
+
+    def _release_item(self, path: str):
+        """
+        Replace a completed array item with the placeholder and forget the paths inside it.
+        Items inside another array item are released together with the outermost item.
         Args:
-            path1 (str): First path.
-            path2 (str): Second path.
-        Returns:
-            bool: True if path1 is considered before path2.
+            path (str): The dot-style path of the array item (e.g. 'items[3]').
         """
-        # Simple string/length-based comparison; can be improved for more complex cases
-        return len(path1) < len(path2) or path1 < path2
-
-    async def _compare_and_generate_events(self) -> AsyncGenerator[StreamingData, None]:
+        _, indexes = StreamingData._process_path(path)
+        if len(indexes) != 1:
+            return
+        parent = self._pending_paths.get(path[: path.rindex("[")])
+        if parent is None or not isinstance(parent[1], list):
+            return
+        parent[1][indexes[0]] = self.RELEASED_ITEM
+        self.field_completion_status = {
+            completed_path
+            for completed_path in self.field_completion_status
+            if not (completed_path == path or completed_path.startswith((f"{ path }.", f"{ path }[")))
+        }
+
+    def _generate_delta_events(self, changes: List[list]) -> Generator[StreamingData, None, None]:
         """
-        Compare the current and previous data, and yield StreamingData events for
-        incremental ("delta") updates and completions ("done").
+        Yield StreamingData "delta" events straight from the token-level changes reported by the decoder.
+        Args:
+            changes (List[list]): Changes returned by StreamingJSONDecoder.feed() or finish().
         Yields:
-            StreamingData: The event for each updated or completed field.
+            StreamingData: The delta event for each updated string or completed primitive token.
         """
-
-        async def traverse_and_compare(current_data: Any, previous_data: Any, path_keys: List[str | int] = []):
-            path = DataPathBuilder.build_dot_path(path_keys)
-
-            # Handle incremental updates for string fields
-            if isinstance(current_data, str):
-                previous_str = previous_data if isinstance(previous_data, str) else ""
-
-                # Emit delta if changed and computable
-                if current_data != previous_str:
-                    # Prefer suffix delta if previous_str is a prefix, else full current_data as delta
-                    if previous_str and current_data.startswith(previous_str):
-                        delta = current_data[len(previous_str) :]
-                    else:
-                        delta = current_data if previous_str == "" else current_data
-                    if delta:
+        for change in changes:
+            match change[0]:
+                case "string":
+                    _, path, delta, value = change
+                    if delta and self._is_subscribed(path):
+                        self._take_snapshot()
                         yield StreamingData(
                             path=path,
-                            value=current_data,
+                            value=value,
                             delta=delta,
                             is_complete=False,
                             event_type="delta",
                             full_data=self.current_data,  # Pass the full current_data here
                         )
-                        self.string_values[path] = current_data
-
-                # Check if string field should be immediately marked complete
-                if path and await self._should_mark_field_complete(path, current_data, previous_data):
-                    self.field_completion_status.add(path)
-                    yield StreamingData(
-                        path=path,
-                        value=current_data,
-                        delta=None,
-                        is_complete=True,
-                        event_type="done",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
-
-            # Handle primitive (non-string) types
-            elif not isinstance(current_data, (dict, list)) and current_data is not None:
-                # Emit delta if value changed and previous_data exists
-                if current_data != previous_data:
-                    yield StreamingData(
-                        path=path,
-                        value=current_data,
-                        delta=current_data,
-                        is_complete=False,
-                        event_type="delta",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
-                # Check if primitive field should be immediately marked complete
-                if path and await self._should_mark_field_complete(path, current_data, previous_data):
-                    self.field_completion_status.add(path)
-                    yield StreamingData(
-                        path=path,
-                        value=current_data,
-                        delta=None,
-                        is_complete=True,
-                        event_type="done",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
-
-            # Handle dictionary/object types
-            elif isinstance(current_data, dict):
-                previous_dict = previous_data if isinstance(previous_data, dict) else {}
-
-                # Recursively process subfields
-                for key, value in current_data.items():
-                    child_path_keys = path_keys + [key]
-                    previous_value = previous_dict.get(key)
-                    async for event in traverse_and_compare(value, previous_value, child_path_keys):
-                        yield event
-
-                # Check if object should be marked complete
-                if path and await self._should_mark_field_complete(path, current_data, previous_data):
-                    self.field_completion_status.add(path)
-                    yield StreamingData(
-                        path=path,
-                        value=current_data,
-                        delta=None,
-                        is_complete=True,
-                        event_type="done",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
-
-            # Handle list/array types
-            elif isinstance(current_data, list):
-                previous_list = previous_data if isinstance(previous_data, list) else []
-
-                # Recursively process elements
-                for i, value in enumerate(current_data):
-                    child_path_keys = path_keys + [i]
-                    previous_value = previous_list[i] if i < len(previous_list) else None
-                    async for event in traverse_and_compare(value, previous_value, child_path_keys):
-                        yield event
-
-                # Check if array should be marked complete
-                if path and await self._should_mark_field_complete(path, current_data, previous_data):
-                    self.field_completion_status.add(path)
-                    yield StreamingData(
-                        path=path,
-                        value=current_data,
-                        delta=None,
-                        is_complete=True,
-                        event_type="done",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
-
-        async for event in traverse_and_compare(self.current_data, self.previous_data):
-            yield event
+                        if not self.release_completed_items:
+                            self.string_values[path] = value
+                case "scalar":
+                    _, path, value, token = change
+                    if value is not None and self._is_subscribed(path):
+                        self._take_snapshot()
+                        yield StreamingData(
+                            path=path,
+                            value=value,
+                            delta=token,
+                            is_complete=False,
+                            event_type="delta",
+                            full_data=self.current_data,  # Pass the full current_data here
+                        )
+
+    def _generate_done_events(self, dirty_paths: set[str]) -> Generator[StreamingData, None, None]:
+        """
+        Yield StreamingData "done" events for pending fields that did not change in the latest chunk
+        and are behind the completion frontier. Fields changed in this chunk are never stable, so only
+        the remaining pending paths are checked instead of diffing the whole tree.
+        Args:
+            dirty_paths (set[str]): The dirty paths of the latest chunk.
+        Yields:
+            StreamingData: The event for each completed field.
+        """
+        for path, value, key in self._iter_pending_paths():
+            if path in dirty_paths:
+                continue
+            if self._should_mark_field_complete(path, value, key):
+                event = self._mark_complete(path, value)
+                if event is not None:
+                    yield event
 
-    async def _extract_array_index(self, path: str) -> int:
+    def _extract_array_index(self, path: str) -> int:
         """
         Extract the first array index from a dot-style path string.
         Args:
@@ -393,97 +440,79 @@ class StreamingJSONParser:
         match = re.search(r'\[(\d+)\]', path)
         return int(match.group(1)) if match else 0
 
-    async def finalize(self) -> AsyncGenerator[StreamingData, None]:
+    def finalize_sync(self) -> List[StreamingData]:
         """
-        Mark all remaining fields as complete and yield "done" events for every incomplete path.
+        Mark all remaining fields as complete and return "done" events for every incomplete path.
         This should be called at the end of the stream to ensure all fields are finalized.
-        Yields:
-            StreamingData: The completion event for each remaining field.
+        Returns:
+            List[StreamingData]: The remaining delta events and the completion event for each remaining field.
         """
+        changes = self.decoder.feed(self.locator.finish())
+        changes.extend(self.decoder.finish())
+        self._track_changes(changes)
+        self._snapshot_taken = False
+        if self.decoder.value is None:
+            return []
+        self._take_snapshot()
+        events = list(self._generate_delta_events(changes))
+        for path, value, _ in self._iter_pending_paths():
+            event = self._mark_complete(path, value)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def parse_chunk_sync(self, chunk: str) -> List[StreamingData]:
+        """
+        Parse a single chunk of streamed JSON data and return StreamingData events for any
+        detected incremental or completion updates.
+        Args:
+            chunk (str): A chunk of JSON text (possibly incomplete).
+        Returns:
+            List[StreamingData]: The event for each detected update or completion.
+        """
+        changes = self.decoder.feed(self.locator.feed(chunk))
+        dirty_paths = self._track_changes(changes)
+        self._snapshot_taken = False
+        if self.decoder.value is None:
+            # No JSON block located yet; wait for more data.
+            return []
+        events = list(self._generate_delta_events(changes))
+        events.extend(self._generate_done_events(dirty_paths))
+        return events
 
-        async def mark_all_complete(data: Any, path_keys: List[str | int] = []):
-            path = DataPathBuilder.build_dot_path(path_keys)
-
-            if isinstance(data, dict):
-                # Recursively mark all subfields
-                for key, value in data.items():
-                    child_path_keys = path_keys + [key]
-                    async for event in mark_all_complete(value, child_path_keys):
-                        yield event
+    def parse_stream_sync(self, chunk_stream: Iterable[str]) -> Generator[StreamingData, None, None]:
+        """
+        Parse a stream of JSON chunks and yield StreamingData events.
+        Args:
+            chunk_stream (Iterable[str]): An iterable that yields JSON chunks.
+        Yields:
+            StreamingData: The event for each detected update or completion.
+        """
+        for chunk in chunk_stream:
+            yield from self.parse_chunk_sync(chunk)
 
-                # Mark this object field as complete if not already done
-                if path and path not in self.field_completion_status:
-                    self.field_completion_status.add(path)
-                    yield StreamingData(
-                        path=path,
-                        value=data,
-                        delta=None,
-                        is_complete=True,
-                        event_type="done",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
-
-            elif isinstance(data, list):
-                # Recursively mark all elements
-                for i, item in enumerate(data):
-                    child_path_keys = path_keys + [i]
-                    async for event in mark_all_complete(item, child_path_keys):
-                        yield event
-
-                # Mark this array field as complete if not already done
-                if path and path not in self.field_completion_status:
-                    self.field_completion_status.add(path)
-                    yield StreamingData(
-                        path=path,
-                        value=data,
-                        delta=None,
-                        is_complete=True,
-                        event_type="done",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
+        # Finalize at the end of the stream
+        yield from self.finalize_sync()
 
-            else:
-                # Mark primitive field as complete if not already done
-                if path and path not in self.field_completion_status:
-                    self.field_completion_status.add(path)
-                    yield StreamingData(
-                        path=path,
-                        value=data,
-                        delta=None,
-                        is_complete=True,
-                        event_type="done",
-                        full_data=self.current_data,  # Pass the full current_data here
-                    )
-
-        async for event in mark_all_complete(self.current_data):
+    async def finalize(self) -> AsyncGenerator[StreamingData, None]:
+        """
+        Async version of finalize_sync().
+        Yields:
+            StreamingData: The completion event for each remaining field.
+        """
+        for event in self.finalize_sync():
             yield event
 
     async def parse_chunk(self, chunk: str) -> AsyncGenerator[StreamingData, None]:
         """
-        Parse a single chunk of streamed JSON data and yield StreamingData events for any
-        detected incremental or completion updates.
+        Async version of parse_chunk_sync().
         Args:
             chunk (str): A chunk of JSON text (possibly incomplete).
         Yields:
             StreamingData: The event for each detected update or completion.
         """
-        self.completer.append(chunk)
-        completed_json = self.completer.complete()
-        located_json = DataLocator.locate_output_json(
-            completed_json,
-            self.schema,
-        )
-        if located_json:
-            try:
-                parsed_data = json5.loads(located_json)
-                self.previous_data = copy.deepcopy(self.current_data)
-                self.current_data = parsed_data
-
-                async for event in self._compare_and_generate_events():
-                    yield event
-            except (json.JSONDecodeError, ValueError):
-                # JSON parsing failed; wait for more data.
-                pass
+        for event in self.parse_chunk_sync(chunk):
+            yield event
 
     async def parse_stream(self, chunk_stream: AsyncGenerator[str, None]) -> AsyncGenerator[StreamingData, None]:
         """
@@ -494,9 +523,9 @@ class StreamingJSONParser:
             StreamingData: The event for each detected update or completion.
         """
         async for chunk in chunk_stream:
-            async for event in self.parse_chunk(chunk):
+            for event in self.parse_chunk_sync(chunk):
                 yield event
 
         # Finalize at the end of the stream
-        async for event in self.finalize():
+        for event in self.finalize_sync():
             yield event
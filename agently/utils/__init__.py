@@ -22,7 +22,19 @@ from .FunctionShifter import FunctionShifter
 from .DataFormatter import DataFormatter
 from .DataPathBuilder import DataPathBuilder
 from .LazyImport import LazyImport
+from .JSONLoader import JSONLoader
+from .HTTPClientPool import HTTPClientPool
+from .RetryPolicy import RetryPolicy
+from .RateLimiter import RateLimiter
+from .Bulkhead import Bulkhead
+from .HedgePolicy import HedgePolicy
+from .SSEByteDecoder import SSEByteDecoder
 from .DataLocator import DataLocator
+from .ChunkRetention import ChunkRetention
 from .GeneratorConsumer import GeneratorConsumer
 from .StreamingJSONCompleter import StreamingJSONCompleter
+from .StreamingJSONDecoder import StreamingJSONDecoder
+from .StreamingJSONLocator import StreamingJSONLocator
 from .StreamingJSONParser import StreamingJSONParser
+from .StreamingJSONLinesParser import StreamingJSONLinesParser
+from .StreamingChunkCoalescer import StreamingChunkCoalescer
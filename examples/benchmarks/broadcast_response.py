@@ -0,0 +1,163 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark: CPU time per chunk to turn a recorded OpenAI-style SSE byte stream into response events.
+
+Both replay the recorded chunks through an httpx response. "previous" replays the former per-chunk path:
+httpx_sse over the decoded text stream, json.loads(), a dict copy per chunk and content mapping paths split
+on every lookup. "current" runs SSEByteDecoder over the byte stream and the real
+OpenAICompatible.broadcast_response() (JSONLoader with orjson if installed, compiled mapping paths, no copy).
+
+Run: python examples/benchmarks/broadcast_response.py
+"""
+
+import asyncio
+import json
+import time
+
+from typing import Mapping, Sequence
+
+from httpx import Response
+from httpx_sse import EventSource
+
+from agently import Agently
+from agently.builtins.plugins.ModelRequester.OpenAICompatible import OpenAICompatible
+from agently.utils import JSONLoader, Settings, SSEByteDecoder
+
+CHUNKS = 2000
+ROUNDS = 20
+
+
+def record_stream() -> list[bytes]:
+    chunks = []
+    for i in range(CHUNKS):
+        delta = {"role": "assistant", "content": f"token{ i } "} if i == 0 else {"content": f"token{ i } "}
+        message = {
+            "id": "chatcmpl-benchmark",
+            "object": "chat.completion.chunk",
+            "created": 1760000000,
+            "model": "benchmark-model",
+            "system_fingerprint": "fp_benchmark",
+            "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": None}],
+        }
+        chunks.append(f"data: { json.dumps(message) }\n\n".encode())
+    chunks.append(b"data: [DONE]\n\n")
+    return chunks
+
+
+def split_and_locate(data: dict, path: str):
+    # The former DataLocator.locate_path_in_dict() in "dot" style, splitting the path on every call
+    try:
+        result = data
+        for path_part in path.split("."):
+            if "[" in path_part:
+                path_key, path_index = path_part.split("[")
+                if not isinstance(result, Mapping):
+                    return None
+                result = result[path_key]
+                if isinstance(result, str) or not isinstance(result, Sequence):
+                    return None
+                result = result[int(path_index[:-1])]
+            elif isinstance(result, Mapping):
+                result = result[path_part]
+            else:
+                return None
+        return result
+    except Exception:
+        return None
+
+
+def replay(chunks: list[bytes]) -> Response:
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return Response(200, headers={"Content-Type": "text/event-stream"}, content=stream())
+
+
+async def previous(chunks: list[bytes], content_mapping: dict) -> int:
+    async def messages():
+        async for sse in EventSource(replay(chunks)).aiter_sse():
+            yield sse.event, sse.data
+
+    async def broadcast_response():
+        meta, message_record, content_buffer = {}, {}, ""
+        async for _, message in messages():
+            if message == "[DONE]":
+                yield "done", content_buffer
+                continue
+            yield "original_delta", message
+            loaded_message = json.loads(message)
+            message_record = loaded_message.copy()
+            if "id" not in meta:
+                meta["id"] = split_and_locate(loaded_message, content_mapping["id"])
+            if "role" not in meta:
+                meta["role"] = split_and_locate(loaded_message, content_mapping["role"])
+            delta = split_and_locate(loaded_message, content_mapping["delta"])
+            if delta:
+                content_buffer += str(delta)
+                yield "delta", delta
+            for extra_key, extra_path in content_mapping["extra_delta"].items():
+                extra_value = split_and_locate(loaded_message, extra_path)
+                if extra_value:
+                    yield "extra", {extra_key: extra_value}
+        assert message_record
+
+    events = 0
+    async for event, _ in broadcast_response():
+        if event == "original_delta":
+            events += 1
+    return events
+
+
+async def current(chunks: list[bytes], openai_compatible: OpenAICompatible) -> int:
+    async def messages():
+        decoder = SSEByteDecoder()
+        async for chunk in replay(chunks).aiter_bytes():
+            for sse in decoder.feed(chunk):
+                yield sse.event, sse.data
+
+    events = 0
+    async for event, _ in openai_compatible.broadcast_response(messages()):
+        if event == "original_delta":
+            events += 1
+    return events
+
+
+async def main():
+    settings = Settings(name="benchmark-broadcast-response", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    openai_compatible = OpenAICompatible(Agently.create_prompt(), settings)
+    content_mapping = openai_compatible.plugin_settings.get("content_mapping")
+    chunks = record_stream()
+
+    print(f"{ CHUNKS } chunks, best of { ROUNDS } rounds, JSON decoder: { JSONLoader.get_strict_decoder_name() }")
+    results = {}
+    for name, run in (
+        ("previous", lambda: previous(chunks, content_mapping)),
+        ("current", lambda: current(chunks, openai_compatible)),
+    ):
+        best = float("inf")
+        for _ in range(ROUNDS):
+            started = time.process_time()
+            assert await run() == CHUNKS
+            best = min(best, time.process_time() - started)
+        results[name] = best / CHUNKS * 1_000_000
+        print(f"{ name.ljust(8) } { results[name]:8.2f} µs/chunk")
+    print(f"speedup  { results['previous'] / results['current']:8.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,137 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark: 200 concurrent SSE streams through OpenAICompatible over HTTP/1.1 and HTTP/2 ("http2": True).
+
+Both local stand-in servers stream the same chunks with the same token interval. HTTP/1.1 opens one
+connection per in-flight stream (up to "connection_pool.max_connections"), HTTP/2 multiplexes all of them
+over one connection.
+
+Requires: pip install "httpx[http2]"
+Run: python examples/benchmarks/http2_streams.py
+"""
+
+import asyncio
+import json
+import time
+
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import RequestReceived, StreamEnded
+
+from agently import Agently
+from agently.builtins.plugins.ModelRequester.OpenAICompatible import OpenAICompatible
+from agently.utils import Settings
+
+STREAMS = 200
+CHUNKS = 20
+TOKEN_INTERVAL = 0.005
+SSE_CHUNK = "data: " + json.dumps({"choices": [{"delta": {"role": "assistant", "content": "token "}}]}) + "\n\n"
+
+
+async def start_http1_server(connections: list):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode().split("\r\n")[1:]
+                headers = {key.lower(): value for key, value in (line.split(": ", 1) for line in lines if ": " in line)}
+                await reader.readexactly(int(headers.get("content-length", 0)))
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n"
+                )
+                for data in [SSE_CHUNK] * CHUNKS + ["data: [DONE]\n\n"]:
+                    await asyncio.sleep(TOKEN_INTERVAL)
+                    encoded = data.encode()
+                    writer.write(f"{ len(encoded):x}\r\n".encode() + encoded + b"\r\n")
+                    await writer.drain()
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def start_http2_server(connections: list):
+    class H2Protocol(asyncio.Protocol):
+        def connection_made(self, transport):
+            connections.append(transport)
+            self.transport = transport
+            self.conn = H2Connection(config=H2Configuration(client_side=False))
+            self.conn.initiate_connection()
+            transport.write(self.conn.data_to_send())
+
+        def data_received(self, data):
+            for event in self.conn.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    self.conn.send_headers(event.stream_id, [(":status", "200"), ("content-type", "text/event-stream")])
+                elif isinstance(event, StreamEnded):
+                    asyncio.ensure_future(self.stream(event.stream_id))
+            self.transport.write(self.conn.data_to_send())
+
+        async def stream(self, stream_id: int):
+            for data in [SSE_CHUNK] * CHUNKS:
+                await asyncio.sleep(TOKEN_INTERVAL)
+                self.conn.send_data(stream_id, data.encode())
+                self.transport.write(self.conn.data_to_send())
+            self.conn.send_data(stream_id, b"data: [DONE]\n\n", end_stream=True)
+            self.transport.write(self.conn.data_to_send())
+
+    server = await asyncio.get_running_loop().create_server(H2Protocol, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def run(name: str, http2: bool):
+    connections = []
+    server, port = await (start_http2_server if http2 else start_http1_server)(connections)
+    settings = Settings(name=f"benchmark-{ name }", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.base_url", f"http://127.0.0.1:{ port }/v1")
+    if http2:
+        settings.set("plugins.ModelRequester.OpenAICompatible.http2", True)
+        # Cleartext HTTP/2 with prior knowledge, gateways over TLS negotiate it by ALPN
+        settings.set("plugins.ModelRequester.OpenAICompatible.client_options", {"http1": False})
+
+    async def request_stream():
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        response = openai_compatible.broadcast_response(
+            openai_compatible.request_model(openai_compatible.generate_request_data())
+        )
+        return [data async for event, data in response if event == "done"]
+
+    try:
+        started = time.perf_counter()
+        results = await asyncio.gather(*[request_stream() for _ in range(STREAMS)])
+        seconds = time.perf_counter() - started
+    finally:
+        await Agently.async_close()
+        server.close()
+    assert all(result == ["token " * CHUNKS] for result in results)
+    print(f"{ name.ljust(8) } { seconds:8.3f}s  { len(connections):4d} connections")
+
+
+async def main():
+    print(f"{ STREAMS } concurrent streams, { CHUNKS } chunks each, { TOKEN_INTERVAL * 1000:.0f}ms token interval")
+    await run("HTTP/1.1", http2=False)
+    await run("HTTP/2", http2=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
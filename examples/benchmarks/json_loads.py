@@ -0,0 +1,59 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark: loading representative model outputs with each "response.json_decoder" setting.
+
+Run: python examples/benchmarks/json_loads.py
+"""
+
+import json
+import timeit
+
+from agently.utils import JSONLoader
+
+SMALL = json.dumps({"use_tool": True, "tool_command": {"purpose": "search", "tool_name": "search", "tool_kwargs": {}}})
+MEDIUM = json.dumps(
+    {
+        "title": "Weekly report",
+        "items": [
+            {"name": f"Item { i }", "score": i * 1.5, "tags": ["a", "b", "c"], "done": i % 2 == 0} for i in range(50)
+        ],
+    },
+    ensure_ascii=False,
+)
+LARGE = json.dumps({"documents": [{"id": i, "text": "Lorem ipsum dolor sit amet. " * 20} for i in range(20)]})
+# Output that is not strict JSON (comments, single quotes, trailing commas) falls back to json5
+LENIENT = "{title: 'Weekly report', // comment\n items: [{name: 'Item 1', score: 1.5,},],}"
+
+SAMPLES = {"small": SMALL, "medium": MEDIUM, "large": LARGE, "lenient": LENIENT}
+
+
+def main():
+    print(f"strict decoder for 'auto': { JSONLoader.get_strict_decoder_name() }")
+    for sample_name, text in SAMPLES.items():
+        print(f"\n{ sample_name } ({ len(text) } chars)")
+        for decoder in ("json5", "json", "orjson"):
+            try:
+                timer = timeit.Timer(lambda: JSONLoader.loads(text, decoder=decoder))  # type: ignore
+                number, seconds = timer.autorange()
+            except ImportError:
+                print(f"  { decoder.ljust(6) } not installed")
+                continue
+            loads_per_second = f"{ number / seconds:,.0f}"
+            print(f"  { decoder.ljust(6) } { loads_per_second.rjust(12) } loads/sec")
+
+
+if __name__ == "__main__":
+    main()
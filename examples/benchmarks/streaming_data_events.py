@@ -0,0 +1,77 @@
+# Copyright 2023-2025 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark: StreamingData events created per second.
+
+Compares the pydantic model StreamingData used to be (validated on creation, wildcard path computed
+by a model validator) with the current __slots__ class (no validation, wildcard path computed lazily).
+
+Run: python examples/benchmarks/streaming_data_events.py
+"""
+
+import timeit
+
+from typing import Any, Literal
+from pydantic import BaseModel, model_validator
+
+from agently.types.data import StreamingData
+
+
+class PydanticStreamingData(BaseModel):
+    path: str
+    value: Any
+    delta: str | None = None
+    is_complete: bool = False
+    wildcard_path: str | None = None
+    indexes: tuple | None = None
+    event_type: Literal["delta", "done"] = "done"
+    full_data: Any = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def set_wildcard_path(cls, data: dict[str, Any]):
+        data["wildcard_path"], data["indexes"] = StreamingData._process_path(data["path"])
+        return data
+
+
+FULL_DATA = {"items": [{"title": "Hello", "tags": ["a", "b"]}]}
+PATHS = ["items[0].title", "items[0].tags[1]", "items", "title"]
+NUMBER = 200_000
+
+
+def create_events(event_class: type):
+    for i in range(NUMBER):
+        event_class(
+            path=PATHS[i % 4],
+            value="Hello",
+            delta="o",
+            is_complete=False,
+            event_type="delta",
+            full_data=FULL_DATA,
+        )
+
+
+def main():
+    for name, event_class in (
+        ("pydantic BaseModel", PydanticStreamingData),
+        ("__slots__ StreamingData", StreamingData),
+    ):
+        seconds = min(timeit.repeat(lambda: create_events(event_class), number=1, repeat=3))
+        events_per_second = f"{ NUMBER / seconds:,.0f}"
+        print(f"{ name.ljust(24) } { events_per_second.rjust(12) } events/sec")
+
+
+if __name__ == "__main__":
+    main()
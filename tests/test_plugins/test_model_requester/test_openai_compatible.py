@@ -1,6 +1,7 @@
 import pytest
 
 import os
+import json
 from dotenv import find_dotenv, load_dotenv
 
 load_dotenv(find_dotenv())
@@ -42,3 +43,438 @@ async def test_main():
         # in case HTTP 401 Unauthorized when provide invalid API key
         # ERROR logging will be shown in console
         raise e
+
+
+async def start_local_server(connections: list):
+    import asyncio
+    import json
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            lines = head.decode().split("\r\n")[1:]
+            headers = {key.lower(): value for key, value in (line.split(": ", 1) for line in lines if ": " in line)}
+            await reader.readexactly(int(headers.get("content-length", 0)))
+            body = json.dumps({"connection": headers.get("connection")}).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: { len(body) }\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+
+    async def handle_until_closed(reader, writer):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle_until_closed, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_pooled_keep_alive_client():
+    from agently.utils import Settings
+
+    connections = []
+    server, port = await start_local_server(connections)
+    settings = Settings(name="test-pool-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.base_url", f"http://127.0.0.1:{ port }/v1")
+    settings.set("plugins.ModelRequester.OpenAICompatible.stream", False)
+
+    async def request(settings: Settings):
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        request_data = openai_compatible.generate_request_data()
+        return [message async for _, message in openai_compatible.request_model(request_data)]
+
+    try:
+        for _ in range(3):
+            assert await request(settings) == ['{"connection": "keep-alive"}', "[DONE]"]
+        # Requests share one keep-alive connection
+        assert len(connections) == 1
+        assert len(Agently.http_client_pool) == 1
+
+        # "Connection: close" is opt-in
+        settings.set("plugins.ModelRequester.OpenAICompatible.connection_close", True)
+        assert await request(settings) == ['{"connection": "close"}', "[DONE]"]
+
+        # Pooling can be disabled
+        settings.set("plugins.ModelRequester.OpenAICompatible.connection_close", False)
+        settings.set("plugins.ModelRequester.OpenAICompatible.connection_pool.enabled", False)
+        await request(settings)
+        assert len(connections) == 2
+    finally:
+        await Agently.async_close()
+        server.close()
+    assert len(Agently.http_client_pool) == 0
+
+
+async def start_local_h2_server(connections: list):
+    import asyncio
+    from h2.config import H2Configuration
+    from h2.connection import H2Connection
+    from h2.events import RequestReceived, StreamEnded
+
+    class H2Protocol(asyncio.Protocol):
+        def connection_made(self, transport):
+            connections.append(transport)
+            self.transport = transport
+            self.conn = H2Connection(config=H2Configuration(client_side=False))
+            self.conn.initiate_connection()
+            transport.write(self.conn.data_to_send())
+
+        def data_received(self, data):
+            for event in self.conn.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    self.conn.send_headers(event.stream_id, [(":status", "200"), ("content-type", "text/event-stream")])
+                elif isinstance(event, StreamEnded):
+                    chunk = '{"choices": [{"delta": {"role": "assistant", "content": "ok"}}]}'
+                    body = f"data: { chunk }\n\ndata: [DONE]\n\n".encode()
+                    self.conn.send_data(event.stream_id, body, end_stream=True)
+            self.transport.write(self.conn.data_to_send())
+
+    server = await asyncio.get_running_loop().create_server(H2Protocol, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_http2_multiplexes_streams():
+    import asyncio
+    from agently.utils import Settings
+
+    pytest.importorskip("h2")
+    connections = []
+    server, port = await start_local_h2_server(connections)
+    settings = Settings(name="test-http2-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.base_url", f"http://127.0.0.1:{ port }/v1")
+    settings.set("plugins.ModelRequester.OpenAICompatible.http2", True)
+    # The stand-in server speaks cleartext HTTP/2 (prior knowledge), gateways over TLS negotiate it by ALPN
+    settings.set("plugins.ModelRequester.OpenAICompatible.client_options", {"http1": False})
+
+    async def request_stream():
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        request_data = openai_compatible.generate_request_data()
+        response = openai_compatible.broadcast_response(openai_compatible.request_model(request_data))
+        return [data async for event, data in response if event == "done"]
+
+    try:
+        results = await asyncio.gather(*[request_stream() for _ in range(20)])
+        assert results == [["ok"]] * 20
+        # All concurrent streams share one multiplexed connection
+        assert len(connections) == 1
+    finally:
+        await Agently.async_close()
+        server.close()
+
+
+async def start_scripted_server(responses: list[bytes], requests: list):
+    import asyncio
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while responses:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode().split("\r\n")[1:]
+                headers = {key.lower(): value for key, value in (line.split(": ", 1) for line in lines if ": " in line)}
+                await reader.readexactly(int(headers.get("content-length", 0)))
+                requests.append(headers)
+                writer.write(responses.pop(0))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def http_response(status: str, body: str, *, content_type: str = "application/json", headers: str = "") -> bytes:
+    return (
+        f"HTTP/1.1 { status }\r\nContent-Type: { content_type }\r\n{ headers }"
+        f"Content-Length: { len(body.encode()) }\r\n\r\n{ body }"
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_retry_with_backoff_and_retry_after():
+    from agently.utils import Settings
+
+    sse_body = 'data: {"choices": [{"delta": {"content": "ok"}}]}\n\ndata: [DONE]\n\n'
+    responses = [
+        http_response("429 Too Many Requests", '{"error": {}}', headers="Retry-After: 0\r\n"),
+        http_response("503 Service Unavailable", '{"error": {}}'),
+        http_response("200 OK", sse_body, content_type="text/event-stream"),
+    ]
+    requests = []
+    server, port = await start_scripted_server(responses, requests)
+    settings = Settings(name="test-retry-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.base_url", f"http://127.0.0.1:{ port }/v1")
+    settings.set("plugins.ModelRequester.OpenAICompatible.retry.initial_delay", 0.01)
+
+    metrics = []
+
+    def collect_metric(message):
+        metrics.append(message)
+
+    Agently.event_center.register_hook("data", collect_metric, hook_name="test_retry_metrics")
+    try:
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        request_data = openai_compatible.generate_request_data()
+        events = [event async for event in openai_compatible.request_model(request_data)]
+    finally:
+        Agently.event_center.unregister_hook("data", "test_retry_metrics")
+        await Agently.async_close()
+        server.close()
+
+    assert events == [("message", '{"choices": [{"delta": {"content": "ok"}}]}'), ("message", "[DONE]")]
+    assert len(requests) == 3
+    attempts = [message.content for message in metrics if message.meta.get("metric") == "model_request_attempt"]
+    assert [(attempt["attempt"], attempt["outcome"], attempt["reason"]) for attempt in map(json.loads, attempts)] == [
+        (1, "retry", "HTTP 429"),
+        (2, "retry", "HTTP 503"),
+        (3, "success", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_retry_gives_up_on_non_retryable_status():
+    from agently.utils import Settings
+
+    responses = [http_response("400 Bad Request", '{"error": {"message": "bad"}}')]
+    requests = []
+    server, port = await start_scripted_server(responses, requests)
+    settings = Settings(name="test-no-retry-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.base_url", f"http://127.0.0.1:{ port }/v1")
+    try:
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        request_data = openai_compatible.generate_request_data()
+        with pytest.raises(RuntimeError, match="400"):
+            async for _ in openai_compatible.request_model(request_data):
+                pass
+    finally:
+        await Agently.async_close()
+        server.close()
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_metrics():
+    from agently.utils import Settings
+
+    connections = []
+    server, port = await start_local_server(connections)
+    settings = Settings(name="test-rate-limit-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.base_url", f"http://127.0.0.1:{ port }/v1")
+    settings.set("plugins.ModelRequester.OpenAICompatible.stream", False)
+    settings.set("plugins.ModelRequester.OpenAICompatible.rate_limit.requests_per_minute", 600)
+    settings.set("plugins.ModelRequester.OpenAICompatible.request_options", {"max_tokens": 100})
+
+    metrics = []
+
+    def collect_metric(message):
+        if message.meta.get("metric") == "rate_limit_wait":
+            metrics.append(json.loads(message.content))
+
+    Agently.event_center.register_hook("data", collect_metric, hook_name="test_rate_limit_metrics")
+    try:
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        request_data = openai_compatible.generate_request_data()
+        assert [message async for _, message in openai_compatible.request_model(request_data)][-1] == "[DONE]"
+    finally:
+        Agently.event_center.unregister_hook("data", "test_rate_limit_metrics")
+        await Agently.async_close()
+        server.close()
+
+    assert len(metrics) == 1
+    assert metrics[0]["queue_depth"] == 0
+    assert metrics[0]["wait_time"] < 0.1
+    # Prompt size estimate plus max_tokens
+    assert 100 < metrics[0]["estimated_tokens"] < 150
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_caps_concurrent_requests():
+    import asyncio
+    from agently.utils import Settings
+
+    active = []
+    max_active = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode().split("\r\n")[1:]
+        headers = {key.lower(): value for key, value in (line.split(": ", 1) for line in lines if ": " in line)}
+        await reader.readexactly(int(headers.get("content-length", 0)))
+        active.append(writer)
+        max_active.append(len(active))
+        await asyncio.sleep(0.1)
+        active.remove(writer)
+        writer.write(http_response("200 OK", "{}", headers="Connection: close\r\n"))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    settings = Settings(name="test-bulkhead-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.base_url", f"http://127.0.0.1:{ port }/v1")
+    settings.set("plugins.ModelRequester.OpenAICompatible.stream", False)
+    settings.set("plugins.ModelRequester.OpenAICompatible.concurrency.max_in_flight", 2)
+
+    async def request():
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        request_data = openai_compatible.generate_request_data()
+        return [message async for _, message in openai_compatible.request_model(request_data)]
+
+    try:
+        results = await asyncio.gather(*[request() for _ in range(6)])
+        assert results == [["{}", "[DONE]"]] * 6
+        assert max(max_active) == 2
+
+        # Requests waiting longer than the queue timeout fail
+        settings.set("plugins.ModelRequester.OpenAICompatible.concurrency.max_in_flight", 1)
+        settings.set("plugins.ModelRequester.OpenAICompatible.concurrency.queue_timeout", 0.01)
+        outcomes = await asyncio.gather(request(), request(), return_exceptions=True)
+        assert outcomes[0] == ["{}", "[DONE]"]
+        assert isinstance(outcomes[1], RuntimeError) and "Queue Timeout" in str(outcomes[1])
+    finally:
+        await Agently.async_close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_compiled_content_mapping():
+    from agently.utils import Settings
+
+    settings = Settings(name="test-content-mapping-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.content_mapping_style", "slash")
+    settings.set(
+        "plugins.ModelRequester.OpenAICompatible.content_mapping",
+        {
+            "id": "/id",
+            "role": "/choices/0/delta/role",
+            "delta": "/choices/0/delta/text",
+            "done": None,
+            "usage": "/usage",
+            "finish_reason": "/choices/0/finish_reason",
+            "extra_delta": {"reasoning": "/choices/0/delta/reasoning"},
+            "extra_done": None,
+        },
+    )
+    chunks = [
+        {"id": "1", "choices": [{"delta": {"role": "assistant", "reasoning": "hmm"}}]},
+        {"id": "1", "choices": [{"delta": {"text": "Hello"}}]},
+        {"id": "1", "choices": [{"delta": {"text": " world"}, "finish_reason": "stop"}], "usage": {"total": 3}},
+    ]
+
+    async def response_generator():
+        for chunk in chunks:
+            yield "message", json.dumps(chunk)
+        yield "message", "[DONE]"
+
+    openai_compatible = OpenAICompatible(Agently.create_prompt(), settings)
+    events = [item async for item in openai_compatible.broadcast_response(response_generator())]
+    assert [data for event, data in events if event == "delta"] == ["Hello", " world"]
+    assert ("extra", {"reasoning": "hmm"}) in events
+    assert ("done", "Hello world") in events
+    assert ("meta", {"id": "1", "role": "assistant", "finish_reason": "stop", "usage": {"total": 3}}) in events
+
+    # Requesters with the same mapping settings share the compiled mapping
+    other = OpenAICompatible(Agently.create_prompt(), settings)
+    assert other._get_compiled_content_mapping() is openai_compatible._get_compiled_content_mapping()
+
+
+@pytest.mark.asyncio
+async def test_hedging_streams_the_first_answer():
+    import asyncio
+    from agently.utils import Settings
+
+    slow_disconnected = asyncio.Event()
+
+    def create_handler(name: str, first_event_delay: float):
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode().split("\r\n")[1:]
+            headers = {key.lower(): value for key, value in (line.split(": ", 1) for line in lines if ": " in line)}
+            await reader.readexactly(int(headers.get("content-length", 0)))
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            await asyncio.sleep(first_event_delay)
+            try:
+                writer.write(f'data: {{"choices": [{{"delta": {{"content": "{ name }"}}}}]}}\n\ndata: [DONE]\n\n'.encode())
+                await writer.drain()
+                await reader.read()
+            except ConnectionError:
+                pass
+            if name == "slow":
+                slow_disconnected.set()
+            writer.close()
+
+        return handle
+
+    slow_server = await asyncio.start_server(create_handler("slow", 0.5), "127.0.0.1", 0)
+    fast_server = await asyncio.start_server(create_handler("fast", 0), "127.0.0.1", 0)
+    settings = Settings(name="test-hedging-settings", parent=Agently.settings)
+    settings.set("$log.cancel_logs", True)
+    settings.set(
+        "plugins.ModelRequester.OpenAICompatible.base_url",
+        f"http://127.0.0.1:{ slow_server.sockets[0].getsockname()[1] }/v1",
+    )
+    settings.set("plugins.ModelRequester.OpenAICompatible.hedging.enabled", True)
+    settings.set("plugins.ModelRequester.OpenAICompatible.hedging.delay", 0.05)
+    settings.set(
+        "plugins.ModelRequester.OpenAICompatible.hedging.base_url",
+        f"http://127.0.0.1:{ fast_server.sockets[0].getsockname()[1] }/v1",
+    )
+
+    metrics = []
+
+    def collect_metric(message):
+        metrics.append(message)
+
+    async def request():
+        prompt = Agently.create_prompt()
+        prompt.set("input", "ni hao")
+        openai_compatible = OpenAICompatible(prompt, settings)
+        request_data = openai_compatible.generate_request_data()
+        return [message async for _, message in openai_compatible.request_model(request_data)]
+
+    Agently.event_center.register_hook("data", collect_metric, hook_name="test_hedging_metrics")
+    try:
+        assert await request() == ['{"choices": [{"delta": {"content": "fast"}}]}', "[DONE]"]
+        # The losing stream is cancelled and its connection closed
+        await asyncio.wait_for(slow_disconnected.wait(), 1)
+
+        # Without hedge budget the request waits for the first endpoint
+        settings.set("plugins.ModelRequester.OpenAICompatible.hedging.burst", 0)
+        assert await request() == ['{"choices": [{"delta": {"content": "slow"}}]}', "[DONE]"]
+    finally:
+        Agently.event_center.unregister_hook("data", "test_hedging_metrics")
+        await Agently.async_close()
+        slow_server.close()
+        fast_server.close()
+
+    hedges = [message.status for message in metrics if message.meta.get("metric") == "model_request_hedge"]
+    assert hedges == ["HEDGED", "HEDGE_WON", "SUPPRESSED"]
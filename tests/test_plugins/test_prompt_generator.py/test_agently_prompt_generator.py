@@ -358,3 +358,37 @@ def test_strict_role_orders():
         {'role': 'assistant', 'content': '[User continue input]'},
         {'role': 'user', 'content': 'hi'},
     ]
+
+
+def test_to_text_jsonl():
+    Agently.set_settings("plugins.PromptGenerator.name", "AgentlyPromptGenerator")
+    prompt = Prompt(Agently.plugin_manager, Agently.settings)
+    prompt.update(
+        {
+            "input": ["good", "bad"],
+            "output": {
+                "text": (str,),
+                "label": (str, "positive or negative"),
+            },
+            "output_format": "jsonl",
+        }
+    )
+    assert prompt.to_prompt_object().output_format == "jsonl"
+    assert (
+        prompt.to_text()
+        == """[INPUT]:
+- good
+- bad
+
+
+[OUTPUT REQUIREMENT]:
+Data Format: JSON Lines (one compact JSON object per line, no other text)
+Line Structure:
+{
+  "text": <str>,
+  "label": <str> // positive or negative
+}
+
+[OUTPUT]:
+[assistant]:"""
+    )
@@ -0,0 +1,155 @@
+import pytest
+
+from agently.base import plugin_manager, settings
+from agently.core import Prompt
+from agently.builtins.plugins.ResponseParser.AgentlyResponseParser import AgentlyResponseParser
+from agently.utils import Settings
+
+
+def create_response_parser(
+    chunks: list[str],
+    *,
+    output: dict,
+    settings_dict: dict | None = None,
+    output_format: str | None = None,
+    original_delta: bool = False,
+):
+    response_settings = Settings(name="test-response-settings", parent=settings)
+    response_settings.set("$log.cancel_logs", True)
+    response_settings.set("response.streaming_parse_path_style", "dot")
+    for key, value in (settings_dict or {}).items():
+        response_settings.set(key, value)
+    prompt = Prompt(plugin_manager, response_settings)
+    prompt.set("input", "test")
+    prompt.set("output", output)
+    if output_format is not None:
+        prompt.set("output_format", output_format)
+
+    async def response_generator():
+        for chunk in chunks:
+            if original_delta:
+                yield "original_delta", chunk
+            yield "delta", chunk
+        yield "done", "".join(chunks)
+
+    return AgentlyResponseParser("test", "test", prompt, response_generator(), response_settings)
+
+
+OUTPUT = {"title": (str,), "items": [{"name": (str,), "score": (int,)}]}
+CHUNKS = ['{"title": "Lis', 't", "items": [{"name": "a", ', '"score": 1}, {"name": "b', '", "score": 2}]}']
+
+
+@pytest.mark.asyncio
+async def test_streaming_parse_with_subscribed_paths():
+    response_parser = create_response_parser(CHUNKS, output=OUTPUT)
+
+    events = [event async for event in response_parser.get_async_generator(content="instant", paths=["items[*].name"])]
+    assert events
+    assert all(event.wildcard_path == "items[*].name" for event in events)
+    assert [event.value for event in events if event.is_complete] == ["a", "b"]
+
+    # Other consumers still get every event
+    all_events = [event async for event in response_parser.get_async_generator(content="instant")]
+    assert {event.path for event in all_events} >= {"title", "items", "items[0].score", "items[1].name"}
+
+
+def test_streaming_parse_with_subscribed_slash_paths():
+    response_parser = create_response_parser(
+        CHUNKS,
+        output=OUTPUT,
+        settings_dict={"response.streaming_parse_path_style": "slash"},
+    )
+
+    events = list(response_parser.get_generator(content="instant", paths=["/items/[*]/score", "/title"]))
+    assert [(event.path, event.value) for event in events if event.is_complete] == [
+        ("/title", "List"),
+        ("/items/[0]/score", 1),
+        ("/items/[1]/score", 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_parse_with_coalesce():
+    chunks = list('{"title": "List", "items": [{"name": "a", "score": 1}, {"name": "b", "score": 2}]}')
+    expected = [
+        (event.path, event.value, event.is_complete)
+        async for event in create_response_parser(chunks, output=OUTPUT).get_async_generator(content="instant")
+        if event.is_complete
+    ]
+
+    for coalesce in ("boundary", {"min_chars": 8}):
+        response_parser = create_response_parser(
+            chunks,
+            output=OUTPUT,
+            settings_dict={"response.streaming_parse_coalesce": coalesce},
+        )
+        events = [event async for event in response_parser.get_async_generator(content="instant")]
+        assert [(event.path, event.value, event.is_complete) for event in events if event.is_complete] == expected
+        assert "".join(event.delta for event in events if event.path == "title" and event.delta) == "List"
+        assert len(events) < len(chunks)
+
+
+def test_sync_streaming_parse_without_event_loop_per_delta(monkeypatch):
+    from agently.utils import FunctionShifter
+
+    def fail_syncify_async_generator(*args, **kwargs):
+        raise AssertionError("Sync streaming parse should not create an event loop per delta")
+
+    monkeypatch.setattr(FunctionShifter, "syncify_async_generator", fail_syncify_async_generator)
+    response_parser = create_response_parser(CHUNKS, output=OUTPUT)
+    events = list(response_parser.get_generator(content="instant"))
+    assert [(event.path, event.value) for event in events if event.is_complete][-1] == (
+        "items",
+        [{"name": "a", "score": 1}, {"name": "b", "score": 2}],
+    )
+
+
+@pytest.mark.asyncio
+async def test_jsonl_output_format():
+    chunks = ['{"label": "po', 'sitive", "score": 0.9}\n{"label": "neg', 'ative", "score": 0.2}\n{"label"', ': "neutral"}']
+    response_parser = create_response_parser(
+        chunks,
+        output={"label": (str,), "score": (float,)},
+        settings_dict={"response.streaming_parse_path_style": "slash"},
+        output_format="jsonl",
+    )
+
+    events = [event async for event in response_parser.get_async_generator(content="instant")]
+    assert [(event.path, event.value) for event in events] == [
+        ("/[0]", {"label": "positive", "score": 0.9}),
+        ("/[1]", {"label": "negative", "score": 0.2}),
+        ("/[2]", {"label": "neutral"}),
+    ]
+    assert await response_parser.async_get_data() == [event.value for event in events]
+
+
+@pytest.mark.asyncio
+async def test_original_delta_retention():
+    response_parser = create_response_parser(CHUNKS, output=OUTPUT, original_delta=True)
+    assert (await response_parser.async_get_data(content="all"))["original_delta"] == CHUNKS
+
+    response_parser = create_response_parser(
+        CHUNKS,
+        output=OUTPUT,
+        original_delta=True,
+        settings_dict={"response.original_delta_retention": False},
+    )
+    assert (await response_parser.async_get_data(content="all"))["original_delta"] == []
+    assert [data async for data in response_parser.get_async_generator(content="original")] == []
+
+    for settings_dict, expected in (
+        ({"response.original_delta_max_count": 2}, CHUNKS[:2]),
+        ({"response.original_delta_max_bytes": 50}, CHUNKS[:2]),
+    ):
+        response_parser = create_response_parser(
+            CHUNKS,
+            output=OUTPUT,
+            original_delta=True,
+            settings_dict=settings_dict,
+        )
+        # A live subscriber gets every chunk, later ones only replay the retained history
+        live = response_parser.get_async_generator(content="original")
+        assert [data async for data in live] == CHUNKS
+        assert (await response_parser.async_get_data(content="all"))["original_delta"] == expected
+        assert [data async for data in response_parser.get_async_generator(content="original")] == expected
+        assert await response_parser.async_get_text() == "".join(CHUNKS)
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from agently.utils import Bulkhead
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_caps_in_flight_and_admits_by_priority():
+    bulkhead = Bulkhead(2)
+    await bulkhead.acquire()
+    await bulkhead.acquire()
+    assert bulkhead.in_flight == 2
+
+    admitted = []
+
+    async def request(name: str, priority: int):
+        await bulkhead.acquire(priority)
+        admitted.append(name)
+
+    tasks = [
+        asyncio.create_task(request("batch-1", 10)),
+        asyncio.create_task(request("batch-2", 10)),
+        asyncio.create_task(request("chat", 0)),
+    ]
+    await asyncio.sleep(0.01)
+    assert bulkhead.queue_depth == 3 and admitted == []
+
+    bulkhead.release()
+    await asyncio.sleep(0.01)
+    assert admitted == ["chat"]
+    bulkhead.release()
+    bulkhead.release()
+    await asyncio.gather(*tasks)
+    assert admitted == ["chat", "batch-1", "batch-2"]
+    assert bulkhead.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_reserved_slots():
+    bulkhead = Bulkhead(2, reserved_slots=1)
+    await bulkhead.acquire(priority=10)
+    # The last slot is reserved for interactive requests
+    with pytest.raises(TimeoutError):
+        await bulkhead.acquire(priority=10, timeout=0.05)
+    assert bulkhead.queue_depth == 0
+    assert await bulkhead.acquire(priority=0, timeout=0.05) < 0.05
+    assert bulkhead.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_cancelled_waiter_gives_back_its_slot():
+    bulkhead = Bulkhead(1)
+    await bulkhead.acquire()
+    waiting = asyncio.create_task(bulkhead.acquire())
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    bulkhead.release()
+    assert bulkhead.in_flight == 0
+    assert await bulkhead.acquire(timeout=0.05) < 0.05
+
+
+def test_bulkhead_shared():
+    bulkhead = Bulkhead.get_shared("test-endpoint", max_in_flight=2)
+    assert Bulkhead.get_shared("test-endpoint", max_in_flight=3) is bulkhead
+    assert bulkhead.max_in_flight == 3
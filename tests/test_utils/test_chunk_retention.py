@@ -0,0 +1,21 @@
+from agently.utils import ChunkRetention
+
+
+def test_keep_all_or_none():
+    assert all(ChunkRetention().keep(chunk) for chunk in ["a", "b", "c"])
+    retention = ChunkRetention(False)
+    assert not any(retention.keep(chunk) for chunk in ["a", "b", "c"])
+    assert retention.dropped == 3
+
+
+def test_max_count():
+    retention = ChunkRetention(max_count=2)
+    assert [retention.keep(chunk) for chunk in ["a", "b", "c", "d"]] == [True, True, False, False]
+    assert (retention.count, retention.dropped) == (2, 2)
+
+
+def test_max_bytes_keeps_a_prefix():
+    retention = ChunkRetention(max_bytes=4)
+    # "你" is 3 UTF-8 bytes, "c" would fit after the cap but only a prefix of the stream is kept
+    assert [retention.keep(chunk) for chunk in ["ab", "你", "c"]] == [True, False, False]
+    assert retention.bytes == 2
@@ -41,3 +41,33 @@ def test_empty_keys():
     assert DataPathBuilder.build_slash_path([]) == ""
     assert DataLocator.locate_path_in_dict(sample_data, "", style="dot") == sample_data
     assert DataLocator.locate_path_in_dict(sample_data, "", style="slash") == sample_data
+
+
+@pytest.mark.parametrize(
+    "path,style",
+    [
+        ("a.b.c[2].d", "dot"),
+        ("a.b.list[1]", "dot"),
+        ("x[1].y", "dot"),
+        ("x[2].y", "dot"),
+        ("a.missing", "dot"),
+        ("a.b.c.d", "dot"),
+        ("", "dot"),
+        ("/a/b/c/2/d", "slash"),
+        ("/x/0/y", "slash"),
+        ("/x/y", "slash"),
+    ],
+)
+def test_compiled_path_matches_locate_path_in_dict(path, style):
+    compiled_path = DataLocator.compile_path(path, style)
+    assert DataLocator.locate_compiled_path(sample_data, compiled_path, default="default") == (
+        DataLocator.locate_path_in_dict(sample_data, path, style, default="default")
+    )
+
+
+def test_compiled_path_steps():
+    assert DataLocator.compile_path("choices[0].delta.content") == ("choices", 0, "delta", "content")
+    assert DataLocator.compile_path("/choices/0/delta", "slash") == ("choices", ("0", 0), "delta")
+    assert DataLocator.compile_path("matrix[1][0]") == ("matrix", 1, 0)
+    assert DataLocator.locate_compiled_path({"0": "key"}, (("0", 0),)) == "key"
+    assert DataLocator.locate_compiled_path({"matrix": [[1], [2]]}, ("matrix", 1, 0)) == 2
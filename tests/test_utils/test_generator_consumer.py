@@ -146,3 +146,18 @@ async def test_generator_consumer_reuse_after_done():
 
     assert collected == [("x", 1), ("x", 2)]
     assert replayed == collected
+
+
+@pytest.mark.asyncio
+async def test_history_filter():
+    async def async_gen():
+        for i in range(5):
+            yield "number", i
+
+    consumer = GeneratorConsumer(async_gen(), history_filter=lambda item: item[1] % 2 == 0)
+    live = [value async for value in consumer.get_async_generator()]
+    replayed = [value async for value in consumer.get_async_generator()]
+
+    assert live == [("number", i) for i in range(5)]
+    assert replayed == [("number", 0), ("number", 2), ("number", 4)]
+    assert await consumer.get_result() == replayed
@@ -0,0 +1,32 @@
+from agently.utils import HedgePolicy
+
+
+def test_fixed_and_adaptive_delay():
+    assert HedgePolicy(delay=0.3).get_delay() == 0.3
+
+    policy = HedgePolicy(initial_delay=2.0, min_samples=10, min_delay=0.05, max_delay=5.0)
+    assert policy.get_delay() == 2.0
+    for i in range(1, 101):
+        policy.record_latency(i / 100)
+    assert policy.get_delay() == 0.95
+
+    policy.configure(max_delay=0.5)
+    assert policy.get_delay() == 0.5
+
+
+def test_hedge_budget():
+    policy = HedgePolicy(max_hedge_ratio=0.5, burst=1)
+    assert policy.try_hedge() is True
+    assert policy.try_hedge() is False
+    policy.record_request()
+    assert policy.try_hedge() is False
+    policy.record_request()
+    assert policy.try_hedge() is True
+    assert (policy.requests, policy.hedged, policy.suppressed) == (2, 2, 2)
+
+
+def test_shared_policy_keeps_samples():
+    policy = HedgePolicy.get_shared("test-hedge-endpoint", min_samples=1)
+    policy.record_latency(0.2)
+    assert HedgePolicy.get_shared("test-hedge-endpoint", min_samples=1, max_delay=1.0) is policy
+    assert policy.get_delay() == 0.2
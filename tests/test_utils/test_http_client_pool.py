@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from agently.utils import HTTPClientPool
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_shares_clients_by_options():
+    pool = HTTPClientPool()
+    client = pool.get_client({"timeout": 10}, base_url="http://a")
+    assert pool.get_client({"timeout": 10}, base_url="http://a") is client
+    assert pool.get_client({"timeout": 20}, base_url="http://a") is not client
+    assert pool.get_client({"timeout": 10}, base_url="http://b") is not client
+    assert len(pool) == 3
+
+    await pool.aclose()
+    assert client.is_closed
+    assert len(pool) == 0
+    assert pool.get_client({"timeout": 10}, base_url="http://a") is not client
+    await pool.aclose()
+
+
+def test_http_client_pool_drops_clients_of_closed_loops():
+    pool = HTTPClientPool()
+
+    async def get_client():
+        return pool.get_client({}, base_url="http://a")
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+    assert len(pool) == 1
@@ -0,0 +1,26 @@
+import json5
+import pytest
+
+from agently.utils import JSONLoader
+
+
+@pytest.mark.parametrize("decoder", ["auto", "orjson", "json", "json5"])
+def test_json_loader_strict_and_lenient(decoder, monkeypatch):
+    if decoder == "orjson":
+        pytest.importorskip("orjson")
+    assert JSONLoader.loads('{"a": [1, 2.5, "x", null, true]}', decoder=decoder) == {"a": [1, 2.5, "x", None, True]}
+    assert JSONLoader.loads("{a: 'x', // comment\n b: [1,],}", decoder=decoder) == {"a": "x", "b": [1]}
+
+
+def test_json_loader_only_falls_back_on_failure(monkeypatch):
+    def fail_loads(*args, **kwargs):
+        raise AssertionError("json5.loads should not be called for strict JSON")
+
+    monkeypatch.setattr(json5, "loads", fail_loads)
+    assert JSONLoader.loads('{"a": 1}') == {"a": 1}
+    assert JSONLoader.loads(b'[1, 2]', decoder="json") == [1, 2]
+
+
+def test_json_loader_invalid_text():
+    with pytest.raises(ValueError):
+        JSONLoader.loads("{a: ")
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from agently.utils import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_requests_per_minute_fifo():
+    # 600 requests per minute: a burst of 600, then one request every 0.1 seconds
+    limiter = RateLimiter(requests_per_minute=600)
+    for _ in range(600):
+        assert await limiter.acquire() < 0.05
+
+    order = []
+
+    async def request(index: int):
+        await limiter.acquire()
+        order.append(index)
+
+    started = time.monotonic()
+    tasks = [asyncio.create_task(request(index)) for index in range(3)]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 3
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2]
+    assert 0.25 < time.monotonic() - started < 1.0
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_tokens_per_minute_and_correction():
+    limiter = RateLimiter(tokens_per_minute=6000)
+    assert await limiter.acquire(tokens=5000) < 0.05
+    # Actual usage was lower, the balance is given back
+    limiter.correct(5000, 1000)
+    assert await limiter.acquire(tokens=5000) < 0.05
+    # Actual usage was higher, the debt delays the next request (100 tokens per second)
+    limiter.correct(5000, 5030)
+    assert 0.2 < await limiter.acquire(tokens=10) < 1.0
+    # Estimations over the limit are capped, so the request can still pass
+    limiter.correct(10, -6000)
+    assert await limiter.acquire(tokens=100000) < 0.05
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_cancelled_waiter_leaves_the_queue():
+    limiter = RateLimiter(requests_per_minute=1)
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert limiter.queue_depth == 1
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert limiter.queue_depth == 0
+
+
+def test_rate_limiter_shared_across_event_loops():
+    limiter = RateLimiter.get_shared(("test", "model"), requests_per_minute=120)
+    assert RateLimiter.get_shared(("test", "model"), requests_per_minute=120) is limiter
+    assert RateLimiter.get_shared(("test", "other"), requests_per_minute=120) is not limiter
+
+    async def burst(count: int):
+        return [await limiter.acquire() for _ in range(count)]
+
+    assert max(asyncio.run(burst(120))) < 0.05
+    # The bucket is empty for the next event loop too: one request every 0.5 seconds
+    assert 0.3 < asyncio.run(burst(1))[0] < 1.0
@@ -0,0 +1,39 @@
+import time
+
+from httpx import ConnectError, ReadTimeout, HTTPStatusError, Request
+
+from agently.utils import RetryPolicy
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(max_attempts=4, initial_delay=1.0, max_delay=3.0, multiplier=2.0, jitter=False)
+    started = time.monotonic()
+    assert [policy.get_delay(attempt, started) for attempt in range(1, 5)] == [1.0, 2.0, 3.0, None]
+
+    jittered = RetryPolicy(initial_delay=1.0, jitter=True)
+    assert all(0 <= jittered.get_delay(1, started) <= 1.0 for _ in range(20))  # type: ignore
+
+    # The reconnection time sent by an SSE server is a lower bound
+    assert policy.get_delay(1, started, min_delay=2.5) == 2.5
+
+
+def test_retry_policy_retry_after_and_deadline():
+    policy = RetryPolicy(jitter=False, deadline=10.0)
+    started = time.monotonic()
+    assert policy.get_delay(1, started, retry_after="7") == 7.0
+    assert policy.get_delay(1, started, retry_after="Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert policy.get_delay(1, started, retry_after="soon") == 0.5
+    # The retry would end after the deadline
+    assert policy.get_delay(1, started, retry_after="11") is None
+    assert policy.get_delay(1, started - 9.9) is None
+
+
+def test_retry_policy_conditions():
+    policy = RetryPolicy.from_settings({"status_codes": [429], "on_read_error": False, "unknown": 1})
+    assert policy.is_retryable_status(429)
+    assert not policy.is_retryable_status(500)
+    request = Request("POST", "http://localhost")
+    assert policy.is_retryable_error(ConnectError("refused", request=request))
+    assert not policy.is_retryable_error(ReadTimeout("timeout", request=request))
+    assert not policy.is_retryable_error(ValueError())
+    assert RetryPolicy.from_settings(None).max_attempts == 3
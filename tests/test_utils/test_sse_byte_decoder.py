@@ -0,0 +1,32 @@
+from agently.utils import SSEByteDecoder
+
+
+def test_split_chunks():
+    decoder = SSEByteDecoder()
+    stream = b'data: {"a": 1}\n\ndata: {"a"' + b': 2}\r\n\r\ndata: [DONE]\n\n'
+    events = []
+    for i in range(0, len(stream), 5):
+        events.extend(decoder.feed(stream[i : i + 5]))
+    events.extend(decoder.flush())
+    assert [event.data for event in events] == ['{"a": 1}', '{"a": 2}', "[DONE]"]
+    assert all(event.event == "message" for event in events)
+
+
+def test_fields_and_comments():
+    decoder = SSEByteDecoder()
+    events = decoder.feed(
+        b": keep-alive\n"
+        b"event: delta\nid: 42\nretry: 3000\ndata: first\ndata:second\n\n"
+        b"data: \xe4\xbd\xa0\xe5\xa5\xbd\n\n"
+    )
+    assert [(event.event, event.data, event.id, event.retry) for event in events] == [
+        ("delta", "first\nsecond", "42", 3000),
+        ("message", "你好", "42", None),
+    ]
+
+
+def test_flush_unterminated_event():
+    decoder = SSEByteDecoder()
+    assert decoder.feed(b"data: last") == []
+    assert [event.data for event in decoder.flush()] == ["last"]
+    assert decoder.flush() == []
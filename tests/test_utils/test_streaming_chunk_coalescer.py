@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from agently.utils import StreamingChunkCoalescer
+
+
+def test_coalescer_disabled():
+    coalescer = StreamingChunkCoalescer()
+    assert coalescer.push("a") == "a"
+    assert coalescer.flush() == ""
+
+
+def test_coalescer_boundary():
+    coalescer = StreamingChunkCoalescer("boundary")
+    released = [coalescer.push(chunk) for chunk in ['{', 'na', 'me', '": "Al', 'ice', '"', '}']]
+    assert released == ['{', None, None, 'name": "Al', None, 'ice"', '}']
+    assert coalescer.flush() == ""
+
+
+def test_coalescer_min_chars_and_latency():
+    coalescer = StreamingChunkCoalescer({"min_chars": 4})
+    assert [coalescer.push(chunk) for chunk in ["ab", "c", "de", "f"]] == [None, None, "abcde", None]
+    assert coalescer.flush() == "f"
+
+    coalescer = StreamingChunkCoalescer({"max_latency_ms": 10})
+    assert coalescer.push("a") is None
+    time.sleep(0.02)
+    assert coalescer.push("b") == "ab"
+
+
+def test_coalescer_invalid_mode():
+    with pytest.raises(ValueError):
+        StreamingChunkCoalescer("sometimes")
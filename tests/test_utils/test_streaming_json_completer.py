@@ -94,3 +94,31 @@ def test_unclosed_array():
 # Test multiple fields streamed in separate fragments to verify incremental parsing.
 def test_multiple_fields_streamed():
     run_case(['{ "a": "abc"', ', "b": [1, 2]', ', "c": {"d": "e" }'], ["a", "b", "c"])
+
+
+# Test that completing after every fragment gives the same result as completing once at the end.
+def test_incremental_complete_matches_one_shot():
+    text = '{"a": "x/y", /* note */ "b": [1, {"c": "\\"q\\""}], // tail\n "d": \'e\''
+    for step in (1, 2, 3, 7):
+        completer = StreamingJSONCompleter()
+        for i in range(0, len(text), step):
+            completer.append(text[i : i + step])
+            completer.complete()
+        one_shot = StreamingJSONCompleter()
+        one_shot.append(text)
+        assert completer.complete() == one_shot.complete()
+        assert json5.loads(completer.complete())["d"] == "e"
+
+
+# Test that complete_suffix only returns the closing text and respects comment markers split across fragments.
+def test_complete_suffix_across_fragments():
+    completer = StreamingJSONCompleter()
+    completer.append('{"a": [1, 2 /')
+    assert completer.complete_suffix() == "]}"
+    completer.append('* open comment *')
+    assert completer.complete_suffix() == "*/]}"
+    completer.append('/ ], "b": "x')
+    assert completer.complete_suffix() == '"}'
+    completer.append('"}')
+    assert completer.complete_suffix() == ""
+    assert json5.loads(completer.complete()) == {"a": [1, 2], "b": "x"}
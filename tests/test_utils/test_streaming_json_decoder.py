@@ -0,0 +1,60 @@
+import json5
+import pytest
+from agently.utils import StreamingJSONDecoder
+
+
+def feed_all(text: str, step: int):
+    decoder = StreamingJSONDecoder()
+    changes = []
+    for i in range(0, len(text), step):
+        changes.extend(decoder.feed(text[i : i + step]))
+    changes.extend(decoder.finish())
+    return decoder, changes
+
+
+@pytest.mark.parametrize("step", [1, 2, 5, 1000])
+def test_decode_json5_in_fragments(step):
+    text = (
+        "Here is the result:\n```json\n"
+        "{name: 'Alice', // user name\n"
+        ' "bio": "line1\\nline2 \\u4e2d\\"q\\"", /* block */'
+        ' "scores": [1, -2.5, 0x10, .5, true, null,], "nested": {"a": [{"b": "c"}]},}'
+        "\n```\nDone."
+    )
+    decoder, _ = feed_all(text, step)
+    assert decoder.is_complete
+    assert decoder.value == json5.loads(text[text.index("{") : text.rindex("}") + 1])
+
+
+@pytest.mark.parametrize("step", [1, 3, 1000])
+def test_string_changes_are_token_level(step):
+    _, changes = feed_all('{"a": "hello world", "b": 12}', step)
+    string_deltas = [change[2] for change in changes if change[0] == "string" and change[1] == "a"]
+    assert "".join(string_deltas) == "hello world"
+    assert ["scalar", "b", 12, "12"] in changes
+    assert ["close", "a"] in changes
+    assert changes[-1] == ["close", ""]
+
+
+def test_value_updated_in_place():
+    decoder = StreamingJSONDecoder()
+    decoder.feed('{"items": [{"title": "Fir')
+    root = decoder.value
+    assert root == {"items": [{"title": "Fir"}]}
+    decoder.feed('st"}, {"title": "Second"}]}')
+    assert decoder.value is root
+    assert root == {"items": [{"title": "First"}, {"title": "Second"}]}
+
+
+def test_skip_invalid_block_and_trailing_text():
+    decoder, changes = feed_all('[OUTPUT]:\n{"a": """multi\n"line" text"""} and {"b": 1}', 2)
+    assert ["reset"] in changes
+    assert decoder.value == {"a": 'multi\n"line" text'}
+
+
+def test_trailing_number_flushed_by_finish():
+    decoder = StreamingJSONDecoder()
+    decoder.feed('{"a": 12')
+    assert decoder.value == {}
+    assert decoder.finish() == [["scalar", "a", 12, "12"], ["close", "a"]]
+    assert decoder.value == {"a": 12}
@@ -0,0 +1,36 @@
+from agently.utils import StreamingJSONLinesParser
+
+
+def test_streaming_json_lines_parser_emits_records_on_newline():
+    parser = StreamingJSONLinesParser()
+    assert parser.parse_chunk_sync('[OUTPUT]\n{"label": "a", "sc') == []
+    events = parser.parse_chunk_sync('ore": 1}\n{"label": "b", "score": 2}\n{"lab')
+    assert [(event.path, event.value) for event in events] == [
+        ("[0]", {"label": "a", "score": 1}),
+        ("[1]", {"label": "b", "score": 2}),
+    ]
+    assert all(event.is_complete and event.event_type == "done" and event.full_data is None for event in events)
+    assert events[1].wildcard_path == "[*]" and events[1].indexes == (1,)
+    # Only the unfinished line is buffered
+    assert parser.buffer == '{"lab'
+
+    events = parser.finalize_sync()
+    assert events == []
+    assert parser.invalid_lines == ['{"lab']
+
+
+def test_streaming_json_lines_parser_last_line_and_subscription():
+    parser = StreamingJSONLinesParser(paths=["[1]"])
+    events = []
+    for chunk in ('```jsonl\n{"id": 1}\n', "\n", "{'id': 2,}\n", '```\n{"id": 3}'):
+        events.extend(parser.parse_chunk_sync(chunk))
+    events.extend(parser.finalize_sync())
+    # json5 is used as fallback, record indexes count unsubscribed records
+    assert [(event.path, event.value) for event in events] == [("[1]", {"id": 2})]
+    assert parser.record_count == 3
+
+
+def test_streaming_json_lines_parser_loads():
+    text = 'Here you are:\n{"id": 1}\r\n{"id": 2}\nnot a record\n{"id": 3}'
+    assert StreamingJSONLinesParser.loads(text) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert StreamingJSONLinesParser.loads("") == []
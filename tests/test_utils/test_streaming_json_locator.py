@@ -0,0 +1,57 @@
+import pytest
+
+from agently.utils import DataLocator, StreamingJSONLocator
+
+SCHEMA = {"name": (str,), "tags": [(str,)]}
+
+
+def feed_by_char(locator: StreamingJSONLocator, text: str) -> tuple[str, str]:
+    streamed = "".join(locator.feed(char) for char in text)
+    return streamed, locator.finish()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('Result: {"name": "Alice", "tags": ["a", "b"]} Done.', '{"name": "Alice", "tags": ["a", "b"]}'),
+        (
+            'Example: {"id": 1, "x": [1, 2]}\n[OUTPUT]:\n```json\n{"name": "B}", "tags": []}\n```',
+            '{"name": "B}", "tags": []}',
+        ),
+        ('{\n  // {comment} "\n  name: """multi\n"line}""", /* } */ tags: []\n}', None),
+        ('Use \\{ and {"text": "\\"}"} then {name: "C"}', '{name: "C"}'),
+    ],
+)
+def test_locator_streams_the_matching_block(text, expected):
+    expected = expected or text
+    streamed, rest = feed_by_char(StreamingJSONLocator(SCHEMA), text)
+    assert rest == ""
+    assert streamed == expected
+
+
+def test_locator_chooses_the_block_only_once():
+    locator = StreamingJSONLocator(SCHEMA)
+    assert locator.feed('{"name": "A"') == '{"name": "A"'
+    assert locator.is_selected
+    assert locator.feed('} and {"name": "B"}') == "}"
+    assert locator.feed("more text") == ""
+    assert locator.finish() == ""
+
+
+def test_locator_falls_back_to_the_last_block():
+    text = 'a: {"id": 1} b: [1, 2] c: {"other": tru'
+    streamed, rest = feed_by_char(StreamingJSONLocator(SCHEMA), text)
+    assert streamed == ""
+    assert rest == '{"other": tru'
+
+    text = 'a: {"id": 1} b: [1, 2]'
+    locator = StreamingJSONLocator(SCHEMA)
+    assert locator.feed(text) == ""
+    assert locator.finish() == DataLocator.locate_output_json(text, SCHEMA) == "[1, 2]"
+
+
+def test_locator_without_dict_schema():
+    locator = StreamingJSONLocator([(str,)])
+    # "[" may start "[OUTPUT]", so it is released with the next chunk
+    assert locator.feed("List: [") == ""
+    assert locator.feed('"a", "b"] [1]') == '["a", "b"]'
@@ -155,3 +155,247 @@ async def test_streaming_json_parser_edge_cases():
     languages_deltas = [e for e in delta_events if e.path.startswith("profile.preferences.languages")]
     assert languages_deltas
     assert events.index(languages_deltas[-1]) < events.index(languages_done)
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_without_reparse(monkeypatch):
+    import json5
+
+    def fail_loads(*args, **kwargs):
+        raise AssertionError("json5.loads should not be called while streaming")
+
+    monkeypatch.setattr(json5, "loads", fail_loads)
+
+    schema = {"title": (str,), "count": (int,), "tags": [(str,)]}
+    text = "Result:\n{title: 'Hello \\'World\\'', // comment\n count: 3, tags: ['a', 'b',],}"
+
+    parser = StreamingJSONParser(schema)
+    events = []
+    for i in range(0, len(text), 3):
+        async for item in parser.parse_chunk(text[i : i + 3]):
+            events.append(item)
+    async for item in parser.finalize():
+        events.append(item)
+
+    title_deltas = [e.delta for e in events if e.path == "title" and e.event_type == "delta"]
+    assert "".join(title_deltas) == "Hello 'World'"
+    assert any(e.path == "count" and e.event_type == "delta" and e.value == 3 and e.delta == "3" for e in events)
+    assert any(e.path == "tags" and e.event_type == "done" and e.value == ["a", "b"] for e in events)
+    assert parser.current_data == {"title": "Hello 'World'", "count": 3, "tags": ["a", "b"]}
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_snapshots_without_deepcopy(monkeypatch):
+    import copy
+
+    def fail_deepcopy(*args, **kwargs):
+        raise AssertionError("copy.deepcopy should not be called while streaming")
+
+    monkeypatch.setattr(copy, "deepcopy", fail_deepcopy)
+
+    schema = {"title": (str,), "items": [{"name": (str,)}]}
+    text = '{"title": "abc", "items": [{"name": "x"}, {"name": "yz"}]}'
+
+    parser = StreamingJSONParser(schema)
+    snapshots = []
+    events = []
+    for i in range(0, len(text), 4):
+        async for item in parser.parse_chunk(text[i : i + 4]):
+            events.append(item)
+            snapshots.append((item.full_data, repr(item.full_data)))
+    async for item in parser.finalize():
+        events.append(item)
+
+    # Earlier snapshots are not changed by later chunks
+    for full_data, dumped in snapshots:
+        assert repr(full_data) == dumped
+    # Closed values are shared between snapshots
+    assert snapshots[-1][0]["items"][0] is parser.current_data["items"][0]
+
+    done_paths = [e.path for e in events if e.event_type == "done"]
+    assert done_paths.count("items[0].name") == 1
+    assert done_paths.index("items[0].name") < done_paths.index("items[0]") < done_paths.index("items")
+    assert done_paths[-1] == "items"
+    assert parser.current_data == {"title": "abc", "items": [{"name": "x"}, {"name": "yz"}]}
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_completion_frontier():
+    schema = {"a": (str,), "items": [{"name": (str,), "tags": [(str,)]}], "b": (int,)}
+    text = '{"b": 1, "a": "x", "items": [{"name": "n0", "tags": ["t"]}, {"name": "n1"}, {"name": "n10"}], "extra": 2}'
+
+    parser = StreamingJSONParser(schema)
+    done_at = {}
+    for i, char in enumerate(text):
+        async for item in parser.parse_chunk(char):
+            if item.event_type == "done":
+                done_at[item.path] = i
+    async for item in parser.finalize():
+        if item.event_type == "done":
+            done_at[item.path] = len(text)
+
+    # Array items are done as soon as the next item starts
+    assert done_at["items[0].name"] == text.index('["t"]')
+    assert done_at["items[0]"] == text.index('{"name": "n1"}')
+    assert done_at["items[1].name"] == done_at["items[1]"] == text.index('{"name": "n10"}')
+    # "b" is streamed before "a" against the schema order, so it waits until the frontier passes it
+    assert done_at["a"] == text.index("[{")
+    assert done_at["b"] > done_at["items[1]"]
+    # Fields unknown to the schema are ordered after the known ones
+    assert done_at["items[2].name"] == done_at["items"] == done_at["b"] == len(text) - 1
+    assert done_at["extra"] == len(text)
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_subscribed_paths():
+    schema = {"title": (str,), "items": [{"title": (str,), "body": (str,)}]}
+    text = '{"title": "T", "items": [{"title": "a", "body": "long body"}, {"title": "b", "body": "more"}]}'
+
+    parser = StreamingJSONParser(schema, paths=["items[*].title", "items"])
+    snapshots = 0
+    copy_open_containers = parser.decoder.copy_open_containers
+
+    def counting_copy_open_containers():
+        nonlocal snapshots
+        snapshots += 1
+        return copy_open_containers()
+
+    parser.decoder.copy_open_containers = counting_copy_open_containers
+
+    events = []
+    for i in range(0, len(text), 2):
+        async for item in parser.parse_chunk(text[i : i + 2]):
+            events.append(item)
+    async for item in parser.finalize():
+        events.append(item)
+
+    assert {e.path for e in events} == {"items[0].title", "items[1].title", "items"}
+    done_events = [(e.path, e.value) for e in events if e.event_type == "done"]
+    assert done_events == [
+        ("items[0].title", "a"),
+        ("items[1].title", "b"),
+        ("items", [{"title": "a", "body": "long body"}, {"title": "b", "body": "more"}]),
+    ]
+    # Completion is still tracked for paths without subscription
+    assert {"title", "items[0].body", "items[0]", "items[1].body"} <= parser.field_completion_status
+    # Chunks without subscribed events do not take snapshots
+    assert snapshots < len(text) // 2
+
+
+def test_streaming_data_lightweight_event():
+    data = StreamingData(path="items[2].tags[0]", value="a", delta="a", event_type="delta")
+    assert not hasattr(data, "__dict__")
+    assert data._wildcard_path is None
+    assert data.indexes == (2, 0)
+    assert data.wildcard_path == "items[*].tags[*]"
+
+    # wildcard_path stays dot-style when path is converted after creation
+    converted = StreamingData(path="items[1].name", value="b")
+    converted.path = "/items/[1]/name"
+    assert converted.wildcard_path == "items[*].name"
+
+    assert data.model_dump() == {
+        "path": "items[2].tags[0]",
+        "value": "a",
+        "delta": "a",
+        "is_complete": False,
+        "wildcard_path": "items[*].tags[*]",
+        "indexes": (2, 0),
+        "event_type": "delta",
+        "full_data": None,
+    }
+    assert data.model_dump(include={"path", "value"}) == {"path": "items[2].tags[0]", "value": "a"}
+    assert data == StreamingData(path="items[2].tags[0]", value="a", delta="a", event_type="delta")
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_skips_example_blocks():
+    schema = {"name": (str,), "tags": [(str,)]}
+    text = 'Format example: {"id": 0, "tags": ["x"]}\nAnswer: {"name": "Alice", "tags": ["a"]}'
+
+    parser = StreamingJSONParser(schema)
+    events = []
+    for i in range(0, len(text), 5):
+        async for item in parser.parse_chunk(text[i : i + 5]):
+            events.append(item)
+    async for item in parser.finalize():
+        events.append(item)
+
+    assert "".join(e.delta for e in events if e.path == "name" and e.delta) == "Alice"
+    assert not any(e.path == "id" for e in events)
+    assert parser.current_data == {"name": "Alice", "tags": ["a"]}
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_sync_core_matches_async():
+    schema = {"title": (str,), "items": [{"name": (str,), "score": (int,)}]}
+    text = '{"title": "Hi", "items": [{"name": "a", "score": 1}, {"name": "b", "score": 22}]}'
+    chunks = [text[i : i + 3] for i in range(0, len(text), 3)]
+
+    async def chunk_stream():
+        for chunk in chunks:
+            yield chunk
+
+    async_events = [event async for event in StreamingJSONParser(schema).parse_stream(chunk_stream())]
+    sync_events = list(StreamingJSONParser(schema).parse_stream_sync(chunks))
+    assert [event.model_dump(exclude={"full_data"}) for event in sync_events] == [
+        event.model_dump(exclude={"full_data"}) for event in async_events
+    ]
+
+    parser = StreamingJSONParser(schema)
+    assert parser.parse_chunk_sync("Answer: ") == []
+    assert isinstance(parser.parse_chunk_sync(text), list)
+    assert parser.finalize_sync()[-1].path == "items"
+
+
+def test_streaming_json_parser_release_completed_items():
+    schema = {"items": [{"id": (int,), "name": (str,)}], "total": (int,)}
+    item_count = 200
+    text = (
+        '{"items": ['
+        + ", ".join(f'{{"id": { i }, "name": "item { i }"}}' for i in range(item_count))
+        + f'], "total": { item_count }}}'
+    )
+
+    parser = StreamingJSONParser(schema, release_completed_items=True)
+    item_dones = {}
+    max_status_size = 0
+    max_text_size = 0
+    for start in range(0, len(text), 7):
+        for event in parser.parse_chunk_sync(text[start : start + 7]):
+            if event.event_type == "done" and event.wildcard_path == "items[*]":
+                item_dones[event.indexes[0]] = event
+        max_status_size = max(max_status_size, len(parser.field_completion_status))
+        max_text_size = max(max_text_size, len(parser.locator.text))
+    events = parser.finalize_sync()
+
+    # Item "done" events still carry the full item, with index counting preserved
+    assert sorted(item_dones) == list(range(item_count))
+    assert item_dones[42].value == {"id": 42, "name": "item 42"}
+    assert item_dones[199].path == "items[199]"
+
+    # Released items are replaced by the placeholder in the retained data
+    assert parser.current_data["items"][0] is StreamingJSONParser.RELEASED_ITEM
+    assert len(parser.current_data["items"]) == item_count
+    assert parser.current_data["total"] == item_count
+    assert any(event.path == "total" and event.event_type == "done" for event in events)
+
+    # Tracked state does not grow with the array
+    assert max_status_size < 10
+    assert max_text_size < 20
+    assert parser.string_values == {}
+
+
+def test_streaming_json_parser_release_completed_items_keeps_nested_items():
+    schema = {"groups": [{"members": [(str,)]}]}
+    parser = StreamingJSONParser(schema, release_completed_items=True)
+    events = []
+    for chunk in ('{"groups": [{"members": ["a", "b"]}, ', '{"members": ["c"', ", "):
+        events.extend(parser.parse_chunk_sync(chunk))
+    group_done = next(event for event in events if event.path == "groups[0]" and event.event_type == "done")
+    # Nested items are released together with the outermost item
+    assert group_done.value == {"members": ["a", "b"]}
+    # Later snapshots hold the placeholder
+    parser.parse_chunk_sync('"d"]}')
+    assert parser.current_data["groups"][0] is StreamingJSONParser.RELEASED_ITEM
+    assert parser.current_data["groups"][1] == {"members": ["c", "d"]}